@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
+import multiprocessing
+
 from root_functions import make_dpi_aware
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     from src.PenningMaatje import start
     make_dpi_aware()
     start()
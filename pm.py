@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 import datetime
 import getopt
+import multiprocessing
 import os
 import sys
 
@@ -21,9 +22,12 @@ summary_type = Summary.AnnualAccountPlus
 template_name = None
 iban = EMPTY
 verbose = False
+incremental = False
+workers = 1
+jobs = 1
 
 usage = ('usage: pm.py -i <inputdir> -o <outputdir> -y <year> -s <summarytype> -t <templatename> -a <iban> -b <build> '
-         '-v  <verbose> -h')
+         '-u <update> -w <workers> -j <jobs> -v  <verbose> -h')
 errorText = Color.RED + "Error:" + Color.NC + " "
 
 
@@ -33,17 +37,20 @@ errorText = Color.RED + "Error:" + Color.NC + " "
 
 
 def main(argv):
-    global input_dir, output_dir, year, build, summary_type, template_name, iban, verbose
+    global input_dir, output_dir, year, build, summary_type, template_name, iban, verbose, incremental, \
+        workers, jobs
 
     try:
         opts, args = getopt.getopt(
-            argv, "bhva:i:o:s:t:y:",
+            argv, "bhuva:i:j:o:s:t:w:y:",
             [
                 "aiban=",
                 "iinputdir=",
+                "jjobs=",
                 "ooutputdir=",
                 "ssummarytype=",
                 "ttemplatename=",
+                "wworkers=",
                 "yyear="
              ])
     except getopt.GetoptError:
@@ -79,6 +86,21 @@ def main(argv):
         elif opt in ("-b", "--build"):
             build = True
 
+        elif opt in ("-u", "--update"):
+            incremental = True
+
+        elif opt in ("-w", "--workers"):
+            workers = arg
+            if not isInt(workers) or int(workers) < 1:
+                exit_program('Parameter -w (workers) is not valid.')
+            workers = int(workers)
+
+        elif opt in ("-j", "--jobs"):
+            jobs = arg
+            if not isInt(jobs) or int(jobs) < 1:
+                exit_program('Parameter -j (jobs) is not valid.')
+            jobs = int(jobs)
+
         elif opt in ("-v", "--verbose"):
             verbose = True
 
@@ -101,8 +123,10 @@ def main(argv):
             year = datetime.datetime.now().year
         template_names = {summary_type: template_name} if template_name else {}
 
-        pmc = PMC(output_dir=output_dir, year=year, build=build, input_dir=input_dir, iban=iban, verbose=verbose)
+        pmc = PMC(output_dir=output_dir, year=year, build=build, input_dir=input_dir, iban=iban, verbose=verbose,
+                  incremental=incremental, workers=workers, jobs=jobs)
         pmc.create_summary(summary_type, year, template_names=template_names)
+        pmc.report_sql_trace()
 
     except GeneralException as e:
         exit_program(e.message)
@@ -124,4 +148,5 @@ def exit_program(error_text=EMPTY):
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main(sys.argv[1:])
@@ -0,0 +1,284 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# 2026-10-18 PHe get_booking, also for re-enrichment
+# 2026-10-18 PHe Sign per row: a signed file and an Af/Bij file can be imported together
+# ---------------------------------------------------------------------------------------------------------------------
+from src.DL.Lexicon import AMOUNT_PLUS, AMOUNT_MINUS
+from src.DL.Model import FD, Model
+from src.DL.Table import Table
+from src.DL.UserCsvFiles.Cache.UserMutationsCache import get_te_key
+from src.GL.Const import BLANK, EMPTY
+from src.GL.Functions import skip_blanks, format_date, is_formatted_ymd
+from src.GL.GeneralException import GeneralException
+from src.GL.Validate import isInt
+from src.VL.Data.Constants.Const import OTHER_COSTS, OTHER_REVENUES
+
+PGM = 'Enricher'
+
+model = Model()
+TE_dict = model.get_colno_per_att_name(Table.TransactionEnriched)
+TX_dict_1 = model.get_colno_per_att_name(Table.Transaction, zero_based=False)
+
+# Enriched { colno: Transaction colno }, -1 = derived
+mapping = {seqno: TX_dict_1.get(name, -1) for name, seqno in TE_dict.items()}
+
+c_bban = TE_dict[FD.Account_bban]
+c_counter_account_id = TE_dict[FD.Counter_account_id]
+c_booking_code = TE_dict[FD.Booking_code]
+c_booking_id = TE_dict[FD.Booking_id]
+c_name = TE_dict[FD.Name]
+c_comments = TE_dict[FD.Comments]
+c_transaction_code = TE_dict[FD.Transaction_code]
+c_add_sub = TE_dict[FD.Add_Sub]
+c_amount = TE_dict[FD.Amount]
+c_amount_signed = TE_dict[FD.Amount_signed]
+c_remarks = TE_dict[FD.Remarks]
+i_date = TX_dict_1[FD.Date]
+i_date_format = TX_dict_1[FD.Date_format]
+
+# Process pool worker: the enricher is passed once per process.
+_worker_enricher = None
+
+
+def set_worker_enricher(enricher):
+    global _worker_enricher
+    _worker_enricher = enricher
+
+
+def enrich_in_process(rows) -> list:
+    return _worker_enricher.enrich(rows)
+
+
+class Enricher(object):
+    """
+    Transaction rows to TransactionEnriched rows.
+    All lookups are read-only snapshots of the caches and tables,
+    so the enrichment can run in a process pool.
+    """
+
+    def __init__(self, amounts_are_signed, threshold_to_other, bban_per_account_number, counter_account_ids,
+                 booking_ids, protected_booking_codes, user_booking_codes, user_remarks, search_terms,
+                 search_term_matcher, booking_code_matcher):
+        """
+        bban_per_account_number: { account_number: bban }
+        counter_account_ids: { counter_account_number: Id }
+        booking_ids: { booking_code: Id }
+        protected_booking_codes: { protected maingroup: booking_code }
+        user_booking_codes: { te_key: booking_code } and user_remarks: { te_key: remarks } (UserMutations)
+        search_terms: { search_term: booking_code }, search_term_matcher: KeywordMatcher on search_terms
+        booking_code_matcher: KeywordMatcher on booking codes
+        """
+        self._amounts_are_signed = amounts_are_signed
+        self._threshold_to_other_pos = threshold_to_other
+        self._threshold_to_other_min = threshold_to_other * -1
+        self._bban_per_account_number = bban_per_account_number
+        self._counter_account_ids = counter_account_ids
+        self._booking_ids = booking_ids
+        self._protected_booking_codes = protected_booking_codes
+        self._user_booking_codes = user_booking_codes
+        self._user_remarks = user_remarks
+        self._search_terms = search_terms
+        self._search_term_matcher = search_term_matcher
+        self._booking_code_matcher = booking_code_matcher
+
+    def enrich(self, rows) -> list:
+        return [self._enrich_row(row) for row in rows]
+
+    def _enrich_row(self, row) -> list:
+        out_row = [row[mapping[c_enriched]] for c_enriched in TE_dict.values()]
+
+        # Datum: convert to yyyy-mm-dd
+        date = format_date(row[i_date], input_format=row[i_date_format], output_format='YMD')
+        if not is_formatted_ymd(date):
+            raise GeneralException(f'{PGM}: Datum "{row[i_date]}" is ongeldig in {Table.Transaction}.')
+
+        date_target = int(date.replace('-', EMPTY))
+        out_row[1] = date_target
+        out_row[TE_dict[FD.Year]] = int(date[:4])
+        out_row[TE_dict[FD.Month]] = int(date[5:7])
+
+        # Rekening (Bban)
+        bban = self._bban_per_account_number[row[TX_dict_1[FD.Account_number]]]
+        out_row[c_bban] = bban
+
+        # Naam
+        out_row[c_name] = row[TX_dict_1[FD.Name]]
+
+        # Tegenrekening (FK)
+        counter_account_number = row[TX_dict_1[FD.Counter_account_number]]
+        out_row[c_counter_account_id] = self._counter_account_ids.get(counter_account_number, 0)
+
+        # Comments
+        comments = out_row[c_comments]
+
+        # Bedrag (unsigned)
+        amount = str(out_row[c_amount])
+        add_sub = out_row[c_add_sub]
+        sign = EMPTY  # No sign = "+"
+        if '-' in amount:
+            sign = '-'
+            amount = amount.strip('-')
+        elif add_sub or not self._amounts_are_signed:  # Separate Af/Bij column (ING, Triodos)
+            if add_sub.lower() not in ('bij', 'credit'):
+                sign = '-'
+
+        out_row[c_amount] = float(amount)
+
+        # BedragSigned
+        amount_signed = f'{sign}{amount}'
+        out_row[c_amount_signed] = float(amount_signed)
+
+        # Add/sub
+        if not out_row[c_add_sub]:
+            out_row[c_add_sub] = AMOUNT_MINUS if sign else AMOUNT_PLUS
+
+        # Boeking
+        te_key = get_te_key(bban, str(date_target), counter_account_number, comments)
+        out_row[c_booking_code], out_row[c_booking_id] = self.get_booking(
+            te_key, row[TX_dict_1[FD.Name]], row[TX_dict_1[FD.Comments]], out_row[c_amount], bool(sign),
+            counter_account_number)
+
+        # Remarks
+        out_row[c_remarks] = self._user_remarks.get(te_key, EMPTY)
+
+        # Betaalpas data
+        if out_row[c_transaction_code] == 'BA':
+            kwargs = {'mededelingen': comments}
+            if comments.lower().lstrip().startswith('pasvolgnr'):
+                pasvolgnr, date, tijd = get_pas_data('A', **kwargs)
+            elif comments.find('***') > -1:
+                pasvolgnr, date, tijd = get_pas_data('B', **kwargs)
+            else:
+                pasvolgnr, date, tijd = get_pas_data('C', **kwargs)
+            if out_row[c_booking_id] <= 0:  # Nog geen rekening booking
+                out_row[c_booking_id] = 0
+        else:
+            pasvolgnr, date, tijd = EMPTY, EMPTY, EMPTY
+
+        out_row[TE_dict[FD.Transaction_date]] = date
+        out_row[TE_dict[FD.Transaction_time]] = tijd
+        return out_row
+
+    def get_booking(self, te_key, name, comments, amount, is_cost, counter_account_number) -> (str, int):
+        """
+        Booking code and Id of a transaction. Also used to re-enrich existing transactions.
+        amount: unsigned. is_cost: the amount is negative.
+        """
+        # - Bedrag lager dan drempel
+        if self._threshold_to_other_min < amount < self._threshold_to_other_pos:
+            booking_code = self._protected_booking_codes[OTHER_COSTS if is_cost else OTHER_REVENUES]
+        else:
+            # - Initialiseer eerst vanuit UserMutations, dan SearchTerms, dan BookingCode
+            booking_code = self._user_booking_codes.get(te_key, EMPTY)
+            if not booking_code:
+                booking_code = self._get_search_term_booking_code(name, comments)
+            if not booking_code:
+                booking_code = self._get_booking_code(name, comments)
+
+            # - Nog geen boeking en ook geen tegenrekening, dan "Overige uitgaven"/"Overige inkomsten".
+            if not booking_code and not counter_account_number:
+                booking_code = self._protected_booking_codes[OTHER_COSTS if is_cost else OTHER_REVENUES]
+
+        return booking_code, self._booking_ids.get(booking_code, 0) if booking_code else 0
+
+    def _get_search_term_booking_code(self, name, comment) -> str:
+        """ Like SearchTermCache.get_booking_code """
+        for item in (name, comment):
+            search_term = self._search_term_matcher.find(item.lower())
+            if search_term is not None and self._search_terms[search_term]:
+                return self._search_terms[search_term]
+        return EMPTY
+
+    def _get_booking_code(self, name, comment) -> str:
+        """ Like BookingCodeCache.get_booking_code """
+        return self._booking_code_matcher.find(name) or self._booking_code_matcher.find(comment) or EMPTY
+
+
+def get_pas_data(format_char, mededelingen) -> (str, str, str):
+    pasvolgnr, datum, tijd = EMPTY, EMPTY, EMPTY  # output
+
+    if format_char == 'A':
+        # Example (Mededelingen):
+        # "Pasvolgnr:001 13-01-2020 23:37 Transactie:12Z9V4 Term:1F7Z01"
+        # " PASVOLGNR 002     23-05-2019 14:51 TRANSACTIENR 1234567"
+        s = mededelingen.lower().find('pasvolgnr')
+        if s > -1:
+            pasvolgnr, s = _get_pasvolgnr(mededelingen, s + 10)
+            datum, tijd = _get_datum_tijd(mededelingen)
+
+    # Example: (Mededelingen)
+    # "1234567 MIJN CLUB LEIDEN>LEIDEN PASNR ***A001 23-06-2019 16:39 TRANSACTIENR 1234567"
+    elif format_char == 'B':
+        s = mededelingen.find('***')
+        if s > -1 and s + 4 < len(mededelingen):
+            pasvolgnr, e = _get_pasvolgnr(mededelingen, s + 4)
+            datum, tijd = _get_datum_tijd(mededelingen)
+
+    # Example (Naam, Mededelingen):
+    # "19-07-99 18:12 BETAALAUTOMAAT", " SUPERMARKT / AMSTERDAM 001 123456 1234567 ING BANK NV PASTRANSACTIES"
+    else:
+        s = 0
+        while pasvolgnr == EMPTY and -1 < s < len(mededelingen):
+            s = mededelingen.find(BLANK, s)
+            if s > -1:
+                s = skip_blanks(mededelingen, s)
+                pasvolgnr, s = _get_pasvolgnr(mededelingen, s)
+        datum, tijd = _get_datum_tijd(mededelingen)
+
+    return pasvolgnr, datum, tijd
+
+
+def _get_pasvolgnr(value, s) -> (str, int):
+    pasvolgnr = EMPTY
+    # look for 3 consecutive numbers...
+    e = s
+    while e < len(value) and '0' <= value[e] <= '9':
+        e += 1
+    # ... followed by space
+    if e - s == 3 and e < len(value) and value[e] == BLANK:
+        pasvolgnr = value[s:e]  # found!
+    # Skip blanks
+    e = skip_blanks(value, e)
+    return pasvolgnr, e
+
+
+def _get_datum_tijd(value) -> (str, str):
+    datum, tijd = EMPTY, EMPTY  # output
+
+    # Find "-xx-"
+    s = 0
+    found = False
+    while not found and -1 < s < len(value):
+        s = value.find('-', s)
+        if s == -1:
+            break
+        if s < len(value) - 3 and value[s + 3] == '-':
+            found = True
+        else:
+            s += 1  # skip '-'
+
+    if found:
+        dd = value[s - 2:s]
+        mm = value[s + 1:s + 3]
+        jjjj = f'20{value[s + 4:s + 6]}' if value[s + 6] == BLANK else f'{value[s + 4:s + 8]}'
+
+        d = f'{jjjj}{mm}{dd}'
+        if isInt(d):
+            # Transactiedatum
+            datum = f'{jjjj}-{mm}-{dd}'
+
+        # Tijd
+        s = (s + 7) if value[s + 6] == BLANK else (s + 9)
+        hh = value[s:s + 2]
+        mm = value[s + 3:s + 5]
+        t = f'{hh}{mm}'
+        if isInt(t):
+            # Transactietijd
+            tijd = f'{hh}:{mm}'
+
+    return datum, tijd
@@ -5,10 +5,14 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2018-12-30 PHe First creation
+# 2026-10-18 PHe Invalidate the Month and Year tables after a booking update
+# 2026-10-18 PHe Views are imported when used (headless CLI)
+# 2026-10-18 PHe New search term: re-enrich only the affected transactions
 # ---------------------------------------------------------------------------------------------------------------------
 import os
 
 from src.BL.Managers.BaseManager import BaseManager
+from src.BL.Managers.EnrichmentManager import EnrichmentManager
 from src.DL.Config import CF_RESTORE_BOOKING_DATA, get_label, TABLE_PROPERTIES, FILE_NAME, CF_RADIO_ALL, \
     CF_POPUP_INPUT_VALUE
 from src.DL.DBDriver.Att import Att
@@ -34,8 +38,6 @@ from src.GL.Result import Result
 from src.GL.Validate import normalize_dir
 from src.VL.Data.Constants.Const import LEEG
 from src.VL.Data.Constants.Enums import Pane
-from src.VL.Views.PopUps.Dialog_with_transactions import DialogWithTransactions
-from src.VL.Views.PopUps.PopUp import PopUp
 
 PGM = MUTATION_PGM_BC_MANAGER
 
@@ -61,6 +63,7 @@ class BookingCodeManager(BaseManager):
 
     def __init__(self):
         super().__init__()
+        from src.VL.Views.PopUps.PopUp import PopUp
         self._dialog = PopUp()
         self._transaction_io = TransactionIO()
         self._search_term_io = SearchTermIO()
@@ -105,6 +108,11 @@ class BookingCodeManager(BaseManager):
                     booking_code=booking_code)):
                 # Success: Refresh search term cache.
                 STM.initialize(force=True)
+                # Book the other transactions with the search term (e.g. in the comments), like the import does.
+                count = EnrichmentManager().reenrich(search_terms=[self._entity_value])
+                if count:
+                    self._result.add_message(
+                        f'{count} {TRANSACTIONS} met {SEARCH_TERM} "{self._entity_value}" zijn opnieuw geboekt.')
 
         # No Undo here
         return self._result
@@ -171,6 +179,7 @@ class BookingCodeManager(BaseManager):
             input_label = EMPTY
             extra_text = EMPTY
 
+        from src.VL.Views.PopUps.Dialog_with_transactions import DialogWithTransactions
         dialog = DialogWithTransactions(where=where, has_radio=True, input_label=input_label)
 
         # No transactions to be updated
@@ -226,6 +235,7 @@ class BookingCodeManager(BaseManager):
         Update booking id in TransactionsEnriched for the current transaction.
         """
         booking_code = BCM.get_value_from_id(booking_id, FD.Booking_code)
+        self._transaction_io.invalidate_year_months(where=[Att(FD.ID, transaction_id)])
         self._db.update(
             Table.TransactionEnriched, where=[Att(FD.ID, transaction_id)],
             values=[Att(FD.Booking_id, booking_id), Att(FD.Booking_code, booking_code)], pgm=PGM)
@@ -302,6 +312,7 @@ class BookingCodeManager(BaseManager):
             return Result()
 
         # Not consistent
+        from src.VL.Views.PopUps.PopUp import PopUp
         PopUp().display(
             title=f'Backup maken van {BOOKING_CODES}',
             text=f'Backup van je {BOOKING_CODES} is niet mogelijk: de database is niet consistent.'
@@ -386,6 +397,7 @@ class BookingCodeManager(BaseManager):
         # Completion
         text = f'wordt het volgende bestand ' if len(self._restore_paths) == 1 else f'worden de volgende bestanden '
         bullets = '\n    o  '.join([os.path.basename(p) for p in self._restore_paths.values()])
+        from src.VL.Views.PopUps.PopUp import PopUp
         if not PopUp().confirm(
                 'Restore_booking_related_data',
                 f'De volgende acties zullen automatisch worden uitgevoerd:\n\n'
@@ -5,15 +5,15 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2018-12-30 PHe First creation
+# 2026-10-18 PHe Enriched transactions are validated via 1 aggregate query
+# 2026-10-18 PHe Progress meter is imported only in GUI mode
 # ---------------------------------------------------------------------------------------------------------------------
 from src.BL.Functions import get_BBAN_from_IBAN
 from src.BL.Managers.BaseManager import BaseManager
 from src.DL.Config import CF_VERBOSE, CF_IMPORT_PATH_COUNTER_ACCOUNTS, CF_IBAN, SEARCH_TERMS_CSV
-from src.DL.DBDriver.Att import Att
-from src.DL.DBDriver.AttType import AttType
 from src.DL.IO.YearMonthIO import YearMonthIO
 from src.DL.Lexicon import TRANSACTIONS, COUNTER_ACCOUNTS, BOOKING_CODE, SEARCH_TERMS
-from src.DL.Model import FD, Model
+from src.DL.Model import FD
 from src.DL.Table import Table
 from src.DL.UserCsvFiles.Cache.BookingCodeCache import Singleton as BookingCodeCache
 from src.DL.UserCsvFiles.Cache.SearchTermCache import Singleton as SearchTermCache
@@ -23,20 +23,24 @@ from src.GL.BusinessLayer.CsvManager import CsvManager
 from src.GL.Const import EMPTY, USER_MUTATIONS_FILE_NAME, EXT_CSV
 from src.GL.Enums import Color, MessageSeverity
 from src.GL.Result import Result
-from src.VL.Functions import progress_meter
 
 # Working fields
 PGM = 'Consistentie'
-error_prefix = f'{Color.RED}Er is een fout opgetreden{Color.NC}: '
 remark_prefix = f'{Color.BLUE}Opmerking{Color.NC}: '
 
-model = Model()
-
 CsvM = CsvManager()
 BCM = BookingCodeCache()
 STM = SearchTermCache()
 UMC = UserMutationsCache()
-TE_dict = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)
+
+# Transactions per booking and counter-account.
+TE = Table.TransactionEnriched
+CA = Table.CounterAccount
+SQL_BOOKING_COUNTS = (
+    f'SELECT {TE}.{FD.Booking_id}, {CA}.{FD.Counter_account_number}, COUNT(*) '
+    f'FROM {TE} LEFT JOIN {CA} ON {CA}.{FD.ID} = {TE}.{FD.Counter_account_id} '
+    f'WHERE {TE}.{FD.Account_bban} = ? AND {TE}.{FD.Year} BETWEEN ? AND ? AND {TE}.{FD.Month} BETWEEN 1 AND 12 '
+    f'GROUP BY 1, 2')
 
 
 class ConsistencyManager(BaseManager):
@@ -75,8 +79,6 @@ class ConsistencyManager(BaseManager):
             return self._result
         # Go!
         from_year = kwargs['from_year']
-        from_month = kwargs['from_month']
-        to_month = kwargs['to_month']
         to_year = kwargs['to_year']
 
         self._progress_steps_total = to_year - from_year + 1 if transaction_enriched_count > 0 else 1
@@ -108,29 +110,12 @@ class ConsistencyManager(BaseManager):
                 f'  Mogelijke oorzaak: De import is tussentijds geannuleerd.\n'
                 f'  Remedie: Doe de import opnieuw.', MessageSeverity.Warning)
 
-        # - Validate rows per year/month
+        # - Validate rows per year
         account_bban = get_BBAN_from_IBAN(self._CM.get_config_item(CF_IBAN))
         if transaction_enriched_count > 0:
-            yy = from_year
-            mm = from_month
-            while yy <= to_year:
-                # Progress
-                step = self._progress_steps_total - (to_year - yy)
-                self._progress(step, f'Verrijkte transacties - jaar {yy}')
-                # Month
-                mm_2 = 12 if yy < to_year else to_month
-                while mm <= mm_2:
-                    # Get rows
-                    month_rows = self._db.fetch(
-                        Table.TransactionEnriched,
-                        where=[Att(FD.Account_bban, account_bban),
-                               Att(FD.Year, yy, type=AttType.Int),
-                               Att(FD.Month, mm, type=AttType.Int)])
-                    # Calculate results
-                    self._validate_month(month_rows)
-                    mm += 1
-                mm = 1
-                yy += 1
+            self._progress(self._progress_steps_total, f'Verrijkte transacties - jaar {from_year} t/m {to_year}')
+            self._validate_booking_counts(
+                self._db.fetch_query(SQL_BOOKING_COUNTS, (account_bban, from_year, to_year)))
         # Remarks
         self._booking_message(Table.CounterAccount, COUNTER_ACCOUNTS)
 
@@ -199,49 +184,22 @@ class ConsistencyManager(BaseManager):
 
     def _progress(self, step_no, message):
         if not self._session.unit_test and self._CM.get_config_item(CF_VERBOSE) and not self._session.CLI_mode:
+            from src.VL.Functions import progress_meter
             progress_meter(
                 step_no - 1, self._progress_steps_total, 'Consistentie check', 'Consistentie check', message_1=message)
 
-    def _validate_month(self, month_rows):
-        """ Validate all ME rows of a month """
-        year, month, p_year, p_month = None, None, None, None
-        first = True
-
-        row_no = 0
-        for month_row in month_rows:
-            row_no += 1
-            year = month_row[TE_dict[FD.Year]]
-            month = month_row[TE_dict[FD.Month]]
-            name = month_row[TE_dict[FD.Name]]
-            comments = month_row[TE_dict[FD.Comments]]
-            # Booking
-            booking_code = BCM.get_value_from_id(month_row[TE_dict[FD.Booking_id]], FD.Booking_code)
-            counter_account_id = month_row[TE_dict[FD.Counter_account_id]]
-            counter_account_number = self._db.fetch_value(
-                Table.CounterAccount, name=FD.Counter_account_number, where=[Att(FD.ID, counter_account_id)])
-
-            if first:
-                first = False
-                p_year = year
-                p_month = month
-            if year != p_year or month != p_month:
-                self._is_consistent = False
-                self._result.add_message(
-                    f'{error_prefix}Niet alle maanden of jaren zijn gelijk in de set {year}-{month}. '
-                    f'Maand {month} is ABNORMAAL beëindigd.', MessageSeverity.Error)
-                return
-
+    def _validate_booking_counts(self, booking_counts):
+        """ booking_counts: [booking_id, counter_account_number, transaction count] """
+        for booking_id, counter_account_number, count in booking_counts:
             # Booking code is empty
+            booking_code = BCM.get_value_from_id(booking_id, FD.Booking_code)
             if not booking_code and counter_account_number:
-                self._increment_missing_booking(Table.CounterAccount, counter_account_number, name, comments)
+                self._increment_missing_booking(Table.CounterAccount, counter_account_number, count)
 
-    def _increment_missing_booking(self, table_name, key, name, comments):
+    def _increment_missing_booking(self, table_name, key, count):
         if table_name not in self._entities_without_ca:
             self._entities_without_ca[table_name] = {}
-        if not self._entities_without_ca[table_name].get(key):
-            self._entities_without_ca[table_name][key] = [1, name, comments]
-        else:
-            self._entities_without_ca[table_name][key][0] += 1
+        self._entities_without_ca[table_name][key] = self._entities_without_ca[table_name].get(key, 0) + count
 
     def _completion_message(self, text):
         self._result.add_message(text, MessageSeverity.Completion)
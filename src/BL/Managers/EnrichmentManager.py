@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+from src.BL.Enricher import Enricher
+from src.BL.Managers.BaseManager import BaseManager
+from src.DL.Config import CF_AMOUNT_THRESHOLD_TO_OTHER
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.Audit import Program_mutation
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.DBDriver.SQLOperator import SQLOperator
+from src.DL.IO.AccountIO import AccountIO
+from src.DL.Model import FD, Model
+from src.DL.Table import Table
+from src.DL.UserCsvFiles.Cache.BookingCodeCache import Singleton as BookingCodeCache
+from src.DL.UserCsvFiles.Cache.SearchTermCache import Singleton as SearchTermCache
+from src.DL.UserCsvFiles.Cache.UserMutationsCache import Singleton as UserMutationsCache, get_te_key
+from src.DL.YearMonthCache import Singleton as YearMonthCache
+from src.GL.Const import MUTATION_PGM_TE, MUTATION_PGM_BC, MUTATION_PGM_BC_MANAGER
+
+PGM = 'EnrichmentManager'
+
+TABLE = Table.TransactionEnriched
+CHUNK_SIZE = 500  # Ids per statement, below the sqlite limit of bound parameters.
+# Bookings that the user has set. These are kept (and backed up in UserMutations.csv).
+USER_PGMS = (MUTATION_PGM_TE, MUTATION_PGM_BC, MUTATION_PGM_BC_MANAGER)
+NAMES = [FD.ID, FD.Account_bban, FD.Date, FD.Year, FD.Name, FD.Comments, FD.Amount, FD.Amount_signed,
+         FD.Counter_account_number, FD.Booking_code, FD.Booking_id, Program_mutation]
+
+model = Model()
+BCM = BookingCodeCache()
+STM = SearchTermCache()
+UMC = UserMutationsCache()
+
+
+class EnrichmentManager(BaseManager):
+    """
+    Bookings of TransactionEnriched.
+    After a search term, booking code or counter account booking has changed, only the transactions
+    that may be affected are enriched again. Instead of importing all transactions again.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._threshold_to_other = self._CM.get_config_item(CF_AMOUNT_THRESHOLD_TO_OTHER, 0)
+
+    def get_enricher(self, amounts_are_signed=False, bban_per_account_number=None) -> Enricher:
+        """ Snapshot of the lookups that are needed to enrich the Transactions. """
+        BCM.initialize()
+        STM.initialize()
+        UMC.initialize()
+        return Enricher(
+            amounts_are_signed=amounts_are_signed,
+            threshold_to_other=self._threshold_to_other,
+            bban_per_account_number=bban_per_account_number or {},
+            # Foreign keys: load the lookups once instead of querying per transaction.
+            counter_account_ids=self.get_id_per_value(self._db, Table.CounterAccount, FD.Counter_account_number),
+            booking_ids=self.get_id_per_value(self._db, Table.BookingCode, FD.Booking_code),
+            protected_booking_codes=BCM.protected_maingroup_booking_codes,
+            user_booking_codes=UMC.get_booking_codes_by_te_key(),
+            user_remarks=UMC.remarks_by_te_key,
+            search_terms=STM.search_terms,
+            search_term_matcher=STM.matcher,
+            booking_code_matcher=BCM.matcher)
+
+    @staticmethod
+    def get_id_per_value(db, table_name, att_name) -> dict:
+        """ { value: Id } with the first Id per value, like db.fetch_id returns it. """
+        c = model.get_column_number(table_name, att_name)
+        ids = {}
+        [ids.setdefault(row[c], row[0]) for row in db.fetch(table_name, mode=FetchMode.WholeTable)]
+        return ids
+
+    def reenrich(self, search_terms=None, booking_codes=None, counter_account_ids=None, booking_ids=None) -> int:
+        """
+        Enrich the bookings of the transactions that may be affected by a change, like the import does.
+        search_terms, booking_codes: added, changed or removed. The transactions containing them are affected,
+            and the transactions that are booked with these booking codes.
+        counter_account_ids, booking_ids: the transactions with these foreign keys are affected.
+        Bookings set by the user are kept, unless they have been cleared.
+        Return the number of changed transactions.
+        """
+        ids = self._get_candidate_ids(search_terms, booking_codes, counter_account_ids, booking_ids)
+        if not ids:
+            return 0
+
+        # Caches may have been changed (e.g. a search term added).
+        STM.initialize(force=True)
+        BCM.initialize(force=True)
+        enricher = self.get_enricher()
+
+        # Recalculate. { (booking_code, booking_id): [Id] }
+        ids_per_booking, year_months = {}, set()
+        ids = sorted(ids)
+        for i in range(0, len(ids), CHUNK_SIZE):
+            for Id, bban, date, year, name, comments, amount, amount_signed, counter_account_number, \
+                    booking_code, booking_id, pgm in self._fetch_rows(ids[i:i + CHUNK_SIZE]):
+                # A user booking is kept. Without a booking (e.g. its booking code is deleted) it is enriched.
+                if pgm in USER_PGMS and booking_id:
+                    continue
+                booking = enricher.get_booking(
+                    get_te_key(bban, str(date), counter_account_number, comments),
+                    name, comments, amount, amount_signed < 0, counter_account_number)
+                if booking != (booking_code, booking_id):
+                    ids_per_booking.setdefault(booking, []).append(Id)
+                    year_months.add((bban, year))
+
+        # Update only the changed transactions, and invalidate only their Month and Year rows.
+        for (booking_code, booking_id), changed_ids in ids_per_booking.items():
+            for i in range(0, len(changed_ids), CHUNK_SIZE):
+                self._db.update(
+                    TABLE, values=[Att(FD.Booking_id, booking_id), Att(FD.Booking_code, booking_code)],
+                    where=[Att(FD.ID, changed_ids[i:i + CHUNK_SIZE])], pgm=PGM)
+        for bban, year in year_months:
+            YearMonthCache().invalidate(bban, [year])
+        return sum(len(changed_ids) for changed_ids in ids_per_booking.values())
+
+    def _fetch_rows(self, ids) -> list:
+        """ Only the columns that are needed (the audit columns are not in the model). """
+        return self._db.fetch_query(
+            f'SELECT {", ".join(NAMES)} FROM {TABLE} WHERE {FD.ID} IN ({", ".join("?" for _ in ids)})', ids)
+
+    def _get_candidate_ids(self, search_terms, booking_codes, counter_account_ids, booking_ids) -> set:
+        ids = set()
+        # Leading index column (all TransactionEnriched indexes start with the account)
+        bbans = Att(FD.Account_bban, AccountIO().get_bbans())
+        for term in search_terms or []:
+            ids.update(self._select_ids_containing(term))
+        for booking_code in booking_codes or []:
+            # Booking codes of at least 3 characters are matched in the text (see BookingCodeCache).
+            if len(booking_code) > 2:
+                ids.update(self._select_ids_containing(booking_code))
+        if booking_codes:
+            ids.update(self._db.select(TABLE, name=FD.ID, where=[bbans, Att(FD.Booking_code, list(booking_codes))]))
+        if counter_account_ids:
+            ids.update(self._db.select(
+                TABLE, name=FD.ID, where=[bbans, Att(FD.Counter_account_id, list(counter_account_ids))]))
+        if booking_ids:
+            ids.update(self._db.select(TABLE, name=FD.ID, where=[bbans, Att(FD.Booking_id, list(booking_ids))]))
+        return ids
+
+    def _select_ids_containing(self, value) -> list:
+        """
+        Ids of the transactions with the value in the name or comments (case-insensitive).
+        Via the trigram index if possible, like the search does.
+        """
+        if not value:
+            return []
+        if len(value) >= 3 and not any(c in value for c in '*%_') and self._db.text_index_exists(
+                Table.TransactionSearch):
+            phrase = value.replace('"', '""')
+            return self._db.select(TABLE, name=FD.ID, match=[Table.TransactionSearch, f'"{phrase}"'])
+        ids = []
+        for att_name in (FD.Name, FD.Comments):
+            ids.extend(self._db.select(
+                TABLE, name=FD.ID, where=[Att(att_name, f'%{value}%', relation=SQLOperator().LIKE)]))
+        return ids
@@ -5,36 +5,49 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2018-12-20 PHe First creation
+# 2026-10-18 PHe Bank transaction files are parsed in a process pool (optional)
+# 2026-10-18 PHe Enrichment via Enricher, optionally in a process pool
+# 2026-10-18 PHe Invalidate the Month and Year tables (YearMonthCache)
+# 2026-10-18 PHe Combo box values via DISTINCT queries and 1 insert
+# 2026-10-18 PHe SQL statistics after the import (if enabled)
+# 2026-10-18 PHe Process pool is imported only when used (CLI start-up)
+# 2026-10-18 PHe Enricher lookups via EnrichmentManager
+# 2026-10-18 PHe Incremental import: a full import if the user data is imported too
 # ---------------------------------------------------------------------------------------------------------------------
+from collections import Counter
+from itertools import islice, chain
+
+from src.BL.Enricher import Enricher, set_worker_enricher, enrich_in_process
 from src.BL.Managers.BaseManager import BaseManager
 from src.BL.Managers.ConsistencyManager import ConsistencyManager
-from src.BL.Validator import Validator
+from src.BL.Managers.EnrichmentManager import EnrichmentManager
+from src.BL.Validator import Validator, get_column_count_error
 from src.DL.Config import CF_VERBOSE, DOUBLES_CSV, \
     CSV_FILE, CF_COMMA_REPRESENTATION_DISPLAY, CF_INPUT_DIR, CF_IBAN, \
-    CF_AMOUNT_THRESHOLD_TO_OTHER
+    CF_IMPORT_WORKERS
 from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.AttType import AttType
 from src.DL.DBDriver.Enums import FetchMode
+from src.DL.DBDriver.Functions import sanitize_text
+from src.DL.DBDriver.SQLOperator import SQLOperator
 from src.DL.IO.AccountIO import AccountIO
 from src.DL.IO.CounterAccountIO import CounterAccountIO
+from src.DL.IO.ImportFileIO import ImportFileIO
 from src.DL.IO.YearMonthIO import YearMonthIO
-from src.DL.Lexicon import TRANSACTIONS, AMOUNT_PLUS, \
-    AMOUNT_MINUS, BOOKING_CODES
-from src.DL.Model import FD, Model
+from src.DL.Lexicon import TRANSACTIONS, BOOKING_CODES
+from src.DL.Model import FD, Model, PK
 from src.DL.Objects.CounterAccount import CounterAccount
 from src.DL.Table import Table
 from src.DL.UserCsvFiles.Cache.BookingCodeCache import Singleton as BookingCodeCache
-from src.DL.UserCsvFiles.Cache.SearchTermCache import Singleton as SearchTermCache
-from src.DL.UserCsvFiles.Cache.UserMutationsCache import Singleton as UserMutationsCache, get_te_key
 from src.DL.UserCsvFiles.UserCsvFileManager import UserCsvFileManager
+from src.DL.YearMonthCache import Singleton as YearMonthCache
 from src.GL.BusinessLayer.CsvManager import CsvManager
-from src.GL.Const import UNKNOWN, BLANK, EMPTY
+from src.GL.Const import EMPTY
 from src.GL.Enums import Color, MessageSeverity as Sev, MessageSeverity, ActionCode
-from src.GL.Functions import skip_blanks, remove_color_code, format_date, \
-    is_formatted_ymd, try_to_get_date_format, toFloat
+from src.GL.Functions import remove_color_code, try_to_get_date_format, toFloat
 from src.GL.GeneralException import GeneralException
 from src.GL.Result import Result
-from src.GL.Validate import isInt
-from src.VL.Data.Constants.Const import LEEG, NIET_LEEG, OTHER_COSTS, OTHER_REVENUES
+from src.VL.Data.Constants.Const import LEEG, NIET_LEEG
 
 error_prefix = f'{Color.RED}Fout:{Color.NC} '
 error_message = None
@@ -46,18 +59,83 @@ warning_count = 0
 row_count = 0
 
 PGM = 'ImportManager'
+INSERT_BATCH_SIZE = 10000  # Bank transactions per insert_many (peak memory)
+DATE_FORMAT_SAMPLE_SIZE = 1000  # Rows to determine the date format
+ENRICH_CHUNK_SIZE = 10000  # Transactions per enrichment task in the process pool
 
 model = Model()
 csvm = CsvManager()
 
 BCM = BookingCodeCache()
-STM = SearchTermCache()
-UMC = UserMutationsCache()
+YMC = YearMonthCache()
 
 TE_dict = model.get_colno_per_att_name(Table.TransactionEnriched)
 TE_dict_1 = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)
 TX_dict = model.get_att_name_per_colno(Table.Transaction)
-bk_dict = model.get_colno_per_att_name(Table.BookingCode, zero_based=False)
+TX_pk_colnos = [
+    model.get_column_number(Table.Transaction, name)
+    for name in model.get_indexes(Table.Transaction)[PK] if name != FD.ID]
+c_TX_amount = model.get_column_number(Table.Transaction, FD.Amount, zero_based=True)
+c_TX_account_number = model.get_column_number(Table.Transaction, FD.Account_number)
+
+# Combo box values per FlatFiles key
+TE = Table.TransactionEnriched
+CA = Table.CounterAccount
+SQL_COMBO_VALUES = {
+    FD.Account_number: f'SELECT DISTINCT {FD.Account_bban} FROM {TE}',
+    FD.Year: f'SELECT DISTINCT {FD.Year} FROM {TE}',
+    FD.Counter_account_number:
+        f'SELECT DISTINCT {CA}.{FD.Counter_account_number} '
+        f'FROM {TE} JOIN {CA} ON {CA}.{FD.ID} = {TE}.{FD.Counter_account_id}',
+    FD.Transaction_code: f'SELECT DISTINCT {FD.Transaction_code} FROM {TE}',
+    FD.Transaction_type: f'SELECT DISTINCT {FD.Transaction_type} FROM {TE}',
+    FD.Booking_type: f'SELECT DISTINCT {FD.Booking_type} FROM {Table.BookingCode}',
+}
+
+
+def parse_transaction_file(M, comma_source, accounts: dict, counter_accounts: dict):
+    """
+    Read a bank transaction csv file and map the rows to the Transaction model (generator).
+    The file is read once, row by row.
+    accounts: { account_number: None } and counter_accounts: { counter_account_number: [name, comments] }
+    are added to in the order found.
+    """
+    colnos = M.colno_mapping  # { model_colno: csv_colno } (zero_based)
+    d = {TX_dict[m]: c for m, c in colnos.items()}
+    # Stream csv file
+    csv_rows = CsvManager().stream_rows(data_path=M.path, delimiter=M.delimiter)
+    # Bepaal datum formaat over max. 1000 regels.
+    first_rows = list(islice(csv_rows, DATE_FORMAT_SAMPLE_SIZE))
+    date_format = try_to_get_date_format(first_rows, d[FD.Date], M.path)
+    # Format rows
+    for row in chain(first_rows, csv_rows):
+        if M.column_count and len(row) != M.column_count:
+            raise GeneralException(get_column_count_error(M.file_name))
+        # Sanitize amount
+        row[d[FD.Amount]] = toFloat(row[d[FD.Amount]], comma_source=comma_source)
+        # Remember Accounts
+        accounts[row[d[FD.Account_number]]] = None
+        # Remember CounterAccounts (first one)
+        counter_account_number = row[d[FD.Counter_account_number]]
+        if counter_account_number and counter_account_number not in counter_accounts:
+            counter_accounts[counter_account_number] = [row[d[FD.Name]], row[d[FD.Comments]]]
+        # Map csv to model
+        # (optional csv col is substituted by EMPTY, e.g. "TransactionCode" not present)
+        out_row = []
+        for colno, att_name in TX_dict.items():
+            if colno in colnos:
+                out_row.append(row[colnos[colno]])
+            else:
+                # Derived: date format
+                out_row.append(date_format if att_name == FD.Date_format else EMPTY)
+        yield out_row
+
+
+def parse_transaction_file_in_process(M, comma_source) -> tuple:
+    """ Process pool worker. @return: (rows, account numbers, counter_accounts) of the file. """
+    accounts, counter_accounts = {}, {}
+    rows = list(parse_transaction_file(M, comma_source, accounts, counter_accounts))
+    return rows, list(accounts), counter_accounts
 
 
 class ImportManager(BaseManager):
@@ -69,25 +147,22 @@ class ImportManager(BaseManager):
         self._counter = 0
 
         self._comma_source = self._CM.get_config_item(CF_COMMA_REPRESENTATION_DISPLAY, ',')
-        self._threshold_to_other_pos = self._CM.get_config_item(CF_AMOUNT_THRESHOLD_TO_OTHER, 0)
-        self._threshold_to_other_min = self._threshold_to_other_pos * -1
 
         self._validation_manager = Validator()
         self._user_csv_manager = UserCsvFileManager()
         self._account_io = AccountIO()
         self._counter_account_manager = CounterAccountIO()
 
-        self._unique_account_bban = set()
-        self._unique_year = set()
-        self._unique_counter_account_id = set()
-        self._unique_transaction_code = set()
-        self._unique_mutation_type = set()
         self._unique_card_seqno = set()
-        self._unique_booking_types = set()
+        self._enriched_years = set()  # (bban, year)
         self._progress_steps_total = 0
         self._amounts_are_signed = False
 
-    def start(self, import_user_csv_files=True) -> Result:
+    def start(self, import_user_csv_files=True, incremental=False) -> Result:
+        """
+        incremental: Only import new bank transaction files and rows, and keep the existing data.
+            Falls back to a full import if nothing has been imported yet, or if the user data is imported.
+        """
         global error_count, total_count, warning_count
 
         self._verbose = self._CM.get_config_item(CF_VERBOSE)
@@ -123,15 +198,34 @@ class ImportManager(BaseManager):
                 self._result.action_code = ActionCode.Cancel
                 return self._result
 
-        # Go!
+        # Incremental: There must be something to add to.
+        #   Changed user data (e.g. booking codes) affects all transactions, so then everything is imported.
+        if incremental:
+            if import_user_csv_files:
+                incremental = False
+            elif not self._db.count(Table.ImportFile) or not self._db.count(Table.TransactionEnriched):
+                incremental = False
+                self._result.add_message(f'Er zijn nog geen {TRANSACTIONS} geïmporteerd. Alles wordt geïmporteerd.')
+
+        # Go! All steps in 1 transaction. Transaction indexes are recreated at the end.
+        with self._db.bulk_load(table_names=[Table.Transaction, Table.TransactionEnriched]):
+            self._import(popup, import_user_csv_files, incremental)
+        self._report_sql_trace()
+        return self._result
+
+    def _import(self, popup, import_user_csv_files, incremental) -> Result:
         # a. Clear DB tables
         self._account_io = AccountIO()  # Clear accounts in memory
+        self._enriched_years = set()
         self._progress(1, 'Leeg maken database tabellen')
-        if import_user_csv_files:
+        if incremental:
+            self._account_io.get_ibans()  # Load the existing accounts
+        elif import_user_csv_files:
             [self._db.clear(table) for table in model.DB_tables]
         else:
             [self._db.clear(table) for table in model.DB_tables if table not in model.user_maintainable_tables]
-        self._result.add_message('\nDatabase tabellen zijn leeg gemaakt.', Sev.Completion)
+        if not incremental:
+            self._result.add_message('\nDatabase tabellen zijn leeg gemaakt.', Sev.Completion)
 
         # b. Repopulate booking related user data: base tables
         #   (bookings, accounts, search-terms), even if not working with bookings.
@@ -142,8 +236,14 @@ class ImportManager(BaseManager):
 
         # c. Import the raw bank transaction files and the accounts.
         self._progress(3, f'{TRANSACTIONS} importeren')
-        self.import_bank_transactions(self._db)
-        self._result.add_message(f'{TRANSACTIONS} zijn geïmporteerd.', Sev.Completion)
+        max_id = (self._db.fetch_max(Table.Transaction, FD.ID) or 0) if incremental else 0
+        count = self.import_bank_transactions(self._db, incremental)
+        if incremental:
+            self._result.add_message(f'{count} nieuwe {TRANSACTIONS} zijn geïmporteerd.', Sev.Completion)
+            if count == 0:
+                return self._result
+        else:
+            self._result.add_message(f'{TRANSACTIONS} zijn geïmporteerd.', Sev.Completion)
 
         # d. Evaluate doubles
         self._progress(4, 'Controleren op dubbele')
@@ -168,7 +268,8 @@ class ImportManager(BaseManager):
 
         # e. Enrich transacties
         self._progress(5, f'{TRANSACTIONS}  verrijken')
-        self.create_enriched_mutations(self._db)
+        where = [Att(FD.ID, max_id, type=AttType.Int, relation=SQLOperator().GT)] if incremental else None
+        self.create_enriched_mutations(self._db, where=where)
         self._result.add_message(f'{TRANSACTIONS} zijn verrijkt met {BOOKING_CODES}.', Sev.Completion)
         self._progress(6, 'Combo boxen vullen')
         self._save_combo_data()  # Flat files
@@ -182,6 +283,10 @@ class ImportManager(BaseManager):
 
         # g. Create Maand- en jaarOverzicht
         if not self._result.ER:
+            if incremental:
+                [YMC.invalidate(account_bban, [year]) for account_bban, year in self._enriched_years]
+            else:
+                YMC.invalidate()
             result = YearMonthIO().refresh_data()
             self._result.messages.extend(result.messages)
             if result.OK:
@@ -197,11 +302,11 @@ class ImportManager(BaseManager):
     def _has_consecutive_doubles(self, rows) -> bool:
         """ Multiple consecutive doubles indicate a double batch.  """
         count = 0
-        key_p = EMPTY
+        key_p = None
+        double_keys = self._get_double_keys(rows)
         for row in rows:
-            where = model.get_pk_atts_from_row(Table.Transaction, row)
-            key = '|'.join(str(a.value) for a in where)
-            if len(self._db.fetch(Table.Transaction, where=where)) > 1:
+            key = self._get_pk_key(row)
+            if key in double_keys:
                 if count > 0 and key_p and key_p != key:
                     return True
                 count += 1
@@ -213,11 +318,12 @@ class ImportManager(BaseManager):
     def export_doubles(self, rows) -> int:
         count = 0
         out_rows = []
+        double_keys = self._get_double_keys(rows)
         for row in rows:
             # Only when there are 2 consecutive doubles
-            where = model.get_pk_atts_from_row(Table.Transaction, row)
-            if len(self._db.fetch(Table.Transaction, where=where)) > 1:
+            if self._get_pk_key(row) in double_keys:
                 count += 1
+                where = model.get_pk_atts_from_row(Table.Transaction, row)
                 where_clause = ', '.join([str(att.value) for att in where])
                 message = f'Record "{Color.GREEN}{where_clause}{Color.NC}" lijkt een {Color.ORANGE}dubbel{Color.NC}.'
                 out_rows.append([remove_color_code(message)])
@@ -227,15 +333,38 @@ class ImportManager(BaseManager):
         csvm.write_rows(out_rows, open_mode='w', data_path=f'{self._session.output_dir}{DOUBLES_CSV}')
         return count
 
-    def import_bank_transactions(self, db):
+    @staticmethod
+    def _get_pk_key(row) -> tuple:
+        """ Hashable PK of a Transaction row (without Id) """
+        return tuple(row[c] for c in TX_pk_colnos)
+
+    def _get_double_keys(self, rows) -> set:
+        """ PK's that occur more than once. One pass over the rows instead of one query per row. """
+        counts = Counter(self._get_pk_key(row) for row in rows)
+        return {key for key, count in counts.items() if count > 1}
+
+    def import_bank_transactions(self, db, incremental=False) -> int:
         """
         a. Import user bank transactions into table Transactions in the original raw format.
         b. Add non-existing CounterAccounts to the database (with booking=EMPTY)
+        incremental: Skip unchanged files, and rows that already exist.
+        @return: Number of imported transactions
         """
         counter_accounts = {}
-        # Populate transaction files (Checking has been done before).
-        self._validation_manager.validate_config_dir(CF_INPUT_DIR)
+        import_file_io = ImportFileIO()
+        # Populate transaction files (Checking has been done before, in start).
+        if not self._validation_manager.transaction_files:
+            self._validation_manager.validate_config_dir(CF_INPUT_DIR)
         TransactieFiles = sorted(self._validation_manager.transaction_files.values(), key=lambda m: m.key)
+
+        # Incremental: only new or changed files, and only rows that are not imported yet.
+        existing_counts = Counter()
+        if incremental:
+            imported_files = import_file_io.get_imported_files()
+            TransactieFiles = [M for M in TransactieFiles if not import_file_io.is_unchanged(M.path, imported_files)]
+            if TransactieFiles:
+                existing_counts = Counter(
+                    self._get_pk_key(row) for row in db.fetch(Table.Transaction, mode=FetchMode.WholeTable))
         if len(TransactieFiles) > 1 and not self._session.CLI_mode:
             from src.VL.Windows.General.MessageBox import MessageBox
             MessageBox().message_box(f'Een moment geduld a.u.b...\n'
@@ -243,45 +372,32 @@ class ImportManager(BaseManager):
                         f'Daarna wordt de app opnieuw gestart.')
 
         # a. Import transactie csv files in DB.
-        #    N.B. Validation has been done already.
-        self._amounts_are_signed = False
-        for i in range(len(TransactieFiles)):
-            # Read csv file definition
-            M = TransactieFiles[i]
-            colnos = M.colno_mapping  # { model_colno: csv_colno } (zero_based)
-            d = {TX_dict[m]: c for m, c in colnos.items()}
-            # Read csv file
-            csv_rows = csvm.get_rows(data_path=M.path, delimiter=M.delimiter)
-            # Bepaal datum formaat over max. 1000 regels.
-            date_format = try_to_get_date_format(csv_rows, d[FD.Date], M.path)
-            # Format rows
+        #    N.B. The headers have been validated already. Every file is read once.
+        self._amounts_are_signed = incremental and (db.fetch_min(Table.Transaction, FD.Amount) or 0) < 0
+        count = 0
+        for M, rows, accounts, file_counter_accounts in self._parse_transaction_files(TransactieFiles):
             out_rows = []
-            for row in csv_rows:
-                amount = toFloat(row[d[FD.Amount]], comma_source=self._comma_source)
-                # Sanitize amount
-                row[d[FD.Amount]] = amount
+            for out_row in rows:
                 # Remember if amount is signed
-                if not self._amounts_are_signed and amount < 0:
+                if not self._amounts_are_signed and out_row[c_TX_amount] < 0:
                     self._amounts_are_signed = True
-                # Remember Accounts
-                self._account_io.add_account_to_cache(row[d[FD.Account_number]])
-                # Remember CounterAccounts (first one)
-                counter_account_number = row[d[FD.Counter_account_number]]
-                if counter_account_number and counter_account_number not in counter_accounts:
-                    counter_accounts[counter_account_number] = [row[d[FD.Name]], row[d[FD.Comments]]]
-                # Map csv to model
-                # (optional csv col is substituted by EMPTY, e.g. "TransactionCode" not present)
-                out_row = []
-                for colno, att_name in TX_dict.items():
-                    if colno in colnos:
-                        out_row.append(row[colnos[colno]])
-                    else:
-                        # Derived: date format
-                        out_row.append(date_format if att_name == FD.Date_format else EMPTY)
+                # Skip existing row (incremental)
+                if existing_counts:
+                    key = self._get_pk_key([0] + [sanitize_text(v) if isinstance(v, str) else v for v in out_row])
+                    if existing_counts[key] > 0:
+                        existing_counts[key] -= 1
+                        continue
                 # Add row
                 out_rows.append(out_row)  # More redundant fields may have been added
+                if len(out_rows) == INSERT_BATCH_SIZE:
+                    count += self._insert_transactions(db, out_rows)
+                    out_rows = []
             # Insert into Transaction
-            db.insert_many(Table.Transaction, out_rows, add_audit_values=True, pgm=PGM)
+            count += self._insert_transactions(db, out_rows)
+            import_file_io.save(import_file_io.get_fingerprint(M.path))
+            # Remember Accounts and CounterAccounts (first one) in file order
+            [self._account_io.add_account_to_cache(account_number) for account_number in accounts]
+            [counter_accounts.setdefault(k, v) for k, v in file_counter_accounts.items()]
 
         # b. Add accounts.
         self._account_io.persist_accounts()
@@ -296,260 +412,78 @@ class ImportManager(BaseManager):
                     account_name=row[0],
                     first_comment=row[1])
             )
-        return
-
-    def _set_search_booking_codes(self, te_row):
-        self._unique_account_bban.add(te_row[TE_dict[FD.Account_bban]])
-        self._unique_year.add(te_row[TE_dict[FD.Year]])
-        self._unique_counter_account_id.add(te_row[TE_dict[FD.Counter_account_id]])
-        self._unique_transaction_code.add(te_row[TE_dict[FD.Transaction_code]])
-        self._unique_mutation_type.add(te_row[TE_dict[FD.Transaction_type]])
+        return count
 
-    def _save_combo_data(self):
-        FF = Table.FlatFiles
-        # Account number
-        [self._db.insert(FF, [FD.Account_number, value], pgm=PGM) for value in self._unique_account_bban if value]
+    def _parse_transaction_files(self, transaction_files):
+        """
+        Per file in the specified order: (file, rows, account numbers, counter_accounts).
+        With 1 worker the files are streamed, else they are parsed in a process pool.
+        """
+        workers = self._get_worker_count(len(transaction_files))
+        if workers <= 1:
+            for M in transaction_files:
+                accounts, counter_accounts = {}, {}
+                # The accounts are complete after the rows have been read.
+                yield M, parse_transaction_file(M, self._comma_source, accounts, counter_accounts), \
+                    accounts, counter_accounts
+            return
+        from concurrent.futures import ProcessPoolExecutor  # Not needed at start-up (CLI)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                parse_transaction_file_in_process, transaction_files, [self._comma_source] * len(transaction_files))
+            for M, (rows, accounts, counter_accounts) in zip(transaction_files, results):
+                yield M, rows, accounts, counter_accounts
 
-        # Year
-        [self._db.insert(FF, [FD.Year, value], pgm=PGM) for value in self._unique_year if value]
+    @staticmethod
+    def _insert_transactions(db, rows) -> int:
+        db.insert_many(Table.Transaction, rows, add_audit_values=True, pgm=PGM)
+        return len(rows)
 
+    def _save_combo_data(self):
+        """ Combo box values (FlatFiles) from all enriched transactions and bookings, in 1 insert. """
+        kv_pairs = [[key, row[0]] for key, sql_stmt in SQL_COMBO_VALUES.items()
+                    for row in self._db.fetch_query(sql_stmt) if row[0]]
         # Counter account number (incl. *Leeg* and *Niet leeg*)
-        [self._db.insert(FF, [FD.Counter_account_number, self._db.fetch_value(
-            Table.CounterAccount, name=FD.Counter_account_number, where=[Att(FD.ID, value)])], pgm=PGM)
-         for value in self._unique_counter_account_id if value > 0]
-        self._db.insert(FF, [FD.Counter_account_number, LEEG], pgm=PGM)
-        self._db.insert(FF, [FD.Counter_account_number, NIET_LEEG], pgm=PGM)
-
-        # Transaction code
-        [self._db.insert(FF, [FD.Transaction_code, value], pgm=PGM) for value in self._unique_transaction_code if value]
-
-        # Transaction type
-        [self._db.insert(FF, [FD.Transaction_type, value], pgm=PGM) for value in self._unique_mutation_type if value]
+        kv_pairs.append([FD.Counter_account_number, LEEG])
+        kv_pairs.append([FD.Counter_account_number, NIET_LEEG])
+        self._db.clear(Table.FlatFiles)
+        self._db.insert_many(Table.FlatFiles, kv_pairs, pgm=PGM)
 
-        # Booking type
-        [self._unique_booking_types.add(r[bk_dict[FD.Booking_type]]) for r in self._db.fetch(Table.BookingCode)]
-        [self._db.insert(FF, [FD.Booking_type, value], pgm=PGM) for value in self._unique_booking_types if value]
-
-    def create_enriched_mutations(self, db):
+    def create_enriched_mutations(self, db, where=None):
         """
         Populate table TransactionEnriched from Transactions and CounterAccount.
+        where: Only enrich these Transactions (incremental import). Default is all.
         """
-        mapping = {}
-        derived = {}
-
-        # get enriched { name: colno } sorted by colno (zero-based)
-
-        TX_dict_1 = model.get_colno_per_att_name(Table.Transaction, zero_based=False)
-        for name, seqno in TE_dict.items():
-            if name in TX_dict_1:
-                mapping[seqno] = TX_dict_1[name]
-            else:
-                derived[name] = [seqno, UNKNOWN]
-                mapping[seqno] = -1
-
-        c_bban = TE_dict[FD.Account_bban]
-        c_counter_account_id = TE_dict[FD.Counter_account_id]
-        c_booking_code = TE_dict[FD.Booking_code]
-        c_booking_id = TE_dict[FD.Booking_id]
-        c_name = TE_dict[FD.Name]
-        c_comments = TE_dict[FD.Comments]
-        c_transaction_code = TE_dict[FD.Transaction_code]
-        c_add_sub = TE_dict[FD.Add_Sub]
-        c_amount = TE_dict[FD.Amount]
-        c_amount_signed = TE_dict[FD.Amount_signed]
-        c_remarks = TE_dict[FD.Remarks]
-        i_date = TX_dict_1[FD.Date]
-        i_date_format = TX_dict_1[FD.Date_format]
-
-        out_rows = []
-        TX_rows = db.fetch(Table.Transaction, mode=FetchMode.WholeTable)
+        TX_rows = db.fetch(Table.Transaction, where=where, mode=FetchMode.WholeTable)
+        out_rows = self._enrich(self._get_enricher(TX_rows), TX_rows)
 
-        # Transactie
-        for row in TX_rows:
-            out_row = [row[mapping[c_enriched]] for name, c_enriched in TE_dict.items()]
-
-            # Datum: convert to yyyy-mm-dd
-            date = format_date(row[i_date], input_format=row[i_date_format], output_format='YMD')
-            if not is_formatted_ymd(date):
-                raise GeneralException(f'{PGM}: Datum "{row[i_date]}" is ongeldig in {Table.Transaction}.')
-
-            date_target = int(date.replace('-', EMPTY))
-            out_row[1] = date_target
-            out_row[TE_dict[FD.Year]] = int(date[:4])
-            out_row[TE_dict[FD.Month]] = int(date[5:7])
-
-            # Rekening (Bban)
-            bban, iban = self._account_io.get_bban_iban_from_account_number(row[TX_dict_1[FD.Account_number]])
-            out_row[c_bban] = bban
-
-            # Naam
-            out_row[c_name] = row[TX_dict_1[FD.Name]]
-
-            # Tegenrekening (FK)
-            counter_account_number = row[TX_dict_1[FD.Counter_account_number]]
-            counter_account_id = db.fetch_id(
-                Table.CounterAccount, where=[Att(FD.Counter_account_number, counter_account_number)])
-            out_row[c_counter_account_id] = counter_account_id
-
-            # Comments
-            comments = out_row[c_comments]
-
-            # Bedrag (unsigned)
-            amount = str(out_row[c_amount])
-            add_sub = out_row[c_add_sub]
-            sign = EMPTY  # No sign = "+"
-            if self._amounts_are_signed:
-                if '-' in amount:
-                    sign = '-'
-                    amount = amount.strip('-')
-            else:  # Separate Af/Bij column (ING)
-                if add_sub.lower() not in ('bij', 'credit'):
-                    sign = '-'
-
-            out_row[c_amount] = float(amount)
-
-            # BedragSigned
-            amount_signed = f'{sign}{amount}'
-            out_row[c_amount_signed] = float(amount_signed)
-
-            # Add/sub
-            if not out_row[c_add_sub]:
-                out_row[c_add_sub] = AMOUNT_MINUS if sign else AMOUNT_PLUS
-
-            # Boeking
-            # - Bedrag lager dan drempel
-            if self._threshold_to_other_min < out_row[c_amount] < self._threshold_to_other_pos:
-                protected_maingroup = OTHER_COSTS if sign else OTHER_REVENUES
-                booking_code = BCM.get_protected_booking_code(protected_maingroup)
-            else:
-                # - Initialiseer eerst vanuit UserMutations, dan SearchTerms, dan BookingCode
-                booking_code = UMC.get_booking_code(bban, str(date_target), counter_account_number, comments)
-                if not booking_code:
-                    booking_code = STM.get_booking_code(row[TX_dict_1[FD.Name]], row[TX_dict_1[FD.Comments]])
-                if not booking_code:
-                    booking_code = BCM.get_booking_code(row[TX_dict_1[FD.Name]], row[TX_dict_1[FD.Comments]])
-
-                # - Nog geen boeking en ook geen tegenrekening, dan "Overige uitgaven"/"Overige inkomsten".
-                if not booking_code and not counter_account_number:
-                    protected_maingroup = OTHER_COSTS if sign else OTHER_REVENUES
-                    booking_code = BCM.get_protected_booking_code(protected_maingroup)
-
-            booking_id = db.fetch_id(Table.BookingCode, where=[Att(FD.Booking_code, booking_code)]) \
-                if booking_code else 0
-
-            out_row[c_booking_code] = booking_code  # derived
-            out_row[c_booking_id] = booking_id
-
-            te_key = get_te_key(bban, date_target, counter_account_number, comments)
-            # Remarks
-            out_row[c_remarks] = UMC.get_remarks(te_key)
-
-            # Betaalpas data
-            if out_row[c_transaction_code] == 'BA':
-                kwargs = {'mededelingen': comments}
-                if comments.lower().lstrip().startswith('pasvolgnr'):
-                    pasvolgnr, date, tijd = self._get_pas_data('A', **kwargs)
-                elif comments.find('***') > -1:
-                    pasvolgnr, date, tijd = self._get_pas_data('B', **kwargs)
-                else:
-                    pasvolgnr, date, tijd = self._get_pas_data('C', **kwargs)
-                if out_row[c_booking_id] <= 0:  # Nog geen rekening booking
-                    out_row[c_booking_id] = 0
-            else:
-                pasvolgnr, date, tijd = EMPTY, EMPTY, EMPTY
-
-            out_row[TE_dict[FD.Transaction_date]] = date
-            out_row[TE_dict[FD.Transaction_time]] = tijd
-
-            # Add the ME-row
-            out_rows.append(out_row)
-
-            # Set search bookings
-            self._set_search_booking_codes(out_row)
+        for out_row in out_rows:
+            self._enriched_years.add((out_row[TE_dict[FD.Account_bban]], out_row[TE_dict[FD.Year]]))
 
         sorted_out_rows = sorted(out_rows, key=lambda r: r[0])
         db.insert_many(Table.TransactionEnriched, sorted_out_rows, add_audit_values=True, pgm=PGM)
 
-    def _get_pas_data(self, format_char, mededelingen) -> (str, str, str):
-        pasvolgnr, datum, tijd = EMPTY, EMPTY, EMPTY  # output
-
-        if format_char == 'A':
-            # Example (Mededelingen):
-            # "Pasvolgnr:001 13-01-2020 23:37 Transactie:12Z9V4 Term:1F7Z01"
-            # " PASVOLGNR 002     23-05-2019 14:51 TRANSACTIENR 1234567"
-            s = mededelingen.lower().find('pasvolgnr')
-            if s > -1:
-                pasvolgnr, s = self._get_pasvolgnr(mededelingen, s + 10)
-                datum, tijd = self._get_datum_tijd(mededelingen)
-
-        # Example: (Mededelingen)
-        # "1234567 MIJN CLUB LEIDEN>LEIDEN PASNR ***A001 23-06-2019 16:39 TRANSACTIENR 1234567"
-        elif format_char == 'B':
-            s = mededelingen.find('***')
-            if s > -1 and s + 4 < len(mededelingen):
-                pasvolgnr, e = self._get_pasvolgnr(mededelingen, s + 4)
-                datum, tijd = self._get_datum_tijd(mededelingen)
-
-        # Example (Naam, Mededelingen):
-        # "19-07-99 18:12 BETAALAUTOMAAT", " SUPERMARKT / AMSTERDAM 001 123456 1234567 ING BANK NV PASTRANSACTIES"
-        else:
-            s = 0
-            while pasvolgnr == EMPTY and -1 < s < len(mededelingen):
-                s = mededelingen.find(BLANK, s)
-                if s > -1:
-                    s = skip_blanks(mededelingen, s)
-                    pasvolgnr, s = self._get_pasvolgnr(mededelingen, s)
-            datum, tijd = self._get_datum_tijd(mededelingen)
-
-        return pasvolgnr, datum, tijd
-
-    @staticmethod
-    def _get_pasvolgnr(value, s) -> (str, int):
-        pasvolgnr = EMPTY
-        # look for 3 consecutive numbers...
-        e = s
-        while e < len(value) and '0' <= value[e] <= '9':
-            e += 1
-        # ... followed by space
-        if e - s == 3 and e < len(value) and value[e] == BLANK:
-            pasvolgnr = value[s:e]  # found!
-        # Skip blanks
-        e = skip_blanks(value, e)
-        return pasvolgnr, e
-
-    @staticmethod
-    def _get_datum_tijd(value) -> (str, str):
-        datum, tijd = EMPTY, EMPTY  # output
-
-        # Find "-xx-"
-        s = 0
-        found = False
-        while not found and -1 < s < len(value):
-            s = value.find('-', s)
-            if s == -1:
-                break
-            if s < len(value) - 3 and value[s + 3] == '-':
-                found = True
-            else:
-                s += 1  # skip '-'
-
-        if found:
-            dd = value[s - 2:s]
-            mm = value[s + 1:s + 3]
-            jjjj = f'20{value[s + 4:s + 6]}' if value[s + 6] == BLANK else f'{value[s + 4:s + 8]}'
-
-            d = f'{jjjj}{mm}{dd}'
-            if isInt(d):
-                # Transactiedatum
-                datum = f'{jjjj}-{mm}-{dd}'
-
-            # Tijd
-            s = (s + 7) if value[s + 6] == BLANK else (s + 9)
-            hh = value[s:s + 2]
-            mm = value[s + 3:s + 5]
-            t = f'{hh}{mm}'
-            if isInt(t):
-                # Transactietijd
-                tijd = f'{hh}:{mm}'
-
-        return datum, tijd
+    def _get_enricher(self, TX_rows) -> Enricher:
+        """ Snapshot of the lookups that are needed to enrich the Transactions. """
+        bban_per_account_number = {}
+        for row in TX_rows:
+            account_number = row[c_TX_account_number]
+            if account_number not in bban_per_account_number:
+                bban_per_account_number[account_number], _ = \
+                    self._account_io.get_bban_iban_from_account_number(account_number)
+        return EnrichmentManager().get_enricher(self._amounts_are_signed, bban_per_account_number)
+
+    def _enrich(self, enricher, TX_rows) -> list:
+        """ With more than 1 worker, chunks of Transactions are enriched in a process pool. In the same order. """
+        workers = self._get_worker_count(-(-len(TX_rows) // ENRICH_CHUNK_SIZE))
+        if workers <= 1:
+            return enricher.enrich(TX_rows)
+        chunks = [TX_rows[i:i + ENRICH_CHUNK_SIZE] for i in range(0, len(TX_rows), ENRICH_CHUNK_SIZE)]
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(
+                max_workers=workers, initializer=set_worker_enricher, initargs=(enricher,)) as executor:
+            return [out_row for out_rows in executor.map(enrich_in_process, chunks) for out_row in out_rows]
+
+    def _get_worker_count(self, task_count) -> int:
+        """ Processes to use for the number of tasks, 1 = serial. """
+        return min(max(int(self._CM.get_config_item(CF_IMPORT_WORKERS, 1)), 1), task_count)
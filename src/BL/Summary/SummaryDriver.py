@@ -5,24 +5,32 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2023-10-30 PHe First creation
+# 2026-10-18 PHe Annual account plus: the summaries are created at the same time (CF_SUMMARY_JOBS)
+# 2026-10-18 PHe No completion message if a summary has failed
 # ---------------------------------------------------------------------------------------------------------------------
+from concurrent.futures import ThreadPoolExecutor
+
 from src.BL.Summary.SearchResults import SearchResults
 from src.BL.Summary.Templates.AnnualAccount import AnnualAccount
 from src.BL.Summary.Templates.PeriodicAccount import PeriodicAccount
 from src.BL.Summary.Templates.ResultPerBookingCode import ResultsPerBookingCode
+from src.BL.Summary.Templates.TemplateBase import TemplateBase
 from src.Base import Base
 from src.DL.Config import CF_SUMMARY_YEAR, CF_SUMMARY_MONTH_FROM, CF_SUMMARY_MONTH_TO, \
-    CF_SUMMARY_OPENING_BALANCE
+    CF_SUMMARY_OPENING_BALANCE, CF_SUMMARY_JOBS
 from src.DL.Enums.Enums import Summary
 from src.DL.IO.OpeningBalanceIO import OpeningBalanceIO
 from src.DL.Lexicon import TEMPLATE_ANNUAL_ACCOUNT, SEARCH_RESULT, YEAR, \
     TEMPLATE_NAME, TEMPLATE_PERIODIC_ACCOUNT, TEMPLATE_REALISATION_PER_BOOKING_CODE, MONTH_FROM, MONTH_TO, SUMMARY, \
     SUMMARIES
+from src.DL.UserCsvFiles.Cache.BookingCodeCache import Singleton as BookingCodeCache
 from src.GL.Enums import MessageSeverity
 from src.GL.Functions import toFloat
 from src.GL.GeneralException import GeneralException
 from src.GL.Result import Result
 
+BCM = BookingCodeCache()
+
 
 class SummaryDriver(Base):
 
@@ -69,9 +77,7 @@ class SummaryDriver(Base):
 
             # D. Annual account Plus
             elif summary_type == Summary.AnnualAccountPlus:
-                export_count += self._produce_csv_files(Summary.AnnualAccount, iban, year)
-                export_count += self._produce_csv_files(Summary.RealisationPerBookingCode, iban, year)
-                export_count += self._produce_csv_files(Summary.PeriodicAccount, iban, year, 1, 12)
+                export_count += self._produce_annual_account_plus(iban, year)
 
             # E. Realisation per booking code
             elif summary_type == Summary.RealisationPerBookingCode:
@@ -79,7 +85,9 @@ class SummaryDriver(Base):
             else:
                 raise GeneralException(f'Overzicht "{summary_type}" wordt niet ondersteund.')
 
-            # Completion
+            # Completion (not if a summary has failed)
+            if self._result.ER:
+                return self._result
             prefix = f'{SUMMARY} is' if export_count == 1 else f'{export_count} {SUMMARIES} zijn'
             self._result.add_message(f'{prefix} geëxporteerd naar "{self._session.export_dir}"')
 
@@ -92,8 +100,52 @@ class SummaryDriver(Base):
         """
         Also called via pm.py and UT, so should contain all parameters.
         """
-        export_count = 0
         summary_type = summary_type or self._summary_type
+        template = self._get_template(summary_type, iban, year, month_from, month_to)
+        if not template:
+            return 0
+        self._result = self._export(template, year, month_from, month_to) or self._result
+        return template.export_count
+
+    def _produce_annual_account_plus(self, iban=None, year=None) -> int:
+        """
+        Annual account, realisation per booking code and the periodic accounts of the year.
+        They only read the database and each write their own csv files, so they can be exported
+        at the same time: each in a worker thread, with its own read connection and result.
+        The results are merged in this order, whatever the order of completion.
+        """
+        parts = [(Summary.AnnualAccount, 0, 0), (Summary.RealisationPerBookingCode, 0, 0),
+                 (Summary.PeriodicAccount, 1, 12)]
+        # Validate and prepare in this thread (config, session, csv reader and caches are shared).
+        BCM.initialize()
+        templates = [self._get_template(summary_type, iban, year, month_from, month_to)
+                     for summary_type, month_from, month_to in parts]
+
+        def export(i) -> Result:
+            month_from, month_to = parts[i][1:]
+            if not templates[i]:
+                return Result()
+            try:
+                return self._export(templates[i], year, month_from, month_to) or Result()
+            except GeneralException as e:
+                return Result(text=e.message, severity=MessageSeverity.Error)
+            finally:
+                self._session.db.close_reader()
+
+        jobs = min(max(int(self._CM.get_config_item(CF_SUMMARY_JOBS, 1)), 1), len(parts))
+        if jobs == 1:
+            results = [export(i) for i in range(len(parts))]
+        else:
+            with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='Summary') as executor:
+                results = list(executor.map(export, range(len(parts))))
+
+        # Merge
+        self._result = Result()
+        [self._result.add_messages(result.yield_messages()) for result in results]
+        return sum(template.export_count for template in templates if template)
+
+    def _get_template(self, summary_type, iban, year, month_from=0, month_to=0) -> TemplateBase or None:
+        """ Validate the parameters and the template. """
         self._result = Result()
 
         # Validation
@@ -108,13 +160,11 @@ class SummaryDriver(Base):
         # "Jaarrekening t/m maand x"
         if summary_type == Summary.AnnualAccount:
             self._AA = AnnualAccount(iban, template_filename, self._CLI_mode)
-            self._result = self._AA.export(year)
-            return self._AA.export_count
+            return self._AA
 
         elif summary_type == Summary.RealisationPerBookingCode:
             self._BR = ResultsPerBookingCode(iban, template_filename, self._CLI_mode)
-            self._result = self._BR.export(year)
-            return self._BR.export_count
+            return self._BR
 
         # Periodic summary
         elif summary_type == Summary.PeriodicAccount:
@@ -122,17 +172,23 @@ class SummaryDriver(Base):
             self._required_parm(prefix, MONTH_FROM, month_from)
             self._required_parm(prefix, MONTH_TO, month_to)
             if not self._result.OK:
-                return 0
+                return None
 
-            # Export
             if self._CLI_mode:
                 opening_balance = OpeningBalanceIO().get_opening_balance(year)
             else:
                 opening_balance = toFloat(self._CM.get_config_item(CF_SUMMARY_OPENING_BALANCE))
 
             self._PA = PeriodicAccount(iban, opening_balance, template_filename, self._CLI_mode)
-            self._PA.export(year, month_from, month_to)
-            return self._PA.export_count
+            return self._PA
+
+    @staticmethod
+    def _export(template, year, month_from=0, month_to=0) -> Result or None:
+        """ The messages of the periodic account (per file) are only logged, as before. """
+        if isinstance(template, PeriodicAccount):
+            template.export(year, month_from, month_to)
+            return None
+        return template.export(year)
 
     def _required_parm(self, prefix, name, value):
         if not value:
@@ -4,7 +4,6 @@ from src.BL.Functions import get_summary_filename
 from src.BL.Summary.SummaryBase import BCM, csvm
 from src.BL.Summary.Templates.Enums import DetailTotalVars, DetailVars
 from src.BL.Summary.Templates.TemplateBase import TemplateBase, get_total_label
-from src.DL.Enums.Enums import BookingType
 from src.DL.IO.AnnualAccountIO import AnnualAccountIO
 from src.DL.Lexicon import TEMPLATE_ANNUAL_ACCOUNT, TRANSACTIONS, REALISATION
 from src.GL.Const import EMPTY
@@ -58,23 +57,18 @@ class AnnualAccount(TemplateBase):
         self._analyze_template()
 
         # Merge generated realisation from db with annual budgets from 'Jaarrekening.csv'
-        #  Validate.
-        realisation_rows = self._transactions_io.get_realisation_data(self._iban, self._year)
-        overbooking_rows = self._transactions_io.get_realisation_data(self._iban, self._year, is_overbooking=True)
-        if not realisation_rows and not overbooking_rows:
+        #  Validate. Realisation and overbookings are selected together.
+        realisation = self._transactions_io.get_realisation_data(self._iban, self._year)
+        if not realisation[False] and not realisation[True]:
             self._add_block([])  # Force exception
 
-        # Exclude overbookings Re-select data to get the total.
-        rows = self._transactions_io.get_realisation_data(self._iban, self._year)
-        sorted_bookings = self._get_merged_bookings(
-            [row for row in rows if row[0] != BookingType.Overbookings])
+        # Exclude overbookings
+        sorted_bookings = self._get_merged_bookings(realisation[False])
         self._add_block(sorted_bookings, allow_empty=True)
         self._add_general_total()
 
-        # Overbookings (no general total). Re-select data to get the total.
-        rows = self._transactions_io.get_realisation_data(self._iban, self._year, is_overbooking=True)
-        sorted_bookings = self._get_merged_bookings(
-            [row for row in rows if row[0] == BookingType.Overbookings], is_overbooking=True)
+        # Overbookings (no general total)
+        sorted_bookings = self._get_merged_bookings(realisation[True], is_overbooking=True)
         self._add_block(sorted_bookings, allow_empty=True)
 
         # Write CSV
@@ -99,8 +93,9 @@ class AnnualAccount(TemplateBase):
         if not realisation_rows:
             return []
 
+        total_amount_db = self._transactions_io.realisation_totals[is_overbooking]
         total_amount = sum(row[3] for row in realisation_rows)
-        self._x_check(self._transactions_io.total_amount, total_amount, 'Ophalen Realisatie data')
+        self._x_check(total_amount_db, total_amount, 'Ophalen Realisatie data')
 
         # Merge on type, maingroup, subgroup.
         amounts = {}
@@ -135,7 +130,7 @@ class AnnualAccount(TemplateBase):
 
         # X-check
         total_amount = sum(row[3] for row in sorted_bookings)
-        self._x_check(self._transactions_io.total_amount, total_amount, 'Merge Realisatie en Budget')
+        self._x_check(total_amount_db, total_amount, 'Merge Realisatie en Budget')
 
         return sorted_bookings
 
@@ -203,7 +198,7 @@ class AnnualAccount(TemplateBase):
         # Check-check-double-check
         if self._total_amounts[DetailTotalVars.General]:
             total_general = round(self._total_amounts[DetailTotalVars.General][0], 2)
-            self._x_check(self._transactions_io.total_amount, total_general, 'Export naar CSV')
+            self._x_check(self._transactions_io.realisation_totals[False], total_general, 'Export naar CSV')
 
     @staticmethod
     def _x_check(total_amount_db, total_amount_processed, step_name=None):
@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from datetime import datetime
 
 from src.BL.Summary.SummaryBase import csvm, BCM
@@ -49,6 +50,8 @@ class PeriodicAccount(TemplateBase):
         self._closing_balance = 0.0
         self._total_costs = 0.0
         self._total_revenues = 0.0
+        self._transactions = []  # The year in date order
+        self._month_offsets = []  # Per month the index of its first transaction, then the end.
 
     def _initialize_year(self):
         self._opening_balance = self._opening_balance_start_of_year
@@ -63,6 +66,12 @@ class PeriodicAccount(TemplateBase):
         self._month_from = month_from
         self._month_to = month_to if month_to else month_from
 
+        # Get the transactions of the year once. The periods are sliced from it.
+        self._transactions = self._transactions_io.get_transactions(
+            self._iban, self._year, 1, 12, order_by=[[Att(FD.Date), 'ASC']])
+        months = [row[self._te_def[FD.Month]] for row in self._transactions]
+        self._month_offsets = [bisect_left(months, m) for m in range(1, 14)]
+
         # Export per month, quarter, semester
         self._initialize_year()
         [self._export(m + 1) for m in range(12)]
@@ -83,8 +92,7 @@ class PeriodicAccount(TemplateBase):
         self._month_to_current = month_to
 
         # Get the transactions for the period.
-        transactions = self._transactions_io.get_transactions(
-            self._iban, self._year, month, month_to, order_by=[[Att(FD.Date), 'ASC']])
+        transactions = self._transactions[self._month_offsets[month - 1]:self._month_offsets[month_to or month]]
 
         # Get the period totals.
         c_amount = self._te_def[FD.Amount_signed]
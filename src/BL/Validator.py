@@ -5,7 +5,9 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2018-12-20 PHe First creation
+# 2026-10-18 PHe Keep the toggled delimiter of comma separated files
 # ---------------------------------------------------------------------------------------------------------------------
+from itertools import islice
 from os import listdir
 
 from src.Base import Base
@@ -73,7 +75,7 @@ class Validator(Base):
                 bullets = '\n    o  '.join([f for f in self._invalid_input_filenames])
                 problem = f'Probleem:\nDe folder bevat ongeldige items zoals:\n    o  {bullets}'
 
-            if problem:
+            if not problem:
                 # Analyze bank transaction csv files
                 try:
                     # Create sorted dir-list of valid files (only header-check, not in-depth)
@@ -162,17 +164,21 @@ class Validator(Base):
     @staticmethod
     def _get_valid_transaction_csv_file(input_dir, filename) -> TransactionFile:
         """
-        Validate transaction csv file. Check header and no of columns in every row.
+        Validate transaction csv file. Check header and the no. of columns in the 1st row.
+        The no. of columns in the other rows is checked during the import, which reads the file only once.
         """
         path = f'{input_dir}{filename}'
 
-        # 1. Get rows
-        delimiter = ',' if len(CsvManager().get_first_row(data_path=path, delimiter=';')) == 1 else ';'
-        inp_rows = CsvManager().get_rows(include_header_row=True, data_path=path, delimiter=delimiter)
-        if not inp_rows or len(inp_rows) < 2:
+        # 1. Get header and 1st row
+        # The delimiter is toggled when ";" yields 1 column. Streaming (in the import too) does not toggle.
+        csvm = CsvManager()
+        csvm.get_first_row(data_path=path, delimiter=';')
+        delimiter = csvm.delimiter
+        inp_rows = list(islice(csvm.stream_rows(include_header_row=True, data_path=path, delimiter=delimiter), 2))
+        if len(inp_rows) < 2:
             raise GeneralException(f'Geen regels gevonden in {TRANSACTION} "{filename}".')
-        if any(len(r) != len(inp_rows[0]) for r in inp_rows):
-            raise GeneralException(f'Niet alle regels bevatten even veel cellen in bestand "{filename}".')
+        if len(inp_rows[1]) != len(inp_rows[0]):
+            raise GeneralException(get_column_count_error(filename))
 
         # 2. Check header
         try:
@@ -180,4 +186,8 @@ class Validator(Base):
         except GeneralException as e:
             raise GeneralException(f'Ongeldig bestand "{filename}" gevonden.\n{e}')
 
-        return TransactionFile(path, colno_mapping=colno_mapping, delimiter=delimiter)
+        return TransactionFile(path, colno_mapping=colno_mapping, delimiter=delimiter, column_count=len(inp_rows[0]))
+
+
+def get_column_count_error(filename) -> str:
+    return f'Niet alle regels bevatten even veel cellen in bestand "{filename}".'
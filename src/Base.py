@@ -1,6 +1,7 @@
 from src.DL.Config import CF_OUTPUT_DIR
 from src.GL.BusinessLayer.ConfigManager import ConfigManager
 from src.GL.BusinessLayer.SessionManager import Singleton as Session
+from src.GL.Result import log
 
 PGM = 'Base'
 
@@ -25,3 +26,9 @@ class Base:
         self._CM.start_config()
         self._session = session
         self._session.start(self._CM.get_config_item(CF_OUTPUT_DIR), unit_test=self._CM.unit_test)
+
+    def _report_sql_trace(self):
+        """ SQL tracing enabled: log the top statements and write the statistics to the log folder. """
+        tracer = self._session.db.tracer if self._session.db else None
+        if tracer and self._session.log_dir:
+            [log(line) for line in tracer.write_report(self._session.log_dir, self._session.suffix)]
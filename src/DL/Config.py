@@ -50,9 +50,13 @@ CF_VERBOSE = 'CF_VERBOSE'
 CF_SHOW_ALL_POPUPS = 'CF_SHOW_ALL_POPUPS'
 CF_SHOW_BOOKING_CODE_AT_DESCRIPTION = 'CF_SHOW_BOOKING_CODE_AT_DESCRIPTION'
 CF_UNIT_TEST = 'CF_UNIT_TEST'
+CF_TRACE_SQL = 'CF_TRACE_SQL'
 CF_AUTO_CLOSE_TIME_S = 'CF_AUTO_CLOSE_TIME_S'
 CF_BACKUP_RETENTION_MONTHS = 'CF_BACKUP_RETENTION_MONTHS'
 CF_AMOUNT_THRESHOLD_TO_OTHER = 'CF_AMOUNT_THRESHOLD_TO_OTHER'
+CF_IMPORT_INCREMENTAL = 'CF_IMPORT_INCREMENTAL'
+CF_IMPORT_WORKERS = 'CF_IMPORT_WORKERS'
+CF_SUMMARY_JOBS = 'CF_SUMMARY_JOBS'
 CF_COMMA_REPRESENTATION_DB = 'CF_COMMA_REPRESENTATION_DB'
 CF_COMMA_REPRESENTATION_DISPLAY = 'CF_COMMA_REPRESENTATION_DISPLAY'
 
@@ -245,6 +249,7 @@ configDef = {
         _border(f'Toon de {BOOKING_CODE} bij de beschrijving.'),
         isBool),
     CF_UNIT_TEST: ConfigItem('Unit test', False, EMPTY, isBool),
+    CF_TRACE_SQL: ConfigItem('SQL statistieken', False, EMPTY, isBool),
     CF_AUTO_CLOSE_TIME_S: ConfigItem(
         'Berichten-box automatische sluittijd', 3,
         _border(
@@ -267,6 +272,27 @@ configDef = {
             f'Drempelbedrag. Als een bedrag tijdens de import lager is wordt het bij {OTHER_COSTS} '
             f'of {OTHER_REVENUES} geboekt.'
         ), isInt),
+    CF_IMPORT_INCREMENTAL: ConfigItem(
+        f'Importeer alleen nieuwe {TRANSACTIONS}', False,
+        _border(
+            f'Bij importeren worden alleen nieuwe of gewijzigde {CSV_FILE}en ingelezen.  \n'
+            f'  {TRANSACTIONS} die al in de database staan worden overgeslagen.  \n'
+            f'  Zet dit uit om alles opnieuw te importeren.'
+        ), isBool),
+    CF_IMPORT_WORKERS: ConfigItem(
+        'Aantal processen bij importeren', 1,
+        _border(
+            f'Het aantal {CSV_FILE}en met {TRANSACTIONS} dat tegelijk wordt ingelezen.  \n'
+            f'  Meer processen is sneller bij veel bestanden, als de computer meerdere kernen heeft.  \n'
+            f'    1=Eén voor één.'
+        ), isInt),
+    CF_SUMMARY_JOBS: ConfigItem(
+        'Aantal overzichten dat tegelijk wordt gemaakt', 1,
+        _border(
+            f'De jaarrekening, de realisatie per boekingscode en de periodieke overzichten  \n'
+            f'  worden tegelijk gemaakt, ieder in een eigen thread.  \n'
+            f'    1=Eén voor één.'
+        ), isInt),
     # Not user visible
     CF_COMMA_REPRESENTATION_DB: ConfigItem(
         'Komma representatie in de database.', COMMA_DB,
@@ -79,14 +79,13 @@ class Audit(object):
                 return [a.value for a in atts]
 
     def add_audit_values(self, audit_names, rows, pgm):
-        """ Add audit values to rows """
+        """ Add audit values to rows. All rows in the batch get the same values. """
         if not audit_names:
             return rows
-        out_rows = []
+        audit_values = self.get_audit_values(audit_names, add_quotes=False, pgm=pgm)
         for row in rows:
-            row.extend(self.get_audit_values(audit_names, add_quotes=False, pgm=pgm))
-            out_rows.append(row)
-        return out_rows
+            row.extend(audit_values)
+        return rows
 
     def add_audit_def(self, audit_names, table_def) -> dict:
         """ Add audit atts to table definition dict """
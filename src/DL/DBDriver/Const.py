@@ -13,6 +13,10 @@ VARCHAR = 'VARCHAR'
 
 DATABASE_IS_LOCKED = 'database is locked'
 
+# Rows per cursor.fetchmany batch and per page (keyset pagination)
+BATCH_SIZE = 500
+PAGE_SIZE = 200
+
 # - FFD/FD - File Field Definitions meta model
 FFD = 'FFD'
 FFD_TableName = 'TableName'
@@ -38,6 +42,7 @@ INCLUDE_DELETED = 'include_deleted'
 TABLE_DEF = 'table_def'
 PGM = 'pgm'
 INDEX_DEF = 'index_def'
+MATCH = 'match'
 ADD_DERIVED = 'add_derived'
 HAS_ID = 'has_id'
 MANY = 'many'
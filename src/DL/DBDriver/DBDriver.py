@@ -11,15 +11,28 @@
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2017-09-18 PHe First creation
 # 2022-08-14 PHe Revision, python 2.7 -> 3.10
+# 2026-10-18 PHe Values are bound as parameters, so sqlite can reuse the prepared statements
+# 2026-10-18 PHe Bulk load in 1 transaction
+# 2026-10-18 PHe Text indexes (FTS5)
+# 2026-10-18 PHe count_per: row counts per value in 1 grouped query
+# 2026-10-18 PHe Optional SQL tracing (SQLTracer)
+# 2026-10-18 PHe Where attribute with a list of values: IN
+# 2026-10-18 PHe fetch_batches (streaming cursor) and fetch_page (keyset pagination), fetch_sum
+# 2026-10-18 PHe Export to csv per batch
+# 2026-10-18 PHe Other threads than the writer read via an own read-only connection (ReadConnections)
 # ---------------------------------------------------------------------------------------------------------------------
 import csv
 import sqlite3 as lite
 import sys
+import threading
+from contextlib import contextmanager
 
 from .Audit import *
 from .Const import *
 from .Enums import *
 from .Functions import *
+from .ReadConnections import ReadConnections
+from .SQLTracer import SQLTracer, TracingCursor
 
 
 # noinspection SqlInjection
@@ -34,13 +47,17 @@ class DBDriver(object):
             db_path = f'{db_path}.db'
         self._con_name = os.path.basename(db_path)
         self._db_name, file_extension = os.path.splitext(self._con_name)
-        self._con = None
-        self._cur = None
+        self._writer_con = None
+        self._writer_cur = None
+        self._writer_thread = threading.get_ident()
+        self._readers = ReadConnections(self._db_path)
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._tracer = None
         self._transaction_mode = True
 
         self._table_defs = {}
         self._cache = {}
-        self._current_table_name = None
         self._index = 0
 
         self._FFD_FFD = {
@@ -58,13 +75,61 @@ class DBDriver(object):
 
     def _db_connect(self, memory=False):
         try:
-            self._con = lite.connect(MEMORY if memory else self._db_path, isolation_level='DEFERRED')
-            self._con.text_factory = str
-            self._cur = self._con.cursor()
-            self._con.execute('PRAGMA journal_mode = WAL')
+            self._writer_con = lite.connect(MEMORY if memory else self._db_path, isolation_level='DEFERRED')
+            self._writer_con.text_factory = str
+            self._writer_cur = self._writer_con.cursor()
+            if self._tracer:
+                self._writer_cur = TracingCursor(self._writer_cur, self._tracer)
+            self._writer_con.execute('PRAGMA journal_mode = WAL')
         except OSError as e:
             self._raise(f'DB could not be created in: "{self._db_path}". Reason: {e}')
 
+    # Connections
+    #   The thread that created the driver (the session) is the writer, it uses the only writable connection.
+    #   Other threads (e.g. workers of a summary) read via an own read-only connection to the same WAL database,
+    #   so they can query concurrently with each other and with the writer. Writing from them fails.
+
+    @property
+    def is_writer_thread(self) -> bool:
+        return threading.get_ident() == self._writer_thread
+
+    @property
+    def _con(self):
+        return self._writer_con if self.is_writer_thread else self._readers.connection()
+
+    @property
+    def _cur(self):
+        return self._writer_cur if self.is_writer_thread else self._readers.cursor(self._tracer)
+
+    @property
+    def _current_table_name(self):
+        """ Per thread, the table of the current CRUD action. """
+        return getattr(self._local, 'table_name', None)
+
+    def close_reader(self):
+        """ Close the read connection of the current thread, e.g. when a worker is done. """
+        if not self.is_writer_thread:
+            self._readers.close()
+
+    def close_readers(self):
+        """ Close the read connections of all other threads, when they are done. """
+        self._readers.close_all()
+
+    # Tracing
+
+    @property
+    def tracer(self) -> SQLTracer or None:
+        """ Statistics of the statements so far, if tracing is enabled. """
+        if self._tracer:
+            self._writer_cur.flush()
+        return self._tracer
+
+    def enable_tracing(self, tracer=None):
+        """ Record the statements. Without tracing the plain sqlite cursor is used, without overhead. """
+        self._tracer = tracer or SQLTracer()
+        if not isinstance(self._writer_cur, TracingCursor):
+            self._writer_cur = TracingCursor(self._writer_cur, self._tracer)
+
     def _set_ffd_table_def(self):
         """
         1. Create table FFD if it does not exist
@@ -86,11 +151,11 @@ class DBDriver(object):
         #
         if not table_name:
             return {}
-        sql_stmt = f'SELECT * FROM {FFD} WHERE {FFD_TableName}={quote(table_name)}'
+        sql_stmt = f'SELECT * FROM {FFD} WHERE {FFD_TableName}=?'
         try:
-            with self._con:
+            with self._transaction():
                 rows = []
-                self._cur.execute(sql_stmt)
+                self._cur.execute(sql_stmt, (table_name,))
                 while True:
                     row = self._cur.fetchone()
                     if not row:
@@ -138,7 +203,7 @@ class DBDriver(object):
             return []
         sql_stmt = f'SELECT * FROM {table_name}'
         try:
-            with self._con:
+            with self._transaction():
                 data = self._cur.execute(sql_stmt)
                 return data.description
         except Exception as e:
@@ -162,8 +227,12 @@ class DBDriver(object):
         table_def: is used only for create and csv-import
         audit_type: is used only for csv-import.
         """
-        self._current_table_name = table_name
+        self._local.table_name = table_name
+        # The definitions are shared by the threads.
+        with self._lock:
+            self._cache_table_def(table_name, table_def, audit_type)
 
+    def _cache_table_def(self, table_name, table_def=None, audit_type=None):
         # a. If hardcoded table_def specified (create table), always replace row-def.
         force_cache = False
         if table_def:
@@ -182,24 +251,25 @@ class DBDriver(object):
         if table_name in self._cache and not force_cache:
             return
 
-        # Populate the cache.
-        self._cache[table_name] = {
+        # Populate the cache. It is replaced as a whole, other threads may be reading it.
+        cache = {
             COL_NAMES: [], COL_TYPES: [], COL_LENGTHS: [], COL_DERIVEDS: [], COL_SANITIZABLES: [], COL_AUDIT_NAMES: []}
         for col_no, col in self._table_defs[table_name].items():
             col_type = col.type.upper()
-            self._cache[table_name][COL_NAMES].append(col.name.title())
-            self._cache[table_name][COL_TYPES].append(col_type)
-            self._cache[table_name][COL_LENGTHS].append(str(col.length))
-            self._cache[table_name][COL_DERIVEDS].append(col.derived)
+            cache[COL_NAMES].append(col.name.title())
+            cache[COL_TYPES].append(col_type)
+            cache[COL_LENGTHS].append(str(col.length))
+            cache[COL_DERIVEDS].append(col.derived)
             if col_type in AttType.sanitize_types:
-                self._cache[table_name][COL_SANITIZABLES].append(col_no - 1)  # 0-based
+                cache[COL_SANITIZABLES].append(col_no - 1)  # 0-based
 
         # Retrieve audit names from schema (except when creating a table via importing a csv)
         # NB. file may not exist yet. In that case if no definition too, no audit data.
         schema_names = self.get_schema_att_names(table_name)
         audit_names = get_audit_names_from_schema_names(schema_names) \
             if not audit_type else AUDIT_DEF.get(audit_type, [])
-        self._cache[table_name][COL_AUDIT_NAMES] = audit_names
+        cache[COL_AUDIT_NAMES] = audit_names
+        self._cache[table_name] = cache
 
     def _add_index(self):
         self._index += 1
@@ -249,7 +319,7 @@ class DBDriver(object):
                 # - Set cache to FFD
                 self._cache_table(FFD)
                 for att_no, att in table_def.items():
-                    sql_stmt = self._get_insert_stmt(
+                    sql_stmt, params = self._get_insert_stmt(
                         FFD,
                         [table_name,
                          att.name,
@@ -258,7 +328,7 @@ class DBDriver(object):
                          att.derived],
                         pgm=pgm
                     )
-                    self._execute(sql_stmt)
+                    self._execute(sql_stmt, params)
         except (IOError, DBException) as e:
             self._raise(f'{sql_stmt}. {e.args[0]}', method)
 
@@ -306,7 +376,7 @@ class DBDriver(object):
             self._execute(sql_stmt)
             # Delete table definition from FFD (except when FFD itself has been dropped ;-)
             if table_name != FFD:
-                self._execute(f'DELETE FROM {FFD} WHERE TableName="{table_name}"')
+                self._execute(f'DELETE FROM {FFD} WHERE {FFD_TableName}=?', (table_name,))
             # Delete table definition from memory
             self._table_defs.pop(table_name, EMPTY)
             self._cache.pop(table_name, EMPTY)
@@ -326,6 +396,51 @@ class DBDriver(object):
         sql_stmt = f'DROP INDEX IF EXISTS {index_name}'
         self._execute(sql_stmt)
 
+    def add_text_index(self, table_name, index_name, keys) -> bool:
+        """
+        Full-text index (FTS5, trigram) on the text columns of a table, kept in sync via triggers.
+        The index stores no copy of the text. Search it via fetch(..., match=[index_name, expression]).
+        Return False if this sqlite build does not support it.
+        """
+        if not table_name or not index_name or not keys or not self.file_exists(table_name):
+            return False
+        if self.text_index_exists(index_name):
+            return True
+        names = ', '.join(keys)
+        old_values = ', '.join(f'old.{key}' for key in keys)
+        new_values = ', '.join(f'new.{key}' for key in keys)
+        try:
+            with self._transaction():
+                self._cur.execute(
+                    f'CREATE VIRTUAL TABLE {index_name} USING fts5({names}, '
+                    f"content='{table_name}', content_rowid='{ID}', tokenize='trigram')")
+        except lite.OperationalError:  # No fts5 module or no trigram tokenizer (sqlite < 3.34)
+            self._rollback()
+            return False
+        self._execute(
+            f'CREATE TRIGGER {index_name}_AI AFTER INSERT ON {table_name} BEGIN '
+            f'INSERT INTO {index_name}(rowid, {names}) VALUES (new.{ID}, {new_values}); END')
+        self._execute(
+            f'CREATE TRIGGER {index_name}_AD AFTER DELETE ON {table_name} BEGIN '
+            f"INSERT INTO {index_name}({index_name}, rowid, {names}) VALUES ('delete', old.{ID}, {old_values}); END")
+        self._execute(
+            f'CREATE TRIGGER {index_name}_AU AFTER UPDATE OF {names} ON {table_name} BEGIN '
+            f"INSERT INTO {index_name}({index_name}, rowid, {names}) VALUES ('delete', old.{ID}, {old_values}); "
+            f'INSERT INTO {index_name}(rowid, {names}) VALUES (new.{ID}, {new_values}); END')
+        # Index the existing rows
+        self._execute(f"INSERT INTO {index_name}({index_name}) VALUES ('rebuild')")
+        return True
+
+    def drop_text_index(self, index_name):
+        if not index_name:
+            return
+        [self._execute(f'DROP TRIGGER IF EXISTS {index_name}_{suffix}') for suffix in ('AI', 'AD', 'AU')]
+        self._execute(f'DROP TABLE IF EXISTS {index_name}')
+
+    def text_index_exists(self, index_name) -> bool:
+        return bool(self.fetch_query(
+            'SELECT name FROM sqlite_master WHERE type=? AND name=?', ['table', index_name]))
+
     # Audit
 
     def get_audit_type(self, table_name):
@@ -375,13 +490,17 @@ class DBDriver(object):
 
         self._cache_table(table_name)
 
-        sql_stmt = self._get_insert_stmt(table_name, row, **kwargs)
-        self._execute(sql_stmt)
+        sql_stmt, params = self._get_insert_stmt(table_name, row, **kwargs)
+        self._execute(sql_stmt, params)
 
         # Return the Id
         return self._cur.lastrowid
 
-    def _get_insert_stmt(self, table_name, row, **kwargs) -> str:
+    def _get_insert_stmt(self, table_name, row, **kwargs) -> (str, list):
+        """
+        Return the statement with a "?" per value, and the values to bind.
+        many: The row already contains the "?"s, the values are bound by executemany.
+        """
         expected_count = len(self._cache[self._current_table_name][COL_NAMES])
         if len(row) != expected_count:
             self._raise(f'Row size is {len(row)}, but expected is {expected_count}.')
@@ -398,43 +517,39 @@ class DBDriver(object):
         sql_stmt = f'{sql_stmt}{audit_clause}) VALUES('
 
         # Attribute values
-        sql_values = []
+        params = []
         try:
             j = 0  # Col index
-            row = self._sanitize_row(row)
-            for i in range(len(row)):
-                value = row[i]
-
-                # During an import, row may contain an Id.
-                is_ID = False
-                if i == 0 and has_id:
-                    is_ID = True
-
-                if many:
-                    new_value = value  # ?
-                elif self._cached_item(COL_TYPES, j) == AttType.Bool:
-                    new_value = DB_TRUE if value in (True, '1') else DB_FALSE
-                elif is_ID or self._cached_item(COL_TYPES, j) in AttType.numeric_types:
-                    new_value = str(value) if value else ZERO
-                else:
-                    new_value = quote(value)
+            if not many:
+                row = self._sanitize_row(row)
+                for i in range(len(row)):
+                    value = row[i]
+
+                    # During an import, row may contain an Id.
+                    is_ID = False
+                    if i == 0 and has_id:
+                        is_ID = True
+
+                    if self._cached_item(COL_TYPES, j) == AttType.Bool:
+                        params.append(TRUE if value in (True, '1') else FALSE)
+                    elif is_ID or self._cached_item(COL_TYPES, j) in AttType.numeric_types:
+                        params.append(value if value else 0)
+                    else:
+                        params.append(str(value))
 
-                if not is_ID:
-                    j += 1
-                # Add the new value
-                sql_values.append(f'{quote_none(new_value)}')
+                    if not is_ID:
+                        j += 1
 
-            # Audit values
-            audit_values = self._audit.get_audit_values(audit_names, many=many, pgm=pgm)
-            for a in audit_values:
-                sql_values.append(f'{quote_none(a)}')
+                # Audit values
+                params.extend(self._audit.get_audit_values(audit_names, add_quotes=False, pgm=pgm))
 
             # Attribute values - all
-            sql_stmt = f'{sql_stmt}{", ".join(sql_values)})'
+            placeholders = ['?' for _ in range(len(row) + len(audit_names))]
+            sql_stmt = f'{sql_stmt}{", ".join(placeholders)})'
 
         except IndexError as e:
-            self._raise(f'{sql_stmt}. Values:"{", ".join(sql_values)}" {e.args[0]}', method)
-        return sql_stmt
+            self._raise(f'{sql_stmt}. Values:"{", ".join(str(p) for p in params)}" {e.args[0]}', method)
+        return sql_stmt, params
 
     def check_then_insert(self, table_name, row, **kwargs) -> int:
         if not table_name or not row:
@@ -487,7 +602,7 @@ class DBDriver(object):
         if kwargs.get(HAS_ID) is True:
             row.append('?')
 
-        sql_stmt = self._get_insert_stmt(table_name, row, **kwargs)
+        sql_stmt, _ = self._get_insert_stmt(table_name, row, **kwargs)
 
         # Execute
         try:
@@ -515,15 +630,15 @@ class DBDriver(object):
             kwargs[MODE] = FetchMode.Set
 
         mode = kwargs[MODE]
-        where = self._get_where_clause(**kwargs)
+        where, params = self._get_where_clause(**kwargs)
         order_by = self._get_order_by_clause(kwargs.get('order_by'))
         sql_stmt = f'SELECT * FROM {table_name}{where}{order_by}'
 
         rows = []
 
         try:
-            with self._con:
-                self._cur.execute(sql_stmt)
+            with self._transaction():
+                self._cur.execute(sql_stmt, params)
                 if mode == FetchMode.WholeTable:
                     rows = self._cur.fetchall()
                 else:
@@ -538,6 +653,59 @@ class DBDriver(object):
             self._raise(f'{sql_stmt}. {e.args[0]}', 'fetch')
         return self._tuples_to_list(rows, mode)
 
+    def fetch_batches(self, table_name, batch_size=BATCH_SIZE, **kwargs):
+        """
+        Generator of row lists of at most batch_size (cursor.fetchmany), so the result is never loaded as a whole.
+        The rows are read via an own cursor, other statements may be executed in between.
+        """
+        if not table_name:
+            return
+        self._cache_table(table_name)
+        where, params = self._get_where_clause(**kwargs)
+        order_by = self._get_order_by_clause(kwargs.get('order_by'))
+        sql_stmt = f'SELECT * FROM {table_name}{where}{order_by}'
+        cur = self._con.cursor()
+        if self._tracer:
+            cur = TracingCursor(cur, self._tracer)
+        try:
+            cur.execute(sql_stmt, params)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [list(row) for row in rows]
+        except Exception as e:
+            self._raise(f'{sql_stmt}. {e.args[0]}', 'fetch_batches')
+        finally:
+            if self._tracer:
+                cur.flush()
+            cur.close()
+
+    def fetch_page(self, table_name, keys, after=None, limit=PAGE_SIZE, descending=True, **kwargs) -> list:
+        """
+        Keyset pagination. The first "limit" rows ordered by keys (e.g. [Date, Id], unique together),
+        after the key values of the last row of the previous page. Default is the first page.
+        Unlike OFFSET, the cost of a page does not depend on its position.
+        """
+        if not table_name or not keys:
+            return []
+        self._cache_table(table_name)
+        where, params = self._get_where_clause(**kwargs)
+        if after:
+            # Row values: (Date, Id) < (?, ?)
+            where = f'{where} AND ' if where else ' WHERE '
+            where = f'{where}({", ".join(keys)}) {"<" if descending else ">"} ({", ".join("?" for _ in keys)})'
+            params.extend(after)
+        order = 'DESC' if descending else 'ASC'
+        sql_stmt = f'SELECT * FROM {table_name}{where} ORDER BY {", ".join(f"{key} {order}" for key in keys)} LIMIT ?'
+        params.append(limit)
+        try:
+            with self._transaction():
+                self._cur.execute(sql_stmt, params)
+                return self._tuples_to_list(self._cur.fetchall(), FetchMode.Set)
+        except Exception as e:
+            self._raise(f'{sql_stmt}. {e.args[0]}', 'fetch_page')
+
     def fetch_id(self, table_name, **kwargs) -> int:
         if not table_name:
             return 0
@@ -586,18 +754,38 @@ class DBDriver(object):
             return None
         return self._fetch_calc(f'SELECT MIN({name}) FROM ', table_name, **kwargs)
 
+    def fetch_sum(self, table_name, name, **kwargs) -> float:
+        if not table_name or not name or not self.file_exists(table_name):
+            return 0.0
+        self._cache_table(table_name)
+        return self._fetch_calc(f'SELECT TOTAL({name}) FROM ', table_name, **kwargs)
+
     def count(self, table_name, **kwargs) -> int:
         if not table_name or not self.file_exists(table_name):
             return 0
         self._cache_table(table_name)
         return self._fetch_calc(f'SELECT COUNT(*) FROM ', table_name, **kwargs)
 
+    def count_per(self, table_name, name, **kwargs) -> dict:
+        """ Row count per value of a column, in 1 grouped query. { value: count } """
+        if not table_name or not name or not self.file_exists(table_name):
+            return {}
+        self._cache_table(table_name)
+        where, params = self._get_where_clause(**kwargs)
+        sql_stmt = f'SELECT {name}, COUNT(*) FROM {table_name}{where} GROUP BY {name}'
+        try:
+            with self._transaction():
+                self._cur.execute(sql_stmt, params)
+                return dict(self._cur.fetchall())
+        except Exception as e:
+            self._raise(f'{sql_stmt}. {e.args[0]}', 'count_per')
+
     def _fetch_calc(self, prefix, table_name, **kwargs):
-        where = self._get_where_clause(**kwargs)
+        where, params = self._get_where_clause(**kwargs)
         sql_stmt = f'{prefix}{str(table_name)}{str(where)}'
         try:
-            with self._con:
-                self._cur.execute(sql_stmt)
+            with self._transaction():
+                self._cur.execute(sql_stmt, params)
                 counted = self._cur.fetchone()
                 return counted[0]
         except Exception as e:
@@ -652,6 +840,20 @@ class DBDriver(object):
 
         return out_rows
 
+    def fetch_query(self, sql_stmt, params=()) -> list:
+        """
+        Run a read-only statement that the Att/where API can not express (e.g. a join with GROUP BY).
+        Values must be bound via "?" params. Return the rows as lists.
+        """
+        if not sql_stmt:
+            return []
+        try:
+            with self._transaction():
+                self._cur.execute(sql_stmt, params)
+                return [list(row) for row in self._cur.fetchall()]
+        except Exception as e:
+            self._raise(f'{sql_stmt}. {e.args[0]}', 'fetch_query')
+
     def _get_value_from_db_row(self, att_name, db_row):
         """ DB-row has an Id and may be shorter than model-row when it has "in_db=False" attributes. """
         if not db_row:
@@ -682,8 +884,17 @@ class DBDriver(object):
             if att.name.title() not in self._cached_list(COL_NAMES):
                 self._raise(f'"{att.name}" is not a column in {table_name}', 'update')
 
+        sql_stmt, params = self._get_update_stmt(table_name, values, **kwargs)
+        self._execute(sql_stmt, params)
+        return True
+
+    def _get_update_stmt(self, table_name, values: list, **kwargs) -> (str, list):
+        """
+        Return the statement with a "?" per value, and the values to bind (set values, then where values).
+        """
         mutMode = TransactionMode.U
         att_clause = EMPTY
+        params = []
         first = True
         for att in values:
             if first:
@@ -699,19 +910,19 @@ class DBDriver(object):
             elif att_type in AttType.sanitize_types:
                 att.value = sanitize_text(att.value)
 
-            att_clause = f'{att_clause}{att.name}={quote(att.value)}'
+            att_clause = f'{att_clause}{att.name}=?'
+            params.append(str(att.value))
 
         # Add audit data
         audit_names = self._cached_list(COL_AUDIT_NAMES)
         pgm = kwargs.get(PGM) or __name__
         for att in self._audit.get_audit_atts(audit_names, mutMode, pgm):
             if not att.value == NC:
-                att_clause = f'{att_clause}, {att.name}={quote(att.value)}'
+                att_clause = f'{att_clause}, {att.name}=?'
+                params.append(str(att.value))
 
-        where = self._get_where_clause(**kwargs)
-        sql_stmt = f'UPDATE {str(table_name)} SET {str(att_clause)}{str(where)}'
-        self._execute(sql_stmt)
-        return True
+        where, where_params = self._get_where_clause(**kwargs)
+        return f'UPDATE {str(table_name)} SET {str(att_clause)}{str(where)}', params + where_params
 
     # D - Delete
 
@@ -724,8 +935,8 @@ class DBDriver(object):
         if count_B > 0:
             if not kwargs.get(WHERE):
                 kwargs[INCLUDE_DELETED] = True
-            where = self._get_where_clause(**kwargs)
-            self._execute(f'DELETE FROM {table_name}{where}')
+            where, params = self._get_where_clause(**kwargs)
+            self._execute(f'DELETE FROM {table_name}{where}', params)
             count_A = self.count(table_name)
         return count_B - count_A
 
@@ -757,6 +968,74 @@ class DBDriver(object):
         except Exception as e:
             self._raise(f'{e.args[0]}', 'set_transaction')
 
+    @contextmanager
+    def bulk_load(self, table_names=None):
+        """
+        Bulk load (e.g. import): all changes are done in 1 transaction, without fsync.
+        The WAL journal is kept, changing it would need exclusive access to the db.
+        table_names: The indexes of these tables are dropped, and recreated at the end.
+            Their text indexes are not maintained per row, but rebuilt at the end.
+        On error, all changes are rolled back. The safe settings are always restored.
+        """
+        # Nested: already in the bulk load
+        if not self._transaction_mode:
+            yield
+            return
+
+        self._con.commit()
+        self._con.execute('PRAGMA synchronous = OFF')
+        self._transaction_mode = False
+        try:
+            self._cur.execute('BEGIN')
+            index_stmts = self._drop_indexes(table_names or [])
+            trigger_stmts = self._drop_triggers(table_names or [])
+            yield
+            [self._cur.execute(sql_stmt) for sql_stmt in index_stmts + trigger_stmts]
+            [self._cur.execute(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+             for name in self._get_text_index_names(table_names or [])]
+            self._con.commit()
+        except BaseException:
+            self._con.rollback()
+            raise
+        finally:
+            self._transaction_mode = True
+            self._con.execute('PRAGMA synchronous = FULL')
+
+    def _drop_indexes(self, table_names) -> list:
+        """ Drop the indexes of the tables. Return the statements to recreate them. """
+        if not table_names:
+            return []
+        rows = self.fetch_query(
+            f'SELECT name, sql FROM sqlite_master WHERE type=? AND sql IS NOT NULL '
+            f'AND tbl_name IN ({", ".join("?" for _ in table_names)})', ['index', *table_names])
+        [self._cur.execute(f'DROP INDEX IF EXISTS {name}') for name, _ in rows]
+        return [sql_stmt for _, sql_stmt in rows]
+
+    def _drop_triggers(self, table_names) -> list:
+        """ Drop the triggers (text index maintenance) of the tables. Return the statements to recreate them. """
+        if not table_names:
+            return []
+        rows = self.fetch_query(
+            f'SELECT name, sql FROM sqlite_master WHERE type=? '
+            f'AND tbl_name IN ({", ".join("?" for _ in table_names)})', ['trigger', *table_names])
+        [self._cur.execute(f'DROP TRIGGER IF EXISTS {name}') for name, _ in rows]
+        return [sql_stmt for _, sql_stmt in rows]
+
+    def _get_text_index_names(self, table_names) -> list:
+        rows = self.fetch_query(
+            'SELECT name, sql FROM sqlite_master WHERE type=? AND sql LIKE ?', ['table', 'CREATE VIRTUAL TABLE%'])
+        return [name for name, sql_stmt in rows
+                if any(f"content='{table_name}'" in sql_stmt for table_name in table_names)]
+
+    @contextmanager
+    def _transaction(self):
+        """ Like "with connection", but during a bulk load (by the writer) nothing is committed. """
+        if self._transaction_mode or not self.is_writer_thread:
+            with self._con:
+                yield
+        else:
+            yield
+
     def _commit(self):
         if self._transaction_mode:
             self._con.commit()
@@ -765,24 +1044,35 @@ class DBDriver(object):
         if self._transaction_mode:
             self._con.rollback()
 
-    def _get_where_clause(self, **kwargs) -> str:
+    def _get_where_clause(self, **kwargs) -> (str, list):
         """
-        Construct where-clause from attributes
+        Construct where-clause from attributes.
+        Return the clause with a "?" per value, and the values to bind.
         """
         where = kwargs.get(WHERE)
         include_deleted = kwargs.get(INCLUDE_DELETED) is True
 
         where_clause = EMPTY
+        params = []
         first = True
 
         # Only fetch records that are not logically deleted
         if not include_deleted and DELETED in self._cached_list(COL_NAMES):
-            where_clause = f' WHERE {DELETED}={quote(DB_FALSE)}'
+            where_clause = f' WHERE {DELETED}=?'
+            params.append(FALSE)
+            first = False
+
+        # Full-text search: [text index name, FTS5 match expression]
+        match = kwargs.get(MATCH)
+        if match:
+            where_clause = f'{where_clause} WHERE ' if first else f'{where_clause} AND '
+            where_clause = f'{where_clause}{ID} IN (SELECT rowid FROM {match[0]} WHERE {match[0]} MATCH ?)'
+            params.append(match[1])
             first = False
 
         # Validate input
         if not where:
-            return where_clause
+            return where_clause, params
 
         # Processing
         for att in where:
@@ -793,20 +1083,21 @@ class DBDriver(object):
             where_clause = f'{where_clause} WHERE ' if first else f'{where_clause} AND '
             first = False
 
-            # attName="attValue"
-            where_clause = f'{where_clause}{att.name}{str(att.relation)}'
+            # attName IN (?, ...)
+            if isinstance(att.value, (list, tuple, set)):
+                where_clause = f'{where_clause}{att.name} IN ({", ".join("?" for _ in att.value)})'
+                params.extend(att.value)
+                continue
+
+            # attName=?
+            where_clause = f'{where_clause}{att.name}{str(att.relation)}?'
             if att.type in AttType.numeric_types:
-                where_clause = f'{where_clause}{str(att.value) or ZERO}'
+                params.append(att.value if att.value not in (None, EMPTY) else 0)
             elif att.type == AttType.Bool:
-                if att.value is True:
-                    where_clause = f'{where_clause}{DB_TRUE}'
-                else:
-                    where_clause = f'{where_clause}{DB_FALSE}'
+                params.append(TRUE if att.value is True else FALSE)
             else:
-                # To escape single quotes, Replace ' by ''
-                value = quote(str(att.value).replace("'", "''"))
-                where_clause = f'{where_clause}{value}'
-        return where_clause
+                params.append(str(att.value))
+        return where_clause, params
 
     def _get_order_by_clause(self, order_by=None) -> str:
         """
@@ -972,15 +1263,6 @@ class DBDriver(object):
         except (UnicodeDecodeError, csv.Error) as e:
             self._raise(f'csv error in "{data_path}": "{e}"', method)
 
-    def _write_csv_rows(self, rows, data_path=None):
-        try:
-            with open(data_path, 'w') as csvFile:
-                csv_writer = csv.writer(
-                    csvFile, delimiter=';', quotechar='"', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
-                [csv_writer.writerow(row) for row in rows]
-        except csv.Error as e:
-            self._raise(f'{e}', 'write_rows')
-
     def _import_error(self, method, table_name, row, index):
         self._raise(f'Error at {table_name} row {str(index)}, row is "{str(row)}"', method)
 
@@ -989,22 +1271,30 @@ class DBDriver(object):
             return 0
 
         self._cache_table(table_name)
-
-        rows = self.fetch(table_name, mode=FetchMode.Set, where=where)
-        if not rows:
-            return 0
-
         # Optionally filter out audit data
-        if not audit_data:
-            audit_names = self._cached_list(COL_AUDIT_NAMES)
-            rows = self._audit.remove_audit(audit_names, rows, include_id=include_id)
-
+        audit_names = [] if audit_data else self._cached_list(COL_AUDIT_NAMES)
         header = ['Id'] if include_id else []
         header.extend(self._cached_list(COL_NAMES))
-        out_rows = [header]
-        out_rows.extend(rows)
-        self._write_csv_rows(out_rows, data_path=path)
-        return len(rows)
+
+        # Streamed per batch. The file is only written if there are rows.
+        count = 0
+        csv_file = None
+        try:
+            for rows in self.fetch_batches(table_name, where=where):
+                rows = self._audit.remove_audit(audit_names, rows, include_id=include_id)
+                if csv_file is None:
+                    csv_file = open(path, 'w')
+                    csv_writer = csv.writer(
+                        csv_file, delimiter=';', quotechar='"', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+                    csv_writer.writerow(header)
+                csv_writer.writerows(rows)
+                count += len(rows)
+        except csv.Error as e:
+            self._raise(f'{e}', 'export_table_to_csv')
+        finally:
+            if csv_file:
+                csv_file.close()
+        return count
 
     # Routines
 
@@ -1020,10 +1310,10 @@ class DBDriver(object):
                 return self._cached_item(COL_TYPES, i)
         self._raise(f'attribute {att_name} does not exist in {self._current_table_name}', '_get_attribute_type')
 
-    def _execute(self, sql_stmt):
-        with self._con:
+    def _execute(self, sql_stmt, params=()):
+        with self._transaction():
             try:
-                self._cur.execute(sql_stmt)
+                self._cur.execute(sql_stmt, params)
                 self._commit()
             except Exception as e:
                 self._rollback()
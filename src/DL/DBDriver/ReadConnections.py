@@ -0,0 +1,73 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# ReadConnections.py
+#
+# Author      : Peter Heijligers
+# Description : Read-only sqlite connections, one per thread
+#
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import pathlib
+import sqlite3 as lite
+import threading
+
+from .SQLTracer import TracingCursor
+
+
+class ReadConnections(object):
+    """
+    One read-only connection per thread to the same database.
+    In WAL mode readers do not block the writer and the writer does not block the readers:
+    a reader sees the database as it was committed when its statement started.
+    """
+
+    def __init__(self, db_path):
+        self._uri = f'{pathlib.Path(db_path).resolve().as_uri()}?mode=ro'
+        self._local = threading.local()
+        self._connections = []
+        self._generation = 0  # Incremented by close_all
+        self._lock = threading.Lock()
+
+    def connection(self):
+        """ The read connection of the current thread. It is created on first use. """
+        con = getattr(self._local, 'con', None)
+        if con is None or self._local.generation != self._generation:
+            # check_same_thread: close_all may be called from another thread.
+            con = lite.connect(self._uri, uri=True, isolation_level='DEFERRED', check_same_thread=False)
+            con.text_factory = str
+            con.execute('PRAGMA query_only = ON')
+            self._local.con = con
+            self._local.cur = con.cursor()
+            self._local.generation = self._generation
+            with self._lock:
+                self._connections.append(con)
+        return con
+
+    def cursor(self, tracer=None):
+        """ The shared cursor of the current thread, like DBDriver has one for the writer. """
+        self.connection()
+        if tracer and not isinstance(self._local.cur, TracingCursor):
+            self._local.cur = TracingCursor(self._local.cur, tracer)
+        return self._local.cur
+
+    def close(self):
+        """ Close the read connection of the current thread (e.g. at the end of a worker). """
+        con = getattr(self._local, 'con', None)
+        if con is None or self._local.generation != self._generation:
+            return
+        if isinstance(self._local.cur, TracingCursor):
+            self._local.cur.flush()
+        self._local.con = self._local.cur = None
+        with self._lock:
+            self._connections.remove(con)
+        con.close()
+
+    def close_all(self):
+        """ Close the read connections of all threads. They must not be in use anymore. """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        [con.close() for con in connections]
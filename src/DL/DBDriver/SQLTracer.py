@@ -0,0 +1,193 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# SQLTracer.py
+#
+# Author      : Peter Heijligers
+# Description : Optional SQL statistics per statement shape and caller
+#
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# 2026-10-18 PHe Thread-safe, the cursors of the read connections record in the same tracer
+# ---------------------------------------------------------------------------------------------------------------------
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+TRACE_ENV = 'PM_TRACE_SQL'
+TOP_N = 20
+N_PLUS_1_COUNT = 100  # Statements executed at least this often, returning at most 1 row per call.
+SKIP_MODULES = ('src.DL.DBDriver.', 'src.VL.Data.DataDriver', 'contextlib')  # Not a caller
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+PARAM_LISTS = re.compile(r'\?(?:\s*,\s*\?)+')
+BLANKS = re.compile(r'\s+')
+
+# Statistics
+COUNT, TOTAL, MAX, ROWS = 0, 1, 2, 3
+
+
+def is_tracing_requested() -> bool:
+    """ Environment variable PM_TRACE_SQL=1 """
+    return os.environ.get(TRACE_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+class SQLTracer(object):
+    """
+    Per statement shape (literals and parameter lists replaced by "?") and calling module.function:
+    call count, total and max latency in seconds (execute + fetch) and rows.
+    """
+
+    @property
+    def stats(self):
+        return self._stats
+
+    def __init__(self):
+        self._stats = {}  # {(shape, caller): [count, total, max, rows]}
+        self._shapes = {}  # {sql_stmt: shape}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        self._stats = {}
+
+    def record(self, sql_stmt, caller, seconds, rows):
+        with self._lock:
+            self._record(sql_stmt, caller, seconds, rows)
+
+    def _record(self, sql_stmt, caller, seconds, rows):
+        shape = self._shapes.get(sql_stmt)
+        if shape is None:
+            shape = PARAM_LISTS.sub('?...', LITERALS.sub('?', BLANKS.sub(' ', sql_stmt).strip()))
+            self._shapes[sql_stmt] = shape
+        stat = self._stats.get((shape, caller))
+        if stat is None:
+            self._stats[(shape, caller)] = [1, seconds, seconds, rows]
+            return
+        stat[COUNT] += 1
+        stat[TOTAL] += seconds
+        stat[MAX] = max(stat[MAX], seconds)
+        stat[ROWS] += rows
+
+    def get_items(self) -> list:
+        """ Sorted by total time, descending. """
+        return [{
+            'statement': shape,
+            'caller': caller,
+            'count': stat[COUNT],
+            'total_ms': round(stat[TOTAL] * 1000, 3),
+            'max_ms': round(stat[MAX] * 1000, 3),
+            'rows': stat[ROWS],
+            'n_plus_1': self._is_n_plus_1(stat),
+        } for (shape, caller), stat in sorted(self._stats.items(), key=lambda x: x[1][TOTAL], reverse=True)]
+
+    @staticmethod
+    def _is_n_plus_1(stat) -> bool:
+        return stat[COUNT] >= N_PLUS_1_COUNT and stat[ROWS] <= stat[COUNT]
+
+    def report(self, top_n=TOP_N) -> list:
+        """ Top-n lines """
+        items = self.get_items()
+        total = sum(item['total_ms'] for item in items)
+        lines = [f'SQL: {sum(item["count"] for item in items)} statements, {total:.0f} ms. '
+                 f'Top {min(top_n, len(items))}:',
+                 f'{"count":>8} {"total ms":>10} {"max ms":>8} {"rows":>9}  caller / statement']
+        for item in items[:top_n]:
+            flag = ' (N+1?)' if item['n_plus_1'] else ''
+            lines.append(f'{item["count"]:>8} {item["total_ms"]:>10.1f} {item["max_ms"]:>8.1f} {item["rows"]:>9}  '
+                         f'{item["caller"]}{flag}')
+            lines.append(f'{"":>39}{item["statement"][:120]}')
+        return lines
+
+    def write_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.get_items(), f, indent=2)
+
+    def write_report(self, log_dir, suffix='') -> list:
+        """ Write the statistics to SQL_trace<suffix>.json in the log directory. Return the top-n lines. """
+        path = f'{log_dir}SQL_trace{suffix or ""}.json'
+        self.write_json(path)
+        return self.report() + [f'SQL statistieken: {path}']
+
+
+class TracingCursor(object):
+    """
+    sqlite3 cursor that records its statements in a SQLTracer.
+    A statement is recorded when the next one starts or on flush(), so its fetches are included.
+    """
+
+    def __init__(self, cursor, tracer: SQLTracer):
+        self._cursor = cursor
+        self._tracer = tracer
+        self._current = None  # [sql_stmt, caller, seconds, rows]
+
+    def __getattr__(self, attr):
+        """ lastrowid, rowcount, description etc. """
+        return getattr(self._cursor, attr)
+
+    def __iter__(self):
+        rows = self._cursor.fetchall()
+        self._add(0.0, len(rows))
+        return iter(rows)
+
+    def execute(self, sql_stmt, params=()):
+        return self._execute(self._cursor.execute, sql_stmt, params)
+
+    def executemany(self, sql_stmt, rows):
+        return self._execute(self._cursor.executemany, sql_stmt, rows)
+
+    def executescript(self, sql_script):
+        return self._execute(self._cursor.executescript, sql_script)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._add(time.perf_counter() - start, 1 if row is not None else 0)
+        return row
+
+    def fetchmany(self, size):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._add(time.perf_counter() - start, len(rows))
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._add(time.perf_counter() - start, len(rows))
+        return rows
+
+    def flush(self):
+        if self._current:
+            self._tracer.record(*self._current)
+            self._current = None
+
+    def _execute(self, method, sql_stmt, *args):
+        self.flush()
+        start = time.perf_counter()
+        try:
+            method(sql_stmt, *args)
+        finally:
+            seconds = time.perf_counter() - start
+            rowcount = self._cursor.rowcount
+            self._current = [sql_stmt, self._get_caller(), seconds, rowcount if rowcount > 0 else 0]
+        return self
+
+    def _add(self, seconds, rows):
+        if self._current:
+            self._current[2] += seconds
+            self._current[3] += rows
+
+    @staticmethod
+    def _get_caller() -> str:
+        """ First module.function outside the database driver """
+        frame = sys._getframe(3)
+        while frame:
+            module = frame.f_globals.get('__name__', '')
+            if not module.startswith(SKIP_MODULES):
+                return f'{module}.{frame.f_code.co_name}'
+            frame = frame.f_back
+        return ''
@@ -1,8 +1,11 @@
 from src.Base import Base
+from src.DL.Config import CF_TRACE_SQL
 from src.DL.DBDriver.Att import Att
 from src.DL.DBDriver.DBDriver import DBDriver
+from src.DL.DBDriver.SQLTracer import is_tracing_requested
 from src.DL.Lexicon import TRANSACTIONS
 from src.DL.Model import Model, FD
+from src.DL.YearMonthCache import Singleton as YearMonthCache
 from src.GL.Const import APP_NAME, FFD, EMPTY
 from src.GL.Enums import ResultCode, MessageSeverity as Sev, Color, ActionCode
 from src.GL.GeneralException import GeneralException
@@ -28,6 +31,8 @@ class DBInitialize(Base):
 
         if build:
             self._build()
+        else:
+            self._add_text_indexes(self._db)
 
         # Store in session
         self._session.db = self._db
@@ -129,6 +134,8 @@ class DBInitialize(Base):
             if not self._db:
                 self._result.add_message(f'{PGM}: Database driver kon niet gestart worden.', Sev.Error)
                 return
+            if self._CM.get_config_item(CF_TRACE_SQL, False) or is_tracing_requested():
+                self._db.enable_tracing()
         except GeneralException as e:
             self._result.add_message(f'{PGM}: Database error: "{e.message}".', Sev.Error)
             return
@@ -139,9 +146,11 @@ class DBInitialize(Base):
 
     def _build(self):
         self._result.add_message(f'Build is gestart for tabellen "{", ".join(model.DB_tables)}".')
+        YearMonthCache().invalidate()
         # Build
         for table_name in model.DB_tables:
             try:
+                [self._db.drop_text_index(index_name) for index_name in model.get_text_indexes(table_name)]
                 self._db.drop_table(table_name)
                 self._db_create_table_from_model(self._db, table_name)
             except GeneralException:
@@ -158,3 +167,11 @@ class DBInitialize(Base):
         """ Skip the non_db attributes """
         row_def = {colno: att for colno, att in model.get_db_definition(table_name).items()}
         db.create_table(table_name, row_def, index_def=model.get_indexes(table_name))
+        DBInitialize._add_text_indexes(db, [table_name])
+
+    @staticmethod
+    def _add_text_indexes(db, table_names=None):
+        """ Optional: without full-text support, searching in text falls back to LIKE. """
+        for table_name in table_names or model.DB_tables:
+            for index_name, keys in model.get_text_indexes(table_name).items():
+                db.add_text_index(table_name, index_name, keys)
@@ -41,7 +41,7 @@ class AccountIO(BaseIO):
         if not value:
             return
         bban, iban = self.get_bban_iban_from_account_number(value)
-        if bban and iban:
+        if bban and iban and bban not in self._accounts_dict:
             self._accounts_dict[bban] = Account(bban, iban)
 
     def persist_accounts(self):
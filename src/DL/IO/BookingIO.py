@@ -1,5 +1,6 @@
 from src.DL.DBDriver.Att import Att
 from src.DL.IO.BaseIO import BaseIO
+from src.DL.IO.TransactionIO import TransactionIO
 from src.DL.Lexicon import TRANSACTIONS, BOOKING_CODE
 from src.DL.Model import FD, Model
 from src.DL.Objects.Booking import Booking
@@ -12,7 +13,6 @@ from src.GL.Result import Result
 from src.GL.Validate import toBool
 from src.VL.Data.Constants.Const import PROTECTED_BOOKINGS
 from src.VL.Data.Constants.Enums import BoxCommand
-from src.VL.Models.BookingCodeModel import BookingCodeModel
 
 TABLE = Table.BookingCode
 PGM = MUTATION_PGM_BC
@@ -79,7 +79,8 @@ class BookingIO(BaseIO):
         rows = self._db.select(table_name=TABLE, name=FD.SeqNo, where=[Att(FD.Booking_type, type)])
         return max(seqno for seqno in rows)
 
-    def edit(self, model: BookingCodeModel) -> Result:
+    def edit(self, model) -> Result:
+        """ model: BookingCodeModel (GUI) """
         self._result = Result()
         self._transaction_count = model.transaction_count
         self._object = model.object
@@ -102,6 +103,11 @@ class BookingIO(BaseIO):
             if not self._confirm('gewijzigd'):
                 return Result(action_code=ActionCode.Close)
 
+            # The month and year totals are per booking type.
+            if self._object.booking_type != self._object_old.booking_type:
+                Id = self._db.fetch_id(TABLE, where=pk_current)
+                TransactionIO().invalidate_year_months(where=[Att(FD.Booking_id, Id)])
+
             values = pk_new.copy()
             values.extend([
                 Att(FD.Booking_code, self._object.booking_code),
@@ -122,6 +128,7 @@ class BookingIO(BaseIO):
 
             # Clear booking Id in TransactionEnriched and CounterAccount
             Id = self._db.fetch_id(TABLE, where=pk_current)
+            TransactionIO().invalidate_year_months(where=[Att(FD.Booking_id, Id)])
             self._db.update(
                 Table.TransactionEnriched,
                 where=[Att(FD.Booking_id, Id)], values=[Att(FD.Booking_id, 0)], pgm=PGM)
@@ -0,0 +1,69 @@
+import hashlib
+import os
+
+from src.Base import Base
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.DBDriver.Functions import sanitize_text
+from src.DL.Model import FD, Model
+from src.DL.Objects.ImportFile import ImportFile
+from src.DL.Table import Table
+
+PGM = 'ImportFileIO'
+TABLE = Table.ImportFile
+d = Model().get_colno_per_att_name(TABLE, zero_based=False)
+
+BLOCK_SIZE = 1024 * 1024
+
+
+class ImportFileIO(Base):
+    """ Fingerprints (path, size, mtime, content hash) of the imported bank transaction files. """
+
+    def __init__(self):
+        super().__init__()
+        self._db = self._session.db
+
+    def get_imported_files(self) -> dict:
+        """ @return: { path: ImportFile } """
+        return {row[d[FD.File_path]]: self.row_to_obj(row)
+                for row in self._db.fetch(TABLE, mode=FetchMode.WholeTable)}
+
+    @staticmethod
+    def is_unchanged(path, imported_files: dict) -> bool:
+        """ Size and mtime are checked first. Only when the mtime differs the content hash decides. """
+        imported = imported_files.get(sanitize_text(path))  # Path is sanitized in the db
+        if not imported:
+            return False
+        stat = os.stat(path)
+        if stat.st_size != imported.size:
+            return False
+        if stat.st_mtime == imported.mtime:
+            return True
+        return get_file_hash(path) == imported.hash
+
+    @staticmethod
+    def get_fingerprint(path) -> ImportFile:
+        stat = os.stat(path)
+        return ImportFile(path, stat.st_size, stat.st_mtime, get_file_hash(path))
+
+    def save(self, obj: ImportFile):
+        """ Replace the fingerprint of the file """
+        self._db.delete(TABLE, where=[Att(FD.File_path, sanitize_text(obj.path))])
+        self._db.insert(TABLE, [obj.path, obj.size, obj.mtime, obj.hash], pgm=PGM)
+
+    @staticmethod
+    def row_to_obj(row) -> ImportFile:
+        return ImportFile(
+            path=row[d[FD.File_path]],
+            size=int(row[d[FD.File_size]]),
+            mtime=float(row[d[FD.File_mtime]]),
+            hash=row[d[FD.File_hash]]
+        ) if row else ImportFile()
+
+
+def get_file_hash(path) -> str:
+    sha = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(BLOCK_SIZE), b''):
+            sha.update(block)
+    return sha.hexdigest()
@@ -5,6 +5,7 @@ from src.DL.DBDriver.Att import Att
 from src.DL.IO.BaseIO import BaseIO
 from src.DL.Model import FD
 from src.DL.Table import Table
+from src.DL.YearMonthCache import Singleton as YearMonthCache
 from src.GL.Const import EMPTY, MUTATION_PGM_TE
 from src.GL.Validate import isInt
 from src.VL.Data.Constants.Const import LEEG
@@ -48,6 +49,12 @@ class TransactionIO(BaseIO, ABC):
         return True
 
     def update_booking(self, values, where) -> int:
+        self.invalidate_year_months(where)
         if self._db.update(TABLE, where=where, values=values, pgm=MUTATION_PGM_TE):
             return self._db.count(TABLE, where=where)
         return 0
+
+    def invalidate_year_months(self, where):
+        """ The Month and Year tables must be recalculated for the accounts and years of the transactions. """
+        for bban, year in {tuple(row) for row in self._db.select(TABLE, names=[FD.Account_bban, FD.Year], where=where)}:
+            YearMonthCache().invalidate(bban, [year])
@@ -13,6 +13,7 @@ from src.DL.Enums.Enums import BookingType
 from src.DL.IO.BaseIO import BaseIO
 from src.DL.Lexicon import TRANSACTIONS
 from src.DL.Model import FD, Model
+from src.DL.Pager import Pager
 from src.DL.Table import Table
 from src.DL.UserCsvFiles.Cache.BookingCodeCache import Singleton as BookingCodeCache
 from src.GL.Const import EMPTY
@@ -31,6 +32,17 @@ c_counter_account_id = Model().get_column_number(TABLE, FD.Counter_account_id)
 
 BCM = BookingCodeCache()
 
+# Realisation per booking. Transactions without booking are split up in costs and revenues.
+BC = Table.BookingCode
+SQL_REALISATION = (
+    f'SELECT {TABLE}.{FD.Booking_id}, '
+    f'CASE WHEN {TABLE}.{FD.Booking_id} THEN 0 ELSE {TABLE}.{FD.Amount_signed} < 0 END, '
+    f'{BC}.{FD.Booking_type}, {BC}.{FD.Booking_maingroup}, {BC}.{FD.Booking_subgroup}, '
+    f'SUM({TABLE}.{FD.Amount_signed}), MAX({TABLE}.{FD.Month}) '
+    f'FROM {TABLE} LEFT JOIN {BC} ON {BC}.{FD.ID} = {TABLE}.{FD.Booking_id} '
+    f'WHERE {TABLE}.{FD.Account_bban} = ? AND {TABLE}.{FD.Year} = ? '
+    f'GROUP BY 1, 2')
+
 
 class TransactionsIO(BaseIO, ABC):
 
@@ -42,6 +54,11 @@ class TransactionsIO(BaseIO, ABC):
     def total(self):
         return self._total
 
+    @property
+    def pager(self):
+        """ Pager of the last search, if it is paged. """
+        return self._pager
+
     @property
     def total_amount(self):
         return self._total_amount
@@ -50,6 +67,10 @@ class TransactionsIO(BaseIO, ABC):
     def month_max(self):
         return self._month_max
 
+    @property
+    def realisation_totals(self):
+        return self._realisation_totals
+
     def __init__(self):
         super().__init__(TABLE)
         self._comma_target = self._CM.get_config_item(CF_COMMA_REPRESENTATION_DB)
@@ -57,9 +78,11 @@ class TransactionsIO(BaseIO, ABC):
         self._where_atts = []
         self._dialog_mode = False
         self._rows = []
+        self._pager = None
         self._total = self.get_total()
         self._te_dict = self._model.get_colno_per_att_name(TABLE, zero_based=False)
         self._total_amount = 0.0
+        self._realisation_totals = {False: 0.0, True: 0.0}
         self._month_max = 0
 
     """
@@ -70,8 +93,12 @@ class TransactionsIO(BaseIO, ABC):
         """ Do all rows already have a booking code? """
         return self._db.count(TABLE, where=[Att(FD.Booking_id, 0, type=AttType.Int)]) == 0
 
-    def search(self, dialog_mode=True, title=EMPTY) -> Result:
+    def search(self, dialog_mode=True, title=EMPTY, paged=False) -> Result:
+        """
+        paged: If the search is 1 query, only the first page of rows is fetched. The next pages via the pager.
+        """
         self._dialog_mode = False if self._session.CLI_mode else dialog_mode
+        self._pager = None
 
         # A. Search for AND relations
         try:
@@ -83,9 +110,22 @@ class TransactionsIO(BaseIO, ABC):
             return Result()
 
         # B. Get the rows. Search for OR relations.
-        self._rows = self._db.fetch(TABLE, where=where)
+        search_text = self._CM.get_config_item(CF_SEARCH_TEXT)
+        if paged and not self._CM.is_search_for_empty_booking_mode():
+            kwargs = self._get_query_kwargs(where, search_text)
+            if kwargs is not None:
+                return self._search_paged(title, **kwargs)
+
+        if not any(att.name == FD.Name for att in where):
+            self._rows = self._db.fetch(TABLE, where=where)
         #    Search in Name has been specified: Search for Comments and Remarks too.
-        if any(att.name == FD.Name for att in where):
+        #    Via the full-text index this is 1 query.
+        elif self._is_text_index_search(search_text):
+            self._rows = self._db.fetch(
+                TABLE, where=[att for att in where if att.name != FD.Name],
+                match=[Table.TransactionSearch, self._match_phrase(search_text)])
+        else:
+            self._rows = self._db.fetch(TABLE, where=where)
             self._rows.extend(
                 self._db.fetch(TABLE, where=self._get_where_from_config(att_name_text=FD.Comments)))
             self._rows.extend(
@@ -119,6 +159,24 @@ class TransactionsIO(BaseIO, ABC):
         self._total = self.get_total()
         return result
 
+    def _get_query_kwargs(self, where, search_text) -> Optional[dict]:
+        """ where and match of the search, if it is 1 query. """
+        if not any(att.name == FD.Name for att in where):
+            return {'where': where}
+        if self._is_text_index_search(search_text):
+            return {'where': [att for att in where if att.name != FD.Name],
+                    'match': [Table.TransactionSearch, self._match_phrase(search_text)]}
+        return None  # Name, Comments and Remarks are searched separately.
+
+    def _search_paged(self, title, **kwargs) -> Result:
+        """ First page, newest first. The count and total amount are calculated in the database. """
+        self._pager = Pager(TABLE, keys=[FD.Date, FD.ID], **kwargs)
+        self._rows = self._pager.next_page()
+        self._total = FloatToStr(str(round(self._db.fetch_sum(TABLE, FD.Amount_signed, **kwargs), 2)))
+        if not self._rows:
+            return Result(text=f'{title}Geen {TRANSACTIONS} gevonden.')
+        return Result(text=f'{title}{self._pager.total} {TRANSACTIONS} gevonden.')
+
     @staticmethod
     def _deduplicate_rows(rows) -> list:
         # Remove duplicates
@@ -195,6 +253,20 @@ class TransactionsIO(BaseIO, ABC):
                 att.relation = SQLOperator.NE
             self._where_atts.append(copy(att))
 
+    def _is_text_index_search(self, value) -> bool:
+        """
+        The trigram index finds text containing the search term of at least 3 characters, like LIKE '%term%'.
+        Wildcards (e.g. "term*" = starts with) are only supported via LIKE.
+        """
+        return (len(value) >= 3 and not any(c in value for c in '*%_')
+                and self._db.text_index_exists(Table.TransactionSearch))
+
+    @staticmethod
+    def _match_phrase(value) -> str:
+        """ FTS5 phrase: the term as a whole, quotes in the term escaped. """
+        value = value.replace('"', '""')
+        return f'"{value}"'
+
     @staticmethod
     def _wildcard(value):
         """ Search all text containing the search term. Exact search is not supported."""
@@ -219,47 +291,45 @@ class TransactionsIO(BaseIO, ABC):
     """
     Summary
     """
-    def get_realisation_data(self, iban, year, is_overbooking=False) -> list:
-        """ @return: [type, maingroup, subgroup, amount] """
-        self._total_amount = 0.0
-        d = {}
-        b_def = self._model.get_colno_per_att_name(Table.BookingCode, zero_based=False)
-        account_bban = get_BBAN_from_IBAN(iban)
-        where = [Att(FD.Account_bban, account_bban), Att(FD.Year, year)]
-        mutations = self._db.select(TABLE, where=where)
-        for m_row in mutations:
-            self._month_max = max(self._month_max, m_row[self._te_dict[FD.Month]])
-
-            # Get the booking_id
-            booking_id = m_row[self._te_dict[FD.Booking_id]]
-            if not booking_id:
-                booking_maingroup = OTHER_COSTS if m_row[self._te_dict[FD.Amount_signed]] < 0 else OTHER_REVENUES
-                booking_id = self._db.fetch_id(Table.BookingCode, where=[Att(FD.Booking_maingroup, booking_maingroup)])
-                if not booking_id:
-                    raise GeneralException(
-                        f'{PGM}: Gereserveerde boeking {booking_maingroup} is niet gevonden '
-                        f'in tabel {Table.BookingCode}.')
-
-            b_row = self._db.fetch_one(Table.BookingCode, where=[Att(FD.ID, booking_id)])
-
-            # Filter on Booking type Overbooking
-            booking_type = b_row[b_def[FD.Booking_type]]
-            if (is_overbooking and booking_type != BookingType.Overbookings or
-                    not is_overbooking and booking_type == BookingType.Overbookings):
-                continue
-
-            # Total amount and add to dict
-            amount = m_row[self._te_dict[FD.Amount_signed]]
-            self._total_amount += amount
-            key = (f'{b_row[b_def[FD.Booking_type]]}|'
-                   f'{b_row[b_def[FD.Booking_maingroup]]}|'
-                   f'{b_row[b_def[FD.Booking_subgroup]]}')
-            if key in d:
-                d[key] += amount
-            else:
-                d[key] = amount
+    def get_realisation_data(self, iban, year) -> dict:
+        """
+        Realisation per booking of the year, in 1 grouped query.
+        @return: { is_overbooking: [[type, maingroup, subgroup, amount], ...] }
+        The total amount per is_overbooking is in realisation_totals.
+        """
+        d = {False: {}, True: {}}
+        self._realisation_totals = {False: 0.0, True: 0.0}
+        for booking_id, is_negative, booking_type, booking_maingroup, booking_subgroup, amount, month_max \
+                in self._db.fetch_query(SQL_REALISATION, (get_BBAN_from_IBAN(iban), year)):
+            self._month_max = max(self._month_max, month_max)
 
-        return [self._add_condensed_row(key, amount) for key, amount in d.items()]
+            # No booking: protected booking "Overige uitgaven" or "Overige inkomsten"
+            if not booking_id:
+                booking_type, booking_maingroup, booking_subgroup = self._get_protected_booking(
+                    OTHER_COSTS if is_negative else OTHER_REVENUES)
+            elif booking_type is None:
+                raise GeneralException(
+                    f'{PGM}: Boeking met id {booking_id} is niet gevonden in tabel {Table.BookingCode}.')
+
+            # Total amount and add to dict (per booking type Overbooking or not)
+            is_overbooking = booking_type == BookingType.Overbookings
+            self._realisation_totals[is_overbooking] += amount
+            key = f'{booking_type}|{booking_maingroup}|{booking_subgroup}'
+            d[is_overbooking][key] = d[is_overbooking].get(key, 0.0) + amount
+
+        return {is_overbooking: [self._add_condensed_row(key, amount) for key, amount in amounts.items()]
+                for is_overbooking, amounts in d.items()}
+
+    def _get_protected_booking(self, booking_maingroup) -> list:
+        """ @return: [type, maingroup, subgroup] of the protected booking """
+        booking_id = self._db.fetch_id(Table.BookingCode, where=[Att(FD.Booking_maingroup, booking_maingroup)])
+        if not booking_id:
+            raise GeneralException(
+                f'{PGM}: Gereserveerde boeking {booking_maingroup} is niet gevonden '
+                f'in tabel {Table.BookingCode}.')
+        b_def = self._model.get_colno_per_att_name(Table.BookingCode, zero_based=False)
+        b_row = self._db.fetch_one(Table.BookingCode, where=[Att(FD.ID, booking_id)])
+        return [b_row[b_def[name]] for name in (FD.Booking_type, FD.Booking_maingroup, FD.Booking_subgroup)]
 
     @staticmethod
     def _add_condensed_row(key, amount):
@@ -5,6 +5,8 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2018-12-20 PHe First creation
+# 2026-10-18 PHe Months and years are calculated from one aggregate query
+# 2026-10-18 PHe Months and years are only recalculated when invalidated (YearMonthCache)
 # ---------------------------------------------------------------------------------------------------------------------
 from datetime import datetime
 
@@ -12,13 +14,12 @@ from src.BL.Functions import get_BBAN_from_IBAN
 from src.Base import Base
 from src.DL.Config import CF_IBAN, CF_ROWS_TRANSACTION
 from src.DL.DBDriver.Att import Att
-from src.DL.DBDriver.AttType import AttType
 from src.DL.IO.TransactionsIO import TransactionsIO
 from src.DL.Lexicon import COSTS, REVENUES, OVERBOOKINGS
 from src.DL.Model import Model, FD
 from src.DL.Objects.Month import Month
 from src.DL.Table import Table
-from src.DL.UserCsvFiles.Cache.BookingCodeCache import Singleton as BookingCodeCache
+from src.DL.YearMonthCache import Singleton as YearMonthCache
 from src.DL.YearMonthTransactionsMax import YearMonthTransactionsMax
 from src.GL.Enums import Color, MessageSeverity
 # Working fields
@@ -32,10 +33,20 @@ PGM = 'YearMonthIO'
 error_prefix = f'{PGM} {Color.RED}Error{Color.NC}:'
 
 model = Model()
-BCM = BookingCodeCache()
-TE_dict = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)
 mo_dict = model.get_colno_per_att_name(Table.Month)
 
+YMC = YearMonthCache()
+
+TE = Table.TransactionEnriched
+BC = Table.BookingCode
+# Signed amount and transaction count per year, month, booking type and sign (revenue/cost)
+SQL_MONTH_TOTALS = (
+    f'SELECT {TE}.{FD.Year}, {TE}.{FD.Month}, {BC}.{FD.Booking_type}, {TE}.{FD.Amount_signed} >= 0, '
+    f'SUM({TE}.{FD.Amount_signed}), COUNT(*) '
+    f'FROM {TE} LEFT JOIN {BC} ON {BC}.{FD.ID} = {TE}.{FD.Booking_id} '
+    f'WHERE {TE}.{FD.Account_bban} = ? AND {TE}.{FD.Year} BETWEEN ? AND ? '
+    f'GROUP BY 1, 2, 3, 4 ORDER BY 1, 2')
+
 
 class YearMonthIO(Base):
 
@@ -49,20 +60,35 @@ class YearMonthIO(Base):
         self._TE_manager = TransactionsIO()
         self._max_rows_TE = YearMonthTransactionsMax()
         self._max_rows_TE_defined = self._CM.get_config_item(CF_ROWS_TRANSACTION)
+        self._visible_optional_att_names = []
 
     def refresh_data(self) -> Result:
         """
         from_month is always 1.
         to_month is always 12.
+        Only the invalidated years of the account are recalculated (see YearMonthCache).
         """
         self._result = Result()
-        kwargs = self.get_default_kwargs()
+        self._db = self._session.db
+        self._visible_optional_att_names = [
+            k for k in model.get_att_per_name(Table.Year)
+            if k in self._CM.get_extra_column_attribute_names()
+        ]
+        YMC.set_context(self._session.database_path, self._visible_optional_att_names)
+
+        # Month and Year tables are up to date
+        account_bban = get_BBAN_from_IBAN(self._CM.get_config_item(CF_IBAN))
+        if YMC.bban == account_bban:
+            return self._result
+
+        kwargs = YMC.get_kwargs(account_bban) or self.get_default_kwargs()
         # Validate input
         try:
             self._chk_input(**kwargs)
         except GeneralException as e:
             self._result.add_message(f'{error_prefix}{e.message}', MessageSeverity.Error)
             return self._result
+        YMC.set_kwargs(account_bban, kwargs)
 
         from_year = kwargs['from_year']
         from_month = kwargs['from_month']
@@ -70,33 +96,37 @@ class YearMonthIO(Base):
         to_year = kwargs['to_year']
 
         # Go!
-        # Delete the 12 months
-        self._db = self._session.db
+        # Calculate the invalidated years
+        years = range(from_year, to_year + 1)
+        invalid_years = [yy for yy in years if YMC.get_months(account_bban, yy) is None]
+        if invalid_years:
+            # Get the totals per year/month in 1 query
+            totals = {}  # {(year, month): [(booking_type, is_revenue, amount_signed, count)]}
+            for yy, mm, bk_type, is_revenue, amount, count in self._db.fetch_query(
+                    SQL_MONTH_TOTALS, (account_bban, min(invalid_years), max(invalid_years))):
+                totals.setdefault((yy, mm), []).append((bk_type, is_revenue, amount, count))
+            years_with_data = {yy for yy, _ in totals}
+
+            # Calculate the months of the years having transactions
+            for yy in invalid_years:
+                mo_rows = []
+                if yy in years_with_data:
+                    mm_1 = from_month if yy == from_year else 1
+                    mm_2 = 12 if yy < to_year else to_month  # to_month is always 12.
+                    for mm in range(mm_1, mm_2 + 1):
+                        month_totals = totals.get((yy, mm), [])
+                        self._set_max_month(yy, mm, sum(t[3] for t in month_totals))
+                        mo_rows.append(self._calculate_month(month_totals, Month(yy, mm)))
+                YMC.set_months(account_bban, yy, mo_rows)
+
+        # Recreate the Month and Year tables for the account
+        mo_rows = [list(mo_row) for yy in years for mo_row in YMC.get_months(account_bban, yy)]
         self._db.clear(Table.Month)
-
-        account_bban = get_BBAN_from_IBAN(self._CM.get_config_item(CF_IBAN))
-
-        # Get rows per year/month
-        yy = from_year
-        mm = from_month
-        while yy <= to_year:
-            where_year = [Att(FD.Account_bban, account_bban), Att(FD.Year, yy, type=AttType.Int)]
-            if self._db.fetch(Table.TransactionEnriched, where=where_year):
-                mm_2 = 12 if yy < to_year else to_month  # to_month is always 12.
-                while mm <= mm_2:
-                    # Get rows
-                    where = where_year.copy()
-                    where.append(Att(FD.Month, mm, type=AttType.Int))
-                    month_rows = self._db.fetch(Table.TransactionEnriched, where=where)
-                    self._set_max_month(yy, mm, len(month_rows))
-                    # Calculate results
-                    self._db.insert(Table.Month, self._calculate_month(month_rows, Month(yy, mm)), pgm=PGM)
-                    mm += 1
-            mm = 1
-            yy += 1
+        self._db.insert_many(Table.Month, mo_rows, add_audit_values=True, pgm=PGM)
 
         # Year summary
-        self._create_jaaroverzicht(from_year, to_year)
+        self._create_jaaroverzicht(mo_rows)
+        YMC.bban = account_bban
 
         # Completion warnings
         sorted_warnings = sorted(self._warning_rk_dict.items(), key=lambda kv: kv[1][0], reverse=True)
@@ -144,52 +174,29 @@ class YearMonthIO(Base):
         if from_year == to_year and from_month > to_month:
             raise GeneralException(f'maand t/m moet >= maand_vanaf zijn.')
 
-    def _calculate_month(self, te_rows, M: Month) -> list:
+    def _calculate_month(self, month_totals, M: Month) -> list:
+        """
+        month_totals: [(booking_type, is_revenue, amount_signed, count)] of the month.
+        """
         mo_row = [0, 0, 0, 0, 0, 0, 0]
         mo_row[mo_dict[FD.Year]] = M.year
         mo_row[mo_dict[FD.Month]] = M.maand
-        if not te_rows:
+        if not month_totals:
             return mo_row
 
-        bedrag_signed, totaal_abs, split_abs = 0.00, 0.00, 0.00
-
-        # Get visible optional columns
-        visible_optional_att_names = [
-            k for k in model.get_att_per_name(Table.Year)
-            if k in self._CM.get_extra_column_attribute_names()
-        ]
-
-        row_no = 0
-        for te_row in te_rows:
-            row_no += 1
-            # Check jaar-maand
-            jaar = te_row[TE_dict[FD.Year]]
-            maand = te_row[TE_dict[FD.Month]]
-            if jaar != M.year or maand != M.maand:
-                message = f'{PGM} {Color.RED}Error{Color.NC}: ' \
-                          f'Input {M.year}-{M.maand} is ongelijk aan gevonden {jaar}-{maand}.'
-                self._result.add_message(message, severity=MessageSeverity.Error)
-                raise GeneralException(message)
-
-            af_bij = te_row[TE_dict[FD.Add_Sub]].lower()
-            bedrag_abs = te_row[TE_dict[FD.Amount]]
-
-            totaal_abs += bedrag_abs
-            bedrag_signed = bedrag_abs if af_bij == 'bij' else bedrag_abs * -1
-
+        for bk_type, is_revenue, bedrag_signed, _ in month_totals:
             # Algemeen: Saldo, Uitgaven, Inkomsten
             M.balance += bedrag_signed
-            if af_bij == 'bij':
+            if is_revenue:
                 M.revenues += bedrag_signed
             else:
                 M.costs += bedrag_signed
 
             # Boeking-gerelateerd: Inkomsten/uitgaven/overboeking
-            bk_type = BCM.get_value_from_id(te_row[TE_dict[FD.Booking_id]], FD.Booking_type)
             if not bk_type or bk_type in (COSTS, REVENUES):
                 pass
             elif bk_type == OVERBOOKINGS:
-                if FD.Overbooking in visible_optional_att_names:
+                if FD.Overbooking in self._visible_optional_att_names:
                     M.overbooking += bedrag_signed
             else:
                 message = f'{PGM} {Color.RED}Error{Color.NC}: ' \
@@ -215,33 +222,28 @@ class YearMonthIO(Base):
         mo_row[mo_dict[FD.Balance_corrected]] = round(M.balance_corrected, 2)
         return mo_row
 
-    def _create_jaaroverzicht(self, from_year=None, to_year=None):
-        yy = from_year
-        while yy <= to_year:
-            where = [Att(FD.Year, value=yy, type=AttType.Int)]
-            # Get rows
-            mo_rows = self._db.fetch(Table.Month, where=where)
-            # Calculate results
-            if mo_rows:
-                jo_row = self._get_jaaroverzicht(mo_rows)
-                # Recreate jaar
-                if jo_row:
-                    self._db.delete(Table.Year, where=where)
-                    self._db.insert(Table.Year, jo_row, pgm=PGM)
-            yy += 1
+    def _create_jaaroverzicht(self, mo_rows):
+        """ mo_rows: the calculated months, ordered by year """
+        mo_rows_per_year = {}
+        [mo_rows_per_year.setdefault(mo_row[mo_dict[FD.Year]], []).append(mo_row) for mo_row in mo_rows]
+        jo_rows = [self._get_jaaroverzicht(rows) for rows in mo_rows_per_year.values()]
+        jo_rows = [jo_row for jo_row in jo_rows if jo_row]
+        # Recreate jaar
+        self._db.clear(Table.Year)
+        self._db.insert_many(Table.Year, jo_rows, add_audit_values=True, pgm=PGM)
 
     @staticmethod
     def _get_jaaroverzicht(mo_rows) -> list:
-        # MO: [id, jaar, maand, [bedragen]]
+        # MO: [jaar, maand, [bedragen]]
         # JO: jaar, [bedragen]
         if not mo_rows or not mo_rows[0]:
             return []
 
-        jo_row = [mo_rows[0][1], 0.00, 0.00, 0.00, 0.00, 0.00]
+        jo_row = [mo_rows[0][0], 0.00, 0.00, 0.00, 0.00, 0.00]
         for mo_row in mo_rows:
             # Add month amounts
-            for i in range(3, len(jo_row) + 2):  # skip {id, jaar, month} columns
-                jo_row[i - 2] = jo_row[i - 2] + float(mo_row[i])
+            for i in range(2, len(jo_row) + 1):  # skip {jaar, month} columns
+                jo_row[i - 1] = jo_row[i - 1] + float(mo_row[i])
         for i in range(1, len(jo_row)):
             jo_row[i] = toFloat(jo_row[i])
         return jo_row
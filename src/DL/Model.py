@@ -94,6 +94,12 @@ class FD:
     Key = 'Key'
     Value = 'Value'
 
+    # ImportFile
+    File_path = 'BestandsPad'
+    File_size = 'BestandsGrootte'
+    File_mtime = 'BestandsWijzigingstijd'
+    File_hash = 'BestandsHash'
+
     # Log
     Log = 'Log'
     Log_entry = 'Logregels'
@@ -193,6 +199,7 @@ class Model:
             Table.BookingCode,
             Table.CounterAccount,
             Table.FlatFiles,  # Retrieved kv-pairs from TransactionEnriched
+            Table.ImportFile,
             Table.Log,
             Table.Month,
             Table.OpeningBalance,
@@ -240,6 +247,13 @@ class Model:
             2: Att(FD.Value)
         })
 
+        self._ImportFile = OrderedDict({
+            1: Att(FD.File_path),
+            2: Att(FD.File_size, type=AttType.Int),
+            3: Att(FD.File_mtime, type=AttType.Float),
+            4: Att(FD.File_hash)
+        })
+
         self._TransactieCode = OrderedDict({
             1: Att(FD.Transaction_code),
         })
@@ -347,6 +361,7 @@ class Model:
             Table.BookingCode: self._BookingCode,
             Table.CounterAccount: self._CounterAccount,
             Table.FlatFiles: self._FlatFiles,
+            Table.ImportFile: self._ImportFile,
             Table.Log: self._Log,
             Table.Month: self._Month,
             Table.OpeningBalance: self._OpeningBalance,
@@ -395,6 +410,7 @@ class Model:
                     [FD.Key,
                      FD.ID],
             },
+            Table.ImportFile: {PK: [FD.File_path]},
             Table.Month: {PK: [FD.Year, FD.Month]},
             Table.OpeningBalance: {PK: [FD.Year]},
             Table.SearchTerm: {
@@ -464,6 +480,13 @@ class Model:
             Table.Year: {PK: [FD.Year]},
         }
 
+        # Full-text indexes (search in text)
+        self._TextIndexes = {
+            Table.TransactionEnriched: {
+                Table.TransactionSearch: [FD.Name, FD.Comments, FD.Remarks],
+            },
+        }
+
     def get_FFD(self):
         """
         :return: File Field Definition.
@@ -476,6 +499,12 @@ class Model:
         """
         return self._Indexes.get(table_name, {})
 
+    def get_text_indexes(self, table_name):
+        """
+        :return: Table full-text indexes.
+        """
+        return self._TextIndexes.get(table_name, {})
+
     def _get_pk_names(self, table_name, include_id=False) -> list:
         """
         :return: PK index.
@@ -8,9 +8,9 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2023-10-20 PHe First creation
+# 2026-10-18 PHe Tableau color mapping is imported when used (headless CLI)
 # ---------------------------------------------------------------------------------------------------------------------
 from src.DL.Objects.TimelineItem import TimelineItem
-from src.VL.Functions import map_tableau_color
 
 BAR = 'bar'
 LINE = 'line'
@@ -48,6 +48,7 @@ class Figure:
 
     @color_name.setter
     def color_name(self, value: dict):
+        from src.VL.Functions import map_tableau_color
         self._color_name = value
         self._color_tableau = map_tableau_color(value)
 
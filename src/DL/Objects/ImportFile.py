@@ -0,0 +1,27 @@
+from src.GL.Const import EMPTY
+
+
+class ImportFile(object):
+    """ Fingerprint of an imported bank transaction file """
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def mtime(self):
+        return self._mtime
+
+    @property
+    def hash(self):
+        return self._hash
+
+    def __init__(self, path=EMPTY, size=0, mtime=0.0, hash=EMPTY):
+        self._path = path
+        self._size = size
+        self._mtime = mtime
+        self._hash = hash
@@ -29,6 +29,10 @@ class TransactionFile(object):
     def colno_mapping(self):
         return self._colno_mapping
 
+    @property
+    def column_count(self):
+        return self._column_count
+
     @property
     def error_message(self):
         return self._error_message
@@ -49,9 +53,10 @@ class TransactionFile(object):
     def error_message(self, value):
         self._error_message = value
 
-    def __init__(self, path: str, colno_mapping: dict, delimiter=','):
+    def __init__(self, path: str, colno_mapping: dict, delimiter=',', column_count=0):
         self._colno_mapping = colno_mapping
         self._delimiter = delimiter
+        self._column_count = column_count
         self._dir_name = None
         self._file_name = None
         self._path = path
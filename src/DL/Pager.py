@@ -0,0 +1,61 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+from src.DL.DBDriver.Const import PAGE_SIZE
+from src.DL.Model import FD, Model
+from src.GL.BusinessLayer.SessionManager import Singleton as Session
+
+model = Model()
+
+
+class Pager(object):
+    """
+    The rows of a query one page at a time, on demand (keyset pagination, see DBDriver.fetch_page).
+    The total is counted in the database, so the rows do not have to be loaded for it.
+    """
+
+    @property
+    def total(self):
+        return self._total
+
+    @property
+    def fetched(self):
+        return self._fetched
+
+    @property
+    def has_more(self):
+        return self._fetched < self._total
+
+    def __init__(self, table_name, keys, where=None, match=None, page_size=PAGE_SIZE, descending=True):
+        """
+        keys: Attribute names that identify a row in the order, e.g. [Date, Id] (newest first).
+        where, match: like DBDriver.fetch
+        """
+        self._db = Session().db
+        self._table_name = table_name
+        self._keys = keys
+        self._key_colnos = [0 if key == FD.ID else model.get_column_number(table_name, key) for key in keys]
+        self._kwargs = {'where': where, 'match': match}
+        self._page_size = page_size
+        self._descending = descending
+        self._after = None
+        self._fetched = 0
+        self._total = self._db.count(table_name, **self._kwargs)
+
+    def next_page(self) -> list:
+        if not self.has_more:
+            return []
+        rows = self._db.fetch_page(
+            self._table_name, self._keys, after=self._after, limit=self._page_size, descending=self._descending,
+            **self._kwargs)
+        if not rows:
+            self._total = self._fetched  # Rows deleted in the meantime
+            return []
+        self._after = [rows[-1][c] for c in self._key_colnos]
+        self._fetched += len(rows)
+        return rows
@@ -15,12 +15,14 @@ class Table:
     BookingCode = 'BookingCode'
     CounterAccount = 'CounterAccount'
     FlatFiles = 'FlatFiles'  # Key-value pairs in combo boxes (boeking, tegenrekening, transactie-soort etc.)
+    ImportFile = 'ImportFile'  # Fingerprints of the imported bank transaction files
     Log = 'Log'
     Month = 'Month'
     OpeningBalance = 'OpeningBalance'
     SearchTerm = 'SearchTerm'
     Transaction = 'BankTransaction'   # Transaction is a reserved db word
     TransactionEnriched = 'TransactionEnriched'
+    TransactionSearch = 'TransactionSearch'  # Full-text index on TransactionEnriched
     TransactionType = 'TransactionType'
     Year = 'Year'
 
@@ -30,6 +32,7 @@ class Table:
         BookingCode: 'BC',
         CounterAccount: 'CA',
         FlatFiles: 'FF',
+        ImportFile: 'IF',
         Log: 'LG',
         Month: 'MO',
         OpeningBalance: 'OB',
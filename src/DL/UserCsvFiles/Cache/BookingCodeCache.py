@@ -5,6 +5,7 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2018-12-20 PHe First creation
+# 2026-10-18 PHe matcher and protected_maingroup_booking_codes properties
 # ---------------------------------------------------------------------------------------------------------------------
 from src.Base import Base
 from src.DL.Config import CF_IMPORT_PATH_BOOKING_CODES, CF_IMPORT_PATH_COUNTER_ACCOUNTS, \
@@ -12,6 +13,7 @@ from src.DL.Config import CF_IMPORT_PATH_BOOKING_CODES, CF_IMPORT_PATH_COUNTER_A
 from src.DL.DBDriver.Enums import FetchMode
 from src.DL.Model import Model, FD
 from src.DL.Table import Table
+from src.DL.UserCsvFiles.Cache.KeywordMatcher import KeywordMatcher
 from src.GL.Const import EMPTY
 from src.GL.Enums import Color, MessageSeverity
 from src.GL.Result import Result
@@ -36,6 +38,14 @@ class Singleton:
         def formatted_booking_descriptions(self):
             return self._formatted_booking_descriptions
 
+        @property
+        def matcher(self):
+            return self._matcher
+
+        @property
+        def protected_maingroup_booking_codes(self):
+            return self._protected_maingroup_booking_codes
+
         def __init__(self):
             super().__init__()
             self._booking_codes = set()
@@ -46,6 +56,7 @@ class Singleton:
             self._protected_maingroup_booking_codes = {}
             self._ids_by_key = {}
             self._ids_by_code = {}
+            self._matcher = KeywordMatcher([])
 
             # Atts
             self._types_by_id = {}
@@ -73,6 +84,8 @@ class Singleton:
             self._initialized = True
 
             [self._process_booking_row(row, d) for row in rows]
+            self._matcher = KeywordMatcher(
+                [booking_code for booking_code in self._booking_codes if len(booking_code) > 2])
             self._formatted_descriptions = [
                 self._get_formatted_desc(booking_code) for booking_code in self._booking_codes]
 
@@ -97,9 +110,7 @@ class Singleton:
         def get_booking_code_from_item(self, item) -> str:
             """ Get the booking_code present in the 1st matching item """
             self.initialize()  # 1st time
-            booking_codes = [booking_code for booking_code in self._booking_codes
-                             if len(booking_code) > 2 and booking_code in item]
-            return booking_codes[0] if booking_codes else EMPTY
+            return self._matcher.find(item) or EMPTY
 
         def _process_booking_row(self, row, d):
             type = row[d[FD.Booking_type]]
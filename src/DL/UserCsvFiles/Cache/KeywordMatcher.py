@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+from collections import deque
+
+# Below this number of keywords a linear scan with "in" is faster than the automaton.
+LINEAR_SCAN_MAX = 50
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a list of keywords.
+    find() returns the keyword with the lowest index in the list that occurs in the text,
+    like a linear scan "first keyword that is in the text" does, but in one pass over the text.
+    For a small number of keywords the linear scan is used.
+    """
+
+    @property
+    def keywords(self):
+        return self._keywords
+
+    def __init__(self, keywords):
+        self._keywords = list(keywords)
+        self._goto = [{}]  # Per state: { char: next state }
+        self._best = [None]  # Per state: lowest keyword index ending here (incl. via failure links)
+        self._linear = len(self._keywords) < LINEAR_SCAN_MAX
+        if not self._linear:
+            self._build()
+
+    def _build(self):
+        # Trie
+        for index, keyword in enumerate(self._keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    self._goto.append({})
+                    self._best.append(None)
+                    next_state = len(self._goto) - 1
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._set_best(state, index)
+
+        # Failure links (breadth first). Complete the transitions, so that searching needs no fallback loop.
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            f = fail[state]
+            self._set_best(state, self._best[f])
+            for char, next_state in self._goto[state].items():
+                fail[next_state] = self._goto[f].get(char, 0)
+                queue.append(next_state)
+            for char, next_state in self._goto[f].items():
+                if char not in self._goto[state]:
+                    self._goto[state][char] = next_state
+
+    def _set_best(self, state, index):
+        if index is not None and (self._best[state] is None or index < self._best[state]):
+            self._best[state] = index
+
+    def find(self, text):
+        """ @return: The first keyword (in list order) that occurs in the text, else None. """
+        if self._linear:
+            return next((keyword for keyword in self._keywords if keyword in text), None)
+
+        goto, best = self._goto, self._best
+        result = best[0]  # Empty keyword
+        state = 0
+        for char in text:
+            state = goto[state].get(char, 0)
+            index = best[state]
+            if index is not None and (result is None or index < result):
+                result = index
+                if result == 0:
+                    break
+        return self._keywords[result] if result is not None else None
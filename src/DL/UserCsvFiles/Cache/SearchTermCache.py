@@ -5,10 +5,12 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2023-02-12 PHe First creation
+# 2026-10-18 PHe matcher property
 # ---------------------------------------------------------------------------------------------------------------------
 from src.Base import Base
 from src.DL.DBDriver.Enums import FetchMode
 from src.DL.Model import Model, FD
+from src.DL.UserCsvFiles.Cache.KeywordMatcher import KeywordMatcher
 from src.DL.Table import Table
 from src.GL.Const import EMPTY
 
@@ -24,9 +26,14 @@ class Singleton:
         def search_terms(self):
             return self._search_terms
 
+        @property
+        def matcher(self):
+            return self._matcher
+
         def __init__(self):
             super().__init__()
             self._search_terms = {}
+            self._matcher = KeywordMatcher([])
             self._initialized = False
 
         def initialize(self, force=False):
@@ -43,6 +50,7 @@ class Singleton:
                 row[d[FD.SearchTerm]].lower(): row[d[FD.Booking_code]]
                 for row in rows
             }
+            self._matcher = KeywordMatcher(self._search_terms.keys())
 
         def get_booking_code(self, name, comment, remark=None) -> str:
             self.initialize()
@@ -56,11 +64,8 @@ class Singleton:
 
         def get_booking_code_from_item(self, item) -> str:
             """ Get the booking_code belonging to the 1st matching search term """
-            booking_codes = [
-                booking_code for search_term, booking_code in self._search_terms.items()
-                if search_term in item.lower()
-            ]
-            return booking_codes[0] if booking_codes else EMPTY
+            search_term = self._matcher.find(item.lower())
+            return self._search_terms[search_term] if search_term is not None else EMPTY
 
     # storage for the instance reference
     __instance = None
@@ -5,6 +5,7 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2018-12-20 PHe First creation
+# 2026-10-18 PHe get_booking_codes_by_te_key
 # ---------------------------------------------------------------------------------------------------------------------
 from src.Base import Base
 from src.DL.Model import Model, FD
@@ -59,6 +60,11 @@ class Singleton:
             row = self._mutations_by_te_key.get(te_key, EMPTY)
             return row[row_def[FD.Booking_code]] if row else EMPTY
 
+        def get_booking_codes_by_te_key(self) -> dict:
+            """ return: { te_key: booking code } """
+            self.initialize()  # 1st time
+            return {te_key: row[row_def[FD.Booking_code]] for te_key, row in self._mutations_by_te_key.items()}
+
         def get_remarks(self, te_key) -> str:
             self.initialize()  # 1st time
             return self._remarks_by_te_key.get(te_key, EMPTY)
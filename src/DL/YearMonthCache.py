@@ -0,0 +1,97 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+class Singleton:
+    """ Singleton """
+
+    class YearMonthCache(object):
+        """
+        The Month and Year tables are a materialised view of TransactionEnriched for the current account.
+        The calculated months are remembered per account and year, until they are invalidated
+        by an import, a booking update or another set of visible optional columns.
+        """
+
+        @property
+        def bban(self):
+            """ Account of which the Month and Year tables are up to date. """
+            return self._bban
+
+        @bban.setter
+        def bban(self, value):
+            self._bban = value
+
+        def __init__(self):
+            self._bban = None
+            self._context = None
+            self._kwargs = {}  # { bban: year/month range }
+            self._months = {}  # { bban: { year: [mo_rows] } }
+
+        def set_context(self, database_path, visible_optional_att_names):
+            """ Another database or other visible optional columns: invalidate all. """
+            context = (database_path, tuple(visible_optional_att_names))
+            if context != self._context:
+                self.invalidate()
+                self._context = context
+
+        def invalidate(self, bban=None, years=None):
+            """
+            bban: Only this account, default is all.
+            years: Only these years of the account, default is all.
+            """
+            if bban is None:
+                self._bban = None
+                self._kwargs = {}
+                self._months = {}
+                return
+            if bban == self._bban:
+                self._bban = None
+            # The year range may be extended too.
+            self._kwargs.pop(bban, None)
+            if years is None:
+                self._months.pop(bban, None)
+            else:
+                [self._months.get(bban, {}).pop(yy, None) for yy in years]
+
+        def get_kwargs(self, bban) -> dict or None:
+            return self._kwargs.get(bban)
+
+        def set_kwargs(self, bban, kwargs):
+            self._kwargs[bban] = kwargs
+
+        def get_months(self, bban, year) -> list or None:
+            return self._months.get(bban, {}).get(year)
+
+        def set_months(self, bban, year, mo_rows):
+            self._months.setdefault(bban, {})[year] = mo_rows
+
+    # ---------------------------------------------------------------------------------------------------------------------
+    # Singleton logic
+    # ---------------------------------------------------------------------------------------------------------------------
+
+    # storage for the instance reference
+    _instance = None
+
+    def __init__(self):
+        """ Create singleton instance """
+        # Check whether we already have an instance
+        if Singleton._instance is None:
+            # Create and remember instance
+            Singleton._instance = Singleton.YearMonthCache()
+
+        # Store instance reference as the only member in the handle
+        self.__dict__['__Singleton_instance'] = Singleton._instance
+
+    def __getattr__(self, attr):
+        """ Delegate access to implementation """
+        return getattr(self._instance, attr)
+
+    def __setattr__(self, attr, value):
+        """ Delegate access to implementation """
+        return setattr(self._instance, attr, value)
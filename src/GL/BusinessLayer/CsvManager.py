@@ -134,6 +134,40 @@ class CsvManager(object):
             rows = self._filtered_rows(rows, where)
         return rows
 
+    def stream_rows(self, data_path=None, delimiter=None, include_header_row=False, include_empty_row=False):
+        """
+        Read rows from disk one by one (generator), so a file is never completely in memory.
+        The delimiter should be known already (e.g. via get_first_row).
+        """
+        method = 'stream_rows'
+        if not is_valid_file(data_path):
+            return
+
+        if not self._delimiter or delimiter:
+            self._set_delimiter(data_path, delimiter)
+
+        try:
+            with open(data_path, encoding='utf-8-sig', errors='replace') as csvFile:
+                csv_reader = csv.reader(
+                    csvFile, delimiter=self._delimiter, quotechar='"', quoting=csv.QUOTE_MINIMAL,
+                    skipinitialspace=True)
+                sanitize = False
+                for index, row in enumerate(csv_reader):
+                    if index == 0 and len(row) == 1 and self._delimiter in row[0]:
+                        sanitize = True
+                    if sanitize:
+                        row = self._sanitize_csv_row(row[0], self._delimiter)
+                    if index == 0 and not include_header_row:
+                        continue
+                    # Optionally skip empty rows
+                    if not row and include_empty_row:
+                        row = [EMPTY]
+                    elif not include_empty_row and all(cell == EMPTY for cell in row):
+                        continue
+                    yield row
+        except (IOError, csv.Error) as e:
+            raise GeneralException(f'{PGM}.{method}: {e}')
+
     @staticmethod
     def _filtered_rows(rows, where: dict):
         out_rows = []
@@ -5,12 +5,17 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2018-12-20 PHe First creation
+# 2026-10-18 PHe Buffered log file via LogWriter
+# 2026-10-18 PHe The LogWriter is created once, also when logging from several threads
 # -----------------------------------------------------------------------------------------------------------
 
+import atexit
 import os
 import platform
+import threading
 
 from src.GL.Enums import LogLevel, LogType, Color, ColorWin, MessageSeverity as Sev
+from .LogWriter import LogWriter
 from ..Functions import is_valid_file
 from ..GeneralException import GeneralException
 
@@ -71,6 +76,9 @@ class Singleton:
             self.previous_line = EMPTY
             self.previous_lineNC = EMPTY
             self._log_path = EMPTY
+            self._writer = None
+            self._writer_lock = threading.Lock()
+            atexit.register(self.close)
 
             if platform.system().lower() == 'linux' \
                     or platform.system().lower() == 'osx' \
@@ -113,6 +121,7 @@ class Singleton:
             if not log_dir or not os.path.exists(log_dir):
                 raise GeneralException(f'{__name__}: A directory is required.')
             self._log_file_name = f'Log{suffix}.txt'
+            self.close()
             self._log_path = log_dir + self.log_file_name
             if initialize and is_valid_file(self._log_path):
                 os.remove(self._log_path)
@@ -136,6 +145,8 @@ class Singleton:
             # File: no colors.
             if self.log_type == LogType.Both or self.log_type == LogType.File:
                 self._append_file(str(line))
+                if sev == Sev.Error:
+                    self.flush()
 
         def add_coloured_line(self, line, color=None, new_line=True, sev=Sev.Completion):
             """
@@ -169,6 +180,8 @@ class Singleton:
                 # File
                 if self.log_type == LogType.Both or self.log_type == LogType.File:
                     self._append_file(f'{str(self.previous_lineNC)}{str(lineNC)}')
+                    if sev == Sev.Error:
+                        self.flush()
 
                 # Initialize previous fields
                 self.previous_line = EMPTY
@@ -176,8 +189,28 @@ class Singleton:
 
         def _append_file(self, line):
             # File: no colors.
-            with open(self._log_path, 'a') as txtFile:
-                txtFile.write(self._colorless(line) + '\n')
+            writer = self._writer or self._get_writer()
+            writer.write(self._colorless(line) + '\n')
+
+        def _get_writer(self) -> LogWriter:
+            """ The first line creates the writer, also if several threads log it at the same time. """
+            with self._writer_lock:
+                if not self._writer:
+                    self._writer = LogWriter(self._log_path)
+                return self._writer
+
+        def flush(self):
+            """ Write the buffered lines to the log file, e.g. before reading it. """
+            writer = self._writer
+            if writer:
+                writer.flush()
+
+        def close(self):
+            """ Flush and close the log file. """
+            with self._writer_lock:
+                writer, self._writer = self._writer, None
+            if writer:
+                writer.close()
 
         @staticmethod
         def _colorless(line):
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# 2026-10-18 PHe Bounded queue: write waits while the queue is full
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import queue
+import threading
+import time
+
+QUEUE_SIZE = 10000  # Lines. When full, the logging threads wait for the writer.
+FLUSH_LINES = 1000
+FLUSH_SECONDS = 1.0
+EMPTY_QUEUE = object()
+
+
+class LogWriter(object):
+    """
+    Appends lines to a log file via a background thread.
+    The file stays open, lines are written in batches and flushed to disk
+    after FLUSH_LINES lines or FLUSH_SECONDS, on flush() and on close().
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._pid = os.getpid()
+        self._queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._file = open(path, 'a')
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='LogWriter', daemon=True)
+        self._thread.start()
+
+    def write(self, line):
+        """ line: incl. new line """
+        if os.getpid() != self._pid or not self._running:
+            # Forked process (e.g. a process pool worker): the writer thread is not there.
+            with open(self._path, 'a') as txtFile:
+                txtFile.write(line)
+            return
+        if not self._put(line):
+            with open(self._path, 'a') as txtFile:
+                txtFile.write(line)
+
+    def flush(self):
+        """ Wait until all queued lines are on disk. """
+        if os.getpid() != self._pid or not self._running:
+            return
+        done = threading.Event()
+        if not self._put(done):
+            return
+        while not done.wait(FLUSH_SECONDS) and self._running:
+            pass
+
+    def close(self):
+        if os.getpid() != self._pid:
+            return
+        if self._put(None):
+            self._thread.join()
+        self._file.close()
+
+    def _put(self, item) -> bool:
+        """ Queue the item, waiting while the queue is full. False if the writer thread has stopped. """
+        while self._running:
+            try:
+                self._queue.put(item, timeout=FLUSH_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run(self):
+        try:
+            self._write_batches()
+        finally:
+            self._running = False
+
+    def _write_batches(self):
+        lines, last_flush = [], time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=FLUSH_SECONDS)
+            except queue.Empty:
+                item = EMPTY_QUEUE
+            if isinstance(item, str):
+                lines.append(item)
+                if len(lines) < FLUSH_LINES and time.monotonic() - last_flush < FLUSH_SECONDS:
+                    continue
+            # Flush: batch full, time elapsed, flush request or close
+            if lines:
+                self._file.writelines(lines)
+                lines = []
+            self._file.flush()
+            last_flush = time.monotonic()
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                return
+
@@ -3,10 +3,11 @@ from datetime import datetime
 
 from src.BL.Managers.BookingCodeManager import BookingCodeManager
 from src.BL.Managers.ConsistencyManager import ConsistencyManager
+from src.BL.Managers.EnrichmentManager import EnrichmentManager
 from src.BL.Managers.ImportManager import ImportManager
 from src.BL.Validator import Validator, slash
 from src.DL.Config import CF_IBAN, TAB_LOG, CMD_IMPORT_TE, CMD_WORK_WITH_BOOKING_CODES, \
-    CMD_WORK_WITH_SEARCH_TERMS, CF_COUNTER_ACCOUNT_BOOKING_DESCRIPTION, CF_POPUP_INPUT_VALUE
+    CMD_WORK_WITH_SEARCH_TERMS, CF_COUNTER_ACCOUNT_BOOKING_DESCRIPTION, CF_POPUP_INPUT_VALUE, CF_IMPORT_INCREMENTAL
 from src.DL.Config import CF_OUTPUT_DIR, CF_VERBOSE, \
     CF_INPUT_DIR, CMD_HELP_WITH_BOOKING, get_label, CMD_HELP_WITH_OUTPUT_DIR, INPUT_DIR, CMD_FACTORY_RESET, \
     CF_REMARKS, get_text_file
@@ -244,7 +245,9 @@ class MainController(BaseController):
         elif self._event_key == CMD_IMPORT_TE:
             self._diag_message(f'{diag_prefix}Import button pressed')
             self._save_and_backup()
-            self.import_transactions()
+            # Incremental: only the new bank transactions, the user data is kept.
+            incremental = toBool(self._CM.get_config_item(CF_IMPORT_INCREMENTAL, False))
+            self.import_transactions(import_user_csv_files=not incremental, incremental=incremental)
 
         # - Config
         elif self._event_key == CMD_CONFIG:
@@ -261,6 +264,7 @@ class MainController(BaseController):
         # - Summary
         elif self._event_key == CMD_SUMMARY:
             self._diag_message(f'{diag_prefix}Summary button pressed')
+            self._main_model.models[Pane.TE].load_all()
             SummaryWindow(self._main_model.models[Pane.TE].rows).display()
 
         # - Undo
@@ -290,6 +294,7 @@ class MainController(BaseController):
                 self._result = self._main_model.refresh_dashboard(Pane.MS, pane_row_no=event[2][0])
             elif event[0] == Table.TransactionEnriched:
                 self._diag_message(f'{diag_prefix}Transactions enriched')
+                self._main_model.load_more_transactions(event[2][0])
                 self._result = self._main_model.refresh_dashboard(Pane.TE, pane_row_no=event[2][0], TX_only=True)
             elif event[0] == Table.Log:
                 self._diag_message('Handling event - Log row selected')
@@ -349,6 +354,8 @@ class MainController(BaseController):
     def _maintain_booking_code_related(self, prefix, table_name, table_desc, window, refresh=True):
         self._diag_message(f'{prefix}Work with {table_desc} button pressed')
 
+        SearchTermCache().initialize()
+        search_terms = dict(SearchTermCache().search_terms)
         self._maintain_list(window)
         if refresh is False or not self._session.is_user_table_changed(table_name):
             return  # May be skipped (Opening balance)
@@ -360,7 +367,17 @@ class MainController(BaseController):
                     BookingCodeCache().initialize(force=True)  # BookingCodes
                 elif table_name == Table.SearchTerm:
                     SearchTermCache().initialize(force=True)  # SearchTerms
-        if self._session.is_user_table_changed():
+        # Only search terms changed: book the transactions containing them again, instead of a re-import.
+        changed_tables = [name for name, changed in self._session.user_tables_changed.items() if changed]
+        if changed_tables == [Table.SearchTerm]:
+            self._save_and_backup()
+            new_search_terms = SearchTermCache().search_terms
+            count = EnrichmentManager().reenrich(search_terms=[
+                term for term in set(search_terms) | set(new_search_terms)
+                if search_terms.get(term) != new_search_terms.get(term)])
+            self._result = self._main_model.refresh_dashboard()
+            self._result.add_message(f'{count} {TRANSACTIONS} zijn opnieuw geboekt.')
+        elif self._session.is_user_table_changed():
             self._save_and_backup()
             self.import_transactions()
 
@@ -452,14 +469,16 @@ class MainController(BaseController):
     Dashboard
     """
 
-    def import_transactions(self, import_user_csv_files=True):
+    def import_transactions(self, import_user_csv_files=True, incremental=False):
         self._result = Result()
 
         # - First save pending booking related data, and backup it in the csv folder of today.
         self._save_and_backup(validate_db=False)
 
-        # Ask user confirmation
-        if import_user_csv_files and not self._is_import_confirmed():
+        # Ask user confirmation (incremental import does not replace the data)
+        # Importing the user data (e.g. after editing booking codes) is always a full import.
+        incremental = incremental and not import_user_csv_files
+        if import_user_csv_files and not incremental and not self._is_import_confirmed():
             return
 
         # Go
@@ -477,7 +496,7 @@ class MainController(BaseController):
             self._start_log('Import')
 
             # - Import
-            result = self._IM.start(import_user_csv_files)
+            result = self._IM.start(import_user_csv_files, incremental=incremental)
             self._import_log()
 
             if result.OK:
@@ -595,7 +614,8 @@ class MainController(BaseController):
                 self._factory_reset(to_text_key(CMD_FACTORY_RESET))
                 break
             if self._result.OK and self._config_window.model.do_import:
-                self.import_transactions(import_user_csv_files=False)
+                # Restored user data or another input folder: replace all transactions.
+                self.import_transactions(import_user_csv_files=False, incremental=False)
                 break
             if not self._result.RT:  # Account description changed: redisplay
                 break
@@ -658,6 +678,7 @@ class MainController(BaseController):
 
     def _import_log(self):
         log_file_name = Log().log_file_name
+        Log().flush()
         with open(f'{self._session.log_dir}{log_file_name}') as f:
             lines = f.readlines()
         out_lines = [[remove_crlf(line)] for line in lines]
@@ -5,6 +5,7 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2022-06-06 PHe First creation
+# 2026-10-18 PHe Paged search
 # ---------------------------------------------------------------------------------------------------------------------
 
 from src.DL.Config import CMD_HELP_WITH_SEARCH, \
@@ -34,7 +35,7 @@ class SearchController(BaseController):
         if self._event_key == CMD_HELP_WITH_SEARCH:
             help_message(CMD_HELP_WITH_SEARCH)
         elif self._event_key == CMD_SEARCH:
-            self._result = self._transactions_IO.search()
+            self._result = self._transactions_IO.search(paged=True)
 
         elif self._event_key == CMD_SEARCH_RESET:
             self._CM.initialize_search_criteria()
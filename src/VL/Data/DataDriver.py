@@ -92,11 +92,9 @@ class Singleton:
                 items = [x for x in BCM.get_booking_code_descriptions(include_protected=False)]
             elif combo_name == FD.Booking_description_searchable:
                 # Only booking descriptions that are present in TransactionEnriched
-                booking_ids = [
-                    row[0] for row in self._db.select(Table.BookingCode)
-                    if self._db.count(Table.TransactionEnriched, where=[Att(FD.Booking_id, row[0])]) > 0
-                ]
-                items = sorted([BCM.get_value_from_id(Id, FD.Booking_description) for Id in booking_ids])
+                booking_ids = self.count_per(Table.TransactionEnriched, FD.Booking_id)
+                items = sorted([BCM.get_value_from_id(row[0], FD.Booking_description)
+                                for row in self._db.select(Table.BookingCode) if row[0] in booking_ids])
             # Set combo
             self._combos[combo_name] = [EMPTY]
             if items:
@@ -140,6 +138,10 @@ class Singleton:
             """ db may not yeet been started in error condition """
             return self._db.count(table_name) if self._db else 0
 
+        def count_per(self, table_name, name, where=None) -> dict:
+            """ { value: row count } """
+            return self._db.count_per(table_name, name, where=where) if self._db else {}
+
         def insert_many(self, table_name, rows, clear=False):
             if clear:
                 self._db.clear(table_name)
@@ -154,13 +156,7 @@ class Singleton:
             return rows
 
         def fetch_set(self, table_name, where=None, order_by=None, header=True) -> list:
-            rows = []
-            if header:
-                no_id_row = model.get_report_colhdg_names(table_name, include_not_in_db=True)
-                row = [ID]
-                for name in no_id_row:
-                    row.append(name)
-                rows.append(row)
+            rows = [self.get_header(table_name)] if header else []
             if table_name == Table.Month:
                 order_by = [[Att(FD.Year), 'DESC'], [Att(FD.Month), 'ASC']]
             elif table_name == Table.Year:
@@ -186,6 +182,10 @@ class Singleton:
                         row[d[FD.Booking_code]], FD.Booking_description)
             return rows
 
+        @staticmethod
+        def get_header(table_name) -> list:
+            return [ID, *model.get_report_colhdg_names(table_name, include_not_in_db=True)]
+
         """
         Save user updates
         """
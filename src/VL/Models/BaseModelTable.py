@@ -84,12 +84,7 @@ class BaseModelTable(BaseModel):
             return 0
 
         self._rows = data[1:]  # Skip header
-
-        # - Format the row cells.
-        #   Rows also contain "Id" and "audit data". Format only model attributes.
-        for r in self._rows:
-            for i in range(1, len(self._col_def) + 1):  # Skip Id
-                r[i] = self._format_cell(i, str(r[i]))
+        self._format_rows(self._rows)
 
         # - After formatting (like justify!) the width is dynamically calculated.
         font_size = self._CM.get_font()[1]
@@ -98,6 +93,15 @@ class BaseModelTable(BaseModel):
 
         return len(self._rows)
 
+    def _format_rows(self, rows):
+        """
+        Format the row cells.
+        Rows also contain "Id" and "audit data". Format only model attributes.
+        """
+        for r in rows:
+            for i in range(1, len(self._col_def) + 1):  # Skip Id
+                r[i] = self._format_cell(i, str(r[i]))
+
     def _format_cell(self, col_no, att_value) -> str:
         att_def = self._col_def[col_no]  # Convert to string
         if att_def.type == AttType.Float:
@@ -7,6 +7,7 @@ from src.DL.IO.AccountIO import AccountIO
 from src.DL.IO.TransactionsIO import TransactionsIO
 from src.DL.IO.YearMonthIO import YearMonthIO
 from src.DL.Model import FD
+from src.DL.Pager import Pager
 from src.DL.Table import Table
 from src.VL.Data.Constants.Enums import Pane
 from src.DL.Lexicon import TRANSACTIONS, CMD_IMPORT_TE
@@ -24,6 +25,8 @@ from src.GL.Enums import MessageSeverity
 from src.GL.Result import Result
 
 TE_dict = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)
+# Transactions pane: newest first
+TE_KEYS = [FD.Date, FD.ID]
 
 
 class MainModel(BaseModelTable):
@@ -177,7 +180,7 @@ class MainModel(BaseModelTable):
         # b. Get the month with the most "reasonable" amount of month transactions.
         max_rows = self._CM.get_config_item(CF_ROWS_TRANSACTION, 0)
         year = int(TE_row[TE_dict[FD.Year]])
-        month_counts = [self._get_month_transactions_count(bban, year, month) for month in range(1, 13)]
+        month_counts = self._get_month_transactions_counts(bban, year)
         month = 0
         # b1. Get first month having defined transaction window size
         for c in range(12):
@@ -202,16 +205,18 @@ class MainModel(BaseModelTable):
         year_row_no = years.index(year)
 
         # d. Set transaction pane
-        self.models[Pane.TE].set_data(DD.fetch_set(
-            Table.TransactionEnriched, where=[Att(FD.Year, year), Att(FD.Month, month)]))
+        self.models[Pane.TE].set_pager(
+            Pager(Table.TransactionEnriched, keys=TE_KEYS, where=[Att(FD.Year, year), Att(FD.Month, month)]),
+            DD.get_header(Table.TransactionEnriched))
 
         return year_row_no, month_row_no
 
     @staticmethod
-    def _get_month_transactions_count(bban, year, month) -> int:
-        return len(DD.fetch_set(
-            Table.TransactionEnriched,
-            where=[Att(FD.Account_bban, bban), Att(FD.Year, year), Att(FD.Month, month)]))
+    def _get_month_transactions_counts(bban, year) -> list:
+        """ Transaction count of month 1-12 """
+        counts = DD.count_per(
+            Table.TransactionEnriched, FD.Month, where=[Att(FD.Account_bban, bban), Att(FD.Year, year)])
+        return [counts.get(month, 0) for month in range(1, 13)]
 
     def _refresh_target_table_rows(self, pane_current, pane_target=None, current_row_no=0) -> int:
         """
@@ -230,27 +235,35 @@ class MainModel(BaseModelTable):
         if not view_target:
             view_target = view_current
 
-        # Fetch target rows
-        rows = self._get_table_rows(view_target.table_name, pk_target)
-
-        # Set view model
-        count = view_target.set_data(rows)
+        # Fetch target rows and set view model
+        if view_target.table_name == Table.TransactionEnriched:
+            count = self._set_transaction_rows(view_target, pk_target)
+        else:
+            count = view_target.set_data(self._get_table_rows(view_target.table_name, pk_target))
         if count == 0:
             message = f'Geen gegevens gevonden voor {pk_target[0].colhdg_report} {pk_target[0].value}.' \
                 if pk_target else 'Geen gegevens gevonden.'
             self._result.add_message(message, severity=MessageSeverity.Error)
         return count
 
-    def _get_table_rows(self, table_name, pk) -> list:
+    def _set_transaction_rows(self, view, pk) -> int:
+        """ Only the first page of transactions, the next pages are loaded on demand. Return the total count. """
+        header = DD.get_header(Table.TransactionEnriched)
         # - In search mode, re-search transactions
-        if table_name == Table.TransactionEnriched and self._search_mode:
-            self._transactions_io.search()
+        if self._search_mode:
+            self._transactions_io.search(paged=True)
+            if self._transactions_io.pager:
+                return view.set_pager(self._transactions_io.pager, header, self._transactions_io.rows)
             # Header + details
-            rows = [model.get_report_colhdg_names(Table.TransactionEnriched)]
-            rows.extend(self._transactions_io.rows)
-            return rows
+            return view.set_data([header, *self._transactions_io.rows])
+        return view.set_pager(Pager(Table.TransactionEnriched, keys=TE_KEYS, where=pk), header)
+
+    def load_more_transactions(self, row_no) -> bool:
+        """ The last loaded transaction is selected: load the next page. """
+        view = self.models[Pane.TE]
+        return row_no >= len(view.rows) - 1 and view.has_more and view.load_next_page() > 0
 
-        # Other tables
+    def _get_table_rows(self, table_name, pk) -> list:
         rows = DD.fetch_set(table_name, where=pk)  # Incl. header
         if table_name == Table.Month:
             rows = self._pad_month_rows(rows)
@@ -12,11 +12,47 @@ PGM = 'TransactionsEnriched'
 
 class TransactionsEnriched(BaseModelTable):
 
+    @property
+    def total(self):
+        """ All rows, also the pages that are not loaded yet. """
+        return self._pager.total if self._pager else len(self._rows)
+
+    @property
+    def has_more(self):
+        return self._pager is not None and self._pager.has_more
+
     def __init__(self):
         super().__init__(Table.TransactionEnriched)
         self._num_rows = int(self._CM.get_config_item(CF_ROWS_TRANSACTION, 5))
         self._db_row = []
         self._db_index = 0
+        self._pager = None
+
+    def set_data(self, data) -> int:
+        """ All rows at once """
+        self._pager = None
+        return super().set_data(data)
+
+    def set_pager(self, pager, header, first_page=None) -> int:
+        """
+        Only the first page is loaded and formatted. Return the total row count.
+        first_page: if it has been fetched already (e.g. by the search).
+        """
+        self.set_data([header, *(pager.next_page() if first_page is None else first_page)])
+        self._pager = pager
+        return pager.total
+
+    def load_next_page(self) -> int:
+        """ On demand (e.g. the last loaded row is selected). Return the number of rows added. """
+        rows = self._pager.next_page() if self._pager else []
+        self._format_rows(rows)
+        self._rows.extend(rows)
+        return len(rows)
+
+    def load_all(self):
+        """ E.g. for a summary of all rows """
+        while self.has_more:
+            self.load_next_page()
 
     def _substitute_not_in_db(self, db_row, att):
         if att.in_db is True:
@@ -1,10 +1,12 @@
+import os
+
 import PySimpleGUI as sg
 
 from src.DL.Config import EXPAND, \
     STATUS_MESSAGE, CF_OUTPUT_DIR, CF_INPUT_DIR, \
     CF_AUTO_CLOSE_TIME_S, CF_BACKUP_RETENTION_MONTHS, FRAME_CONFIG_MAIN, CMD_HELP_WITH_OUTPUT_DIR, \
     CMD_HELP_WITH_INPUT_DIR, FRAME_VARIOUS, FRAME_CONFIG_BUTTONS, CMD_FACTORY_RESET, CMD_LAYOUT_OPTIONS, \
-    CF_AMOUNT_THRESHOLD_TO_OTHER, CF_RESTORE_BOOKING_DATA
+    CF_AMOUNT_THRESHOLD_TO_OTHER, CF_RESTORE_BOOKING_DATA, CF_IMPORT_INCREMENTAL, CF_IMPORT_WORKERS
 from src.DL.Lexicon import CMD_RESTORE_BACKUP
 from src.DL.Table import Table
 from src.DL.UserCsvFiles.UserCsvFileManager import UserCsvFileManager
@@ -30,6 +32,8 @@ class ConfigView(BaseView):
         x_CX = max(len(self._get_label(CF_AUTO_CLOSE_TIME_S)),
                    len(self._get_label(CF_BACKUP_RETENTION_MONTHS)),
                    len(self._get_label(CF_AMOUNT_THRESHOLD_TO_OTHER)),
+                   len(self._get_label(CF_IMPORT_INCREMENTAL)),
+                   len(self._get_label(CF_IMPORT_WORKERS)),
                    )
 
         self._statusbar_width = max(x_DI, x_CX)
@@ -86,6 +90,9 @@ class ConfigView(BaseView):
                            [self.combo(CF_AUTO_CLOSE_TIME_S, [x for x in range(0, 10, 1)], x=x_CX)], p=5),
                 self.frame(CF_BACKUP_RETENTION_MONTHS,
                            [self.combo(CF_BACKUP_RETENTION_MONTHS, [x for x in range(1, 12, 1)], x=x_CX)], p=5),
+                self.frame(CF_IMPORT_INCREMENTAL, [self.cbx(CF_IMPORT_INCREMENTAL, x=x_CX)], p=5),
+                self.frame(CF_IMPORT_WORKERS,
+                           [self.combo(CF_IMPORT_WORKERS, [x for x in range(1, (os.cpu_count() or 1) + 1)], x=x_CX)], p=5),
             ], border_width=1, expand_x=True),
 
             # - Boekingen terugzetten
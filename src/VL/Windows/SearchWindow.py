@@ -5,6 +5,7 @@
 # Date       Ini Description
 # ---------- --- ------------------------------------------------------------------------------------------------------
 # 2022-06-06 PHe First creation
+# 2026-10-18 PHe The transactions pane gets the first page of the search result
 # ---------------------------------------------------------------------------------------------------------------------
 from src.DL.Config import CF_SEARCH_AMOUNT, \
     CF_SEARCH_AMOUNT_TO, CF_SEARCH_YEAR, CF_SEARCH_MONTH, CF_SEARCH_TEXT, CF_SEARCH_COUNTER_ACCOUNT, \
@@ -18,6 +19,7 @@ from src.VL.Controllers.SearchController import SearchController
 from src.VL.Data.Constants.Enums import WindowType, Pane
 from src.VL.Data.WTyp import WTyp
 from src.VL.Functions import get_name_from_key
+from src.VL.Models.BaseModel import DD
 from src.VL.Models.SearchModel import SearchModel
 from src.VL.Views.SearchView import SearchView
 from src.VL.Windows.BaseWindow import BaseWindow
@@ -74,11 +76,15 @@ class SearchWindow(BaseWindow):
     def _update_main(self):
         if not self._transactionsIO.rows or not self._main_window:
             return
-        # Update Transactions pane: set header, formatted rows and focus
-        table_name = Table.TransactionEnriched
-        rows = [Model().get_report_colhdg_names(table_name)]
-        rows.extend(self._transactionsIO.rows)
-        self._main_models[Pane.TE].set_data(rows)
+        # Update Transactions pane: set header, formatted rows (the first page) and focus
+        if self._transactionsIO.pager:
+            self._main_models[Pane.TE].set_pager(
+                self._transactionsIO.pager, DD.get_header(Table.TransactionEnriched), self._transactionsIO.rows)
+        else:
+            table_name = Table.TransactionEnriched
+            rows = [Model().get_report_colhdg_names(table_name)]
+            rows.extend(self._transactionsIO.rows)
+            self._main_models[Pane.TE].set_data(rows)
         self._main_window.refresh_transactions_from_model()
 
     def _clear_window(self):
@@ -8,7 +8,8 @@ from src.Base import Base
 from src.DL.Config import CF_OUTPUT_DIR, CF_INPUT_DIR, CF_IMPORT_PATH_BOOKING_CODES, CF_IMPORT_PATH_COUNTER_ACCOUNTS, \
     CF_IMPORT_PATH_SEARCH_TERMS, BOOKING_CODES_CSV, COUNTER_ACCOUNTS_CSV, SEARCH_TERMS_CSV, \
     CF_IMPORT_PATH_OPENING_BALANCE, OPENING_BALANCE_CSV, CF_SUMMARY_YEAR, CF_SUMMARY_MONTH_FROM, CF_SUMMARY_MONTH_TO, \
-    ACCOUNTS_CSV, CF_IMPORT_PATH_ACCOUNTS, CF_VERBOSE, CF_IBAN
+    ACCOUNTS_CSV, CF_IMPORT_PATH_ACCOUNTS, CF_VERBOSE, CF_IBAN, CF_IMPORT_WORKERS, \
+    CF_SUMMARY_JOBS
 from src.DL.DBInitialize import DBInitialize
 from src.DL.IO.TransactionsIO import TransactionsIO
 from src.DL.Lexicon import BOOKING_CODES
@@ -22,19 +23,20 @@ from src.GL.Validate import normalize_dir
 
 
 class PMC(Base):
-    def __init__(self, output_dir, year=None, build=False, input_dir=None, iban=None, verbose=False):
+    def __init__(self, output_dir, year=None, build=False, input_dir=None, iban=None, verbose=False,
+                 incremental=False, workers=1, jobs=1):
         super().__init__()
         self._year = year or datetime.now().year
         self._iban = iban
 
-        result = self._start_up(input_dir, output_dir, build, verbose)
+        result = self._start_up(input_dir, output_dir, build, verbose, incremental, workers, jobs)
 
         if not result.OK:
             raise GeneralException(result.get_messages_as_message())
 
         self._summary_driver = SummaryDriver()
 
-    def _start_up(self, input_dir, output_dir, build, verbose) -> Result:
+    def _start_up(self, input_dir, output_dir, build, verbose, incremental=False, workers=1, jobs=1) -> Result:
         """ Start without using GUI Controller """
         input_dir = normalize_dir(f'{self._session.root_dir}Input', create=True) if not input_dir else input_dir
         output_dir = normalize_dir(f'{self._session.root_dir}Output', create=True) if not output_dir else output_dir
@@ -43,7 +45,7 @@ class PMC(Base):
         self._session.start(output_dir=output_dir, force=True, CLI_mode=True)
 
         # Config - create json from session
-        self._create_config_from_session(input_dir, output_dir, verbose)
+        self._create_config_from_session(input_dir, output_dir, verbose, workers, jobs)
 
         # DB
         result = self._start_db(build)
@@ -63,6 +65,11 @@ class PMC(Base):
                 # Populate DB
                 IM = ImportManager()
                 result = IM.start()
+            # Import only the new transactions.
+            elif incremental:
+                Log().start_log(self._session.log_dir, level=LogLevel.Verbose)
+                IM = ImportManager()
+                result = IM.start(import_user_csv_files=False, incremental=True)
             # Write transactions without booking code
             if verbose:
                 self._CM.set_search_for_empty_booking_codes()
@@ -74,7 +81,7 @@ class PMC(Base):
                     Log().new_line()
         return result
 
-    def _create_config_from_session(self, input_dir, output_dir, verbose):
+    def _create_config_from_session(self, input_dir, output_dir, verbose, workers=1, jobs=1):
         """
         json config is the starting point of the Controller.
         """
@@ -85,6 +92,8 @@ class PMC(Base):
         self._CM.set_config_item(CF_INPUT_DIR, input_dir)
         self._CM.set_config_item(CF_OUTPUT_DIR, output_dir)
         self._CM.set_config_item(CF_VERBOSE, verbose)
+        self._CM.set_config_item(CF_IMPORT_WORKERS, workers)
+        self._CM.set_config_item(CF_SUMMARY_JOBS, jobs)
         # Clear IBAN
         self._CM.set_config_item(CF_IBAN, EMPTY)
 
@@ -109,3 +118,6 @@ class PMC(Base):
         self._CM.set_config_item(CF_SUMMARY_MONTH_TO, month_to)
         self._summary_driver.create_summary(summary_type, template_filenames=template_names, iban=self._iban,
                                             CLI_mode=True)
+
+    def report_sql_trace(self):
+        self._report_sql_trace()
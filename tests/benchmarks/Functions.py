@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import csv
+import os
+import random
+import time
+
+from src.DL.Config import CF_INPUT_DIR, CF_IMPORT_PATH_BOOKING_CODES, CF_IMPORT_PATH_COUNTER_ACCOUNTS, \
+    CF_IMPORT_PATH_SEARCH_TERMS, CF_IMPORT_PATH_OPENING_BALANCE
+from src.DL.DBInitialize import DBInitialize
+from src.DL.Model import Model, FD
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from src.GL.BusinessLayer.SessionManager import Singleton as Session
+
+model = Model()
+TX_dict = model.get_colno_per_att_name(Table.Transaction)  # zero-based, without Id
+
+USER_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__)))),
+                             'resources', 'userdata')
+TEMPLATES_DIR = os.path.join(os.path.dirname(USER_DATA_DIR), 'templates', '')
+NAMES = ['Albert Heijn', 'Jumbo', 'Gemeente Leiden', 'Eneco', 'Ziggo', 'Vitens', 'Bol.com', 'NS Reizigers']
+
+
+def start_session():
+    """ Start a unit test session with a freshly built database. Returns the db driver. """
+    session = Session()
+    session.start(unit_test=True)
+    ConfigManager(unit_test=True)
+    result = DBInitialize().start(build=True)
+    if not result.OK:
+        raise SystemExit(result.text)
+    return session.db
+
+
+def synthetic_transaction_rows(count, double_batches=0, batch_size=5, seed=1) -> list:
+    """
+    Rows in Transaction format (without Id), ordered by date.
+    Optionally some consecutive batches are imported twice, like an overlapping bank statement.
+    """
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(count):
+        row = [''] * len(TX_dict)
+        day = i // 50
+        row[TX_dict[FD.Date]] = f'{2015 + day // 365:04d}{(day % 365) // 31 % 12 + 1:02d}{day % 28 + 1:02d}'
+        row[TX_dict[FD.Name]] = rnd.choice(NAMES)
+        row[TX_dict[FD.Account_number]] = 'NL00BANK0123456789'
+        row[TX_dict[FD.Counter_account_number]] = f'NL00BANK{rnd.randint(0, 9999):010d}'
+        row[TX_dict[FD.Transaction_code]] = rnd.choice(['BA', 'GT', 'IC', 'OV'])
+        row[TX_dict[FD.Add_Sub]] = rnd.choice(['Af', 'Bij'])
+        row[TX_dict[FD.Amount]] = round(rnd.uniform(0.01, 2500.0), 2)
+        row[TX_dict[FD.Comments]] = f'Omschrijving: transactie {i}'
+        row[TX_dict[FD.Date_format]] = 'YYYYMMDD'
+        rows.append(row)
+    # Doubles
+    for b in range(double_batches):
+        start = (b + 1) * (count // (double_batches + 1))
+        rows.extend([list(r) for r in rows[start:start + batch_size]])
+    return rows
+
+
+def write_bank_csv_files(input_dir, rows, file_count=2) -> list:
+    """ Write the rows as ";" separated bank csv files with a header (like ING). Return the paths. """
+    os.makedirs(input_dir, exist_ok=True)
+    header = [name for name in TX_dict if name != FD.Date_format]
+    size = -(-len(rows) // file_count)
+    paths = []
+    for i in range(file_count):
+        path = os.path.join(input_dir, f'NL00BANK0123456789_{2015 + i}.csv')
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(header)
+            for row in rows[i * size:(i + 1) * size]:
+                writer.writerow([str(row[TX_dict[FD.Amount]]).replace('.', ',') if name == FD.Amount
+                                 else row[TX_dict[name]] for name in header])
+        paths.append(path)
+    return paths
+
+
+def configure_import(input_dir, user_data_dir=USER_DATA_DIR):
+    """ Bank transactions from input_dir, user data from user_data_dir (default resources/userdata). """
+    CM = ConfigManager()
+    CM.set_config_item(CF_INPUT_DIR, f'{input_dir.rstrip(os.sep)}{os.sep}', validate=False)
+    for key, file_name in ((CF_IMPORT_PATH_BOOKING_CODES, 'Boekingscodes.csv'),
+                           (CF_IMPORT_PATH_COUNTER_ACCOUNTS, 'Tegenrekeningen.csv'),
+                           (CF_IMPORT_PATH_SEARCH_TERMS, 'Zoektermen.csv'),
+                           (CF_IMPORT_PATH_OPENING_BALANCE, 'Beginsaldi.csv')):
+        CM.set_config_item(key, os.path.join(user_data_dir, file_name), validate=False)
+    # The import validation takes the user csv files from Backup, else from the userdata dir.
+    Session()._userdata_dir = os.path.join(user_data_dir, '')
+
+
+def configure_templates():
+    """ Summary templates from resources/templates. """
+    Session()._templates_dir = TEMPLATES_DIR
+
+
+def timed(label, method, *args, **kwargs):
+    """ Run a method, print the elapsed time and return (result, seconds). """
+    start = time.perf_counter()
+    result = method(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f'{label:<50} {elapsed:10.3f} s')
+    return result, elapsed
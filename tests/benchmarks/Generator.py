@@ -0,0 +1,210 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Synthetic bank transaction csv files (ING, Rabobank, Bunq, Triodos) with matching user csv files
+(booking codes, search terms, counter accounts, accounts and opening balances).
+Usage: python -m tests.benchmarks.Generator <output dir> [accounts] [years] [rows per month]
+    The bank files are written to <output dir>/Input, the user csv files to <output dir>/userdata.
+"""
+import calendar
+import csv
+import os
+import random
+import shutil
+import sys
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.GL.Const import EMPTY
+from tests.benchmarks.Functions import USER_DATA_DIR
+
+ING = 'ING'
+RABOBANK = 'Rabobank'
+BUNQ = 'Bunq'
+TRIODOS = 'Triodos'
+BANKS = (ING, RABOBANK, BUNQ, TRIODOS)
+
+BANK_CODES = {ING: 'INGB', RABOBANK: 'RABO', BUNQ: 'BUNQ', TRIODOS: 'TRIO'}
+FIRST_YEAR = 2020
+OPENING_BALANCE = 1000.0
+
+# Transaction code per kind: ING, Rabobank, Triodos (Bunq has no code)
+CODES = {
+    'card': ('BA', 'ba', 'BA'),
+    'direct_debit': ('IC', 'id', 'IC'),
+    'transfer': ('OV', 'tb', 'OV'),
+    'online': ('GT', 'bg', 'OV'),
+}
+ING_MUTATION_TYPES = {'BA': 'Betaalautomaat', 'IC': 'Incasso', 'OV': 'Overschrijving', 'GT': 'Online bankieren'}
+
+# name, kind, revenue, amount range, search term (in the comments), booking code
+COUNTERPARTIES = [
+    ('Stichting Kerkbalans', 'transfer', True, (10, 500), 'kerkbalans', 'I9.1'),
+    ('J. de Vries', 'online', True, (5, 100), 'gift', 'I9.1'),
+    ('Zaalverhuur Leiden', 'transfer', True, (50, 400), 'zaalhuur', 'I9.3'),
+    ('Spaarrekening Rente', 'transfer', True, (0.5, 20), 'rente', 'I9.4'),
+    ('Bloemenhuis De Roos', 'card', False, (10, 80), None, None),
+    ('Kaarsenmakerij Licht', 'online', False, (20, 150), 'kaarsen', 'U1.3'),
+    ('Koffiebranderij Boon', 'direct_debit', False, (15, 120), 'koffie', 'U1.4'),
+    ('Kosterij Zuidwest', 'transfer', False, (50, 250), 'kostersvergoeding', 'U1.6'),
+    ('Bankkosten Zakelijk', 'direct_debit', False, (2, 30), 'bankkosten', 'U3.1'),
+    ('Drukkerij Wijkinfo', 'online', False, (40, 600), 'wijkinfo', 'U3.5'),
+    ('Hosting Nederland', 'direct_debit', False, (5, 25), 'webhosting', 'U3.6'),
+    ('Schoonmaakbedrijf Glans', 'direct_debit', False, (60, 300), 'schoonmaak', 'U4.5'),
+    ('Albert Heijn', 'card', False, (3, 90), None, None),
+    ('Bouwmarkt Gamma', 'card', False, (5, 200), None, None),
+    ('Kruispost Wijkgemeente', 'transfer', False, (100, 1000), 'kruispost', 'K5.0'),
+]
+
+
+def get_iban(bank_code, number) -> str:
+    """ Dutch IBAN with valid check digits. """
+    bban = f'{bank_code}{number:010d}'
+    numeric = ''.join(str(int(c, 36)) for c in f'{bban}NL00')
+    return f'NL{98 - int(numeric) % 97:02d}{bban}'
+
+
+def amount_text(amount, thousands=False) -> str:
+    """ Decimal comma, e.g. "-1234,56" or "1.234,56" """
+    text = f'{amount:,.2f}' if thousands else f'{amount:.2f}'
+    return text.replace(',', '_').replace('.', ',').replace('_', '.' if thousands else '')
+
+
+class Generator(object):
+    """
+    accounts x years x rows per month transactions. The accounts are assigned to the banks in turn.
+    Every counterparty has its own counter account. Most of them can be booked via their search term.
+    """
+
+    @property
+    def ibans(self):
+        return list(self._accounts)
+
+    @property
+    def years(self):
+        return list(range(self._first_year, self._first_year + self._year_count))
+
+    @property
+    def row_count(self):
+        return len(self._accounts) * self._year_count * 12 * self._rows_per_month
+
+    def __init__(self, account_count=4, year_count=1, rows_per_month=100, banks=BANKS, first_year=FIRST_YEAR,
+                 seed=1):
+        self._year_count = year_count
+        self._rows_per_month = rows_per_month
+        self._first_year = first_year
+        self._seed = seed
+        # { iban: bank }
+        self._accounts = {get_iban(BANK_CODES[banks[i % len(banks)]], 100000000 + i): banks[i % len(banks)]
+                          for i in range(account_count)}
+        self._counter_accounts = [get_iban(BANK_CODES[BANKS[i % len(BANKS)]], 200000000 + i)
+                                  for i in range(len(COUNTERPARTIES))]
+
+    def write(self, input_dir, userdata_dir) -> list:
+        """ Write the bank files and the user csv files. Return the bank file paths. """
+        os.makedirs(input_dir, exist_ok=True)
+        paths = []
+        for a, (iban, bank) in enumerate(self._accounts.items()):
+            rnd = random.Random(self._seed + a)
+            balance = OPENING_BALANCE
+            for year in self.years:
+                rows = self._get_transactions(rnd, iban, year)
+                path = os.path.join(input_dir, f'{bank}_{iban}_{year}.csv')
+                balance = self._write_bank_file(path, bank, rows, balance)
+                paths.append(path)
+        self._write_user_csv_files(userdata_dir)
+        return paths
+
+    def _get_transactions(self, rnd, iban, year) -> list:
+        """ [(date, counterparty index, signed amount, comments)] ordered by date """
+        rows = []
+        for month in range(1, 13):
+            days = calendar.monthrange(year, month)[1]
+            for i in range(self._rows_per_month):
+                day = 1 + i * days // self._rows_per_month
+                # The first row of a file is a transfer (Triodos files have no header, the 1st row is mapped).
+                c = rnd.randrange(len(COUNTERPARTIES)) if rows else 0
+                name, kind, revenue, (low, high), term, _ = COUNTERPARTIES[c]
+                amount = round(rnd.uniform(low, high), 2) * (1 if revenue else -1)
+                if kind == 'card':
+                    comments = f'Pasvolgnr: 001 {day:02d}-{month:02d}-{year} {rnd.randrange(8, 22):02d}:' \
+                               f'{rnd.randrange(60):02d} Transactie: {rnd.randrange(16 ** 6):06X} Term: {name}'
+                else:
+                    comments = f'{term.title()} {month:02d}-{year} kenmerk {rnd.randrange(10 ** 8)}'
+                rows.append((f'{year}{month:02d}{day:02d}', c, amount, comments))
+        return rows
+
+    def _write_bank_file(self, path, bank, rows, balance) -> float:
+        """ Write the bank specific format. Return the closing balance. """
+        iban = os.path.basename(path).split('_')[1]
+        delimiter = ',' if bank in (RABOBANK, TRIODOS) else ';'
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f, delimiter=delimiter, quoting=csv.QUOTE_ALL)
+            if bank == ING:
+                writer.writerow(['Datum', 'Naam / Omschrijving', 'Rekening', 'Tegenrekening', 'Code', 'Af Bij',
+                                 'Bedrag (EUR)', 'Mutatiesoort', 'Mededelingen', 'Saldo na mutatie', 'Tag'])
+            elif bank == RABOBANK:
+                writer.writerow(['IBAN/BBAN', 'Munt', 'BIC', 'Volgnr', 'Datum', 'Rentedatum', 'Bedrag',
+                                 'Saldo na trn', 'Tegenrekening IBAN/BBAN', 'Naam tegenpartij', 'Code',
+                                 'Omschrijving-1'])
+            elif bank == BUNQ:
+                writer.writerow(['Date', 'Interest Date', 'Amount', 'Account', 'Counterparty', 'Name', 'Description'])
+            for seqno, (date, c, amount, comments) in enumerate(rows, start=1):
+                balance = round(balance + amount, 2)
+                name, kind = COUNTERPARTIES[c][:2]
+                # Card payments have no counter account
+                counter_account = EMPTY if kind == 'card' else self._counter_accounts[c]
+                iso_date = f'{date[:4]}-{date[4:6]}-{date[6:]}'
+                if bank == ING:
+                    code = CODES[kind][0]
+                    writer.writerow([date, name, iban, counter_account, code, 'Bij' if amount > 0 else 'Af',
+                                     amount_text(abs(amount)), ING_MUTATION_TYPES[code], comments,
+                                     amount_text(balance), EMPTY])
+                elif bank == RABOBANK:
+                    writer.writerow([iban, 'EUR', 'RABONL2U', f'{seqno:018d}', iso_date, iso_date,
+                                     amount_text(amount), amount_text(balance), counter_account, name,
+                                     CODES[kind][1], comments])
+                elif bank == BUNQ:
+                    writer.writerow([iso_date, iso_date, amount_text(amount), iban, counter_account, name, comments])
+                else:  # Triodos: no header
+                    writer.writerow([f'{date[6:]}-{date[4:6]}-{date[:4]}', iban, amount_text(abs(amount), True),
+                                     'Credit' if amount > 0 else 'Debet', name, counter_account, CODES[kind][2],
+                                     comments, amount_text(balance, True)])
+        return balance
+
+    def _write_user_csv_files(self, userdata_dir):
+        os.makedirs(userdata_dir, exist_ok=True)
+        shutil.copyfile(os.path.join(USER_DATA_DIR, 'Boekingscodes.csv'), os.path.join(userdata_dir, 'Boekingscodes.csv'))
+        self._write_csv(userdata_dir, 'Zoektermen.csv', ['Zoekterm', 'Boekingscode'],
+                        [[term, booking_code] for *_, term, booking_code in COUNTERPARTIES if booking_code])
+        self._write_csv(userdata_dir, 'Tegenrekeningen.csv', ['Tegenrekening', 'Naam', 'EersteMededelingen'],
+                        [[self._counter_accounts[c], name, term.title() if term else EMPTY]
+                         for c, (name, kind, *_, term, _) in enumerate(COUNTERPARTIES) if kind != 'card'])
+        self._write_csv(userdata_dir, 'Rekeningen.csv', ['Bban', 'Iban', 'Omschrijving'],
+                        [[get_BBAN_from_IBAN(iban), iban, f'{bank} rekening {i + 1}']
+                         for i, (iban, bank) in enumerate(self._accounts.items())])
+        self._write_csv(userdata_dir, 'Beginsaldi.csv', ['Jaar', 'Beginsaldo'],
+                        [[year, amount_text(OPENING_BALANCE)] for year in self.years])
+
+    @staticmethod
+    def _write_csv(dir_name, file_name, header, rows):
+        with open(os.path.join(dir_name, file_name), 'w', newline='') as f:
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(header)
+            writer.writerows(rows)
+
+
+
+def main(output_dir, account_count=4, year_count=1, rows_per_month=100):
+    generator = Generator(account_count, year_count, rows_per_month)
+    paths = generator.write(os.path.join(output_dir, 'Input'), os.path.join(output_dir, 'userdata'))
+    print(f'{generator.row_count} transactions in {len(paths)} files written to "{output_dir}".')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1], *[int(a) for a in sys.argv[2:5]])
@@ -0,0 +1,50 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: detection of double transaction batches during import (step d).
+Usage: python -m tests.benchmarks.bench_001_Import_doubles [rows] [legacy_sample_rows]
+"""
+import sys
+
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.Model import Model
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed
+
+model = Model()
+
+
+def legacy_double_count(db, rows) -> int:
+    """ Previous implementation: one query per transaction. """
+    return sum(1 for row in rows
+               if len(db.fetch(Table.Transaction, where=model.get_pk_atts_from_row(Table.Transaction, row))) > 1)
+
+
+def main(count=200000, legacy_sample=5000):
+    db = start_session()
+    from src.BL.Managers.ImportManager import ImportManager
+
+    db.insert_many(Table.Transaction, synthetic_transaction_rows(count, double_batches=3), add_audit_values=True)
+    rows = db.fetch(Table.Transaction, mode=FetchMode.WholeTable)
+    print(f'Transactions: {len(rows)}')
+
+    im = ImportManager(unit_test=True)
+    has_doubles, t_new = timed('Set based: has consecutive doubles', im._has_consecutive_doubles, rows)
+    doubles, t_export = timed('Set based: export doubles', im.export_doubles, rows)
+
+    sample = rows[:legacy_sample]
+    _, t_legacy = timed(f'Per row query ({len(sample)} rows)', legacy_double_count, db, sample)
+    t_legacy_total = t_legacy * len(rows) / max(len(sample), 1) * 2  # Detect + export
+    print(f'{"Per row query (extrapolated, detect + export)":<50} {t_legacy_total:10.3f} s')
+    print(f'Double batches found: {has_doubles}, doubles: {doubles}, '
+          f'speedup: {t_legacy_total / max(t_new + t_export, 1e-9):.0f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,69 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: foreign key resolution during enrichment (step e).
+Usage: python -m tests.benchmarks.bench_002_Enrichment_lookups [rows]
+"""
+import sys
+
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.Model import Model, FD
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed
+
+model = Model()
+BOOKING_CODES = ['AHD', 'BOD', 'ENE', 'GEM', 'ONL', 'REI', 'WAT', 'ZIG']
+
+
+def legacy_lookups(db, rows) -> list:
+    """ Previous implementation: two queries per transaction. """
+    c_counter_account = model.get_column_number(Table.Transaction, FD.Counter_account_number)
+    return [(db.fetch_id(Table.CounterAccount, where=[Att(FD.Counter_account_number, row[c_counter_account])]),
+             db.fetch_id(Table.BookingCode, where=[Att(FD.Booking_code, BOOKING_CODES[i % len(BOOKING_CODES)])]))
+            for i, row in enumerate(rows)]
+
+
+def dict_lookups(db, rows) -> list:
+    from src.BL.Managers.EnrichmentManager import EnrichmentManager
+    c_counter_account = model.get_column_number(Table.Transaction, FD.Counter_account_number)
+    counter_account_ids = EnrichmentManager.get_id_per_value(db, Table.CounterAccount, FD.Counter_account_number)
+    booking_ids = EnrichmentManager.get_id_per_value(db, Table.BookingCode, FD.Booking_code)
+    return [(counter_account_ids.get(row[c_counter_account], 0),
+             booking_ids.get(BOOKING_CODES[i % len(BOOKING_CODES)], 0))
+            for i, row in enumerate(rows)]
+
+
+def main(count=100000):
+    db = start_session()
+    from src.BL.Managers.ImportManager import ImportManager
+
+    tx_rows = synthetic_transaction_rows(count)
+    db.insert_many(Table.Transaction, tx_rows, add_audit_values=True)
+    c = model.get_colno_per_att_name(Table.Transaction)[FD.Counter_account_number]
+    db.insert_many(Table.CounterAccount, [[n, 'Naam', 'Mededeling'] for n in sorted({r[c] for r in tx_rows})],
+                   add_audit_values=True)
+    db.insert_many(Table.BookingCode, [['Uitgaven', f'Groep {code}', code, code, i + 1]
+                                       for i, code in enumerate(BOOKING_CODES)], add_audit_values=True)
+    rows = db.fetch(Table.Transaction, mode=FetchMode.WholeTable)
+    print(f'Transactions: {len(rows)}')
+
+    legacy, t_legacy = timed('Per row fetch_id (2 queries per row)', legacy_lookups, db, rows)
+    new, t_new = timed('Lookups loaded once', dict_lookups, db, rows)
+    print(f'Identical: {legacy == new}, speedup: {t_legacy / max(t_new, 1e-9):.0f}x')
+
+    im = ImportManager(unit_test=True)
+    [im._account_io.add_account_to_cache(n) for n in {r[model.get_column_number(
+        Table.Transaction, FD.Account_number)] for r in rows}]
+    im._account_io.persist_accounts()
+    timed('Complete enrichment (create_enriched_mutations)', im.create_enriched_mutations, db)
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,46 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: search term / booking code matching during enrichment.
+Usage: python -m tests.benchmarks.bench_003_Keyword_matcher [texts]
+"""
+import random
+import string
+import sys
+
+from src.DL.UserCsvFiles.Cache.KeywordMatcher import KeywordMatcher
+from tests.benchmarks.Functions import timed
+
+
+def linear_scan(keywords, texts) -> list:
+    """ Previous implementation """
+    result = []
+    for text in texts:
+        matches = [keyword for keyword in keywords if keyword in text]
+        result.append(matches[0] if matches else None)
+    return result
+
+
+def main(count=100000):
+    rnd = random.Random(1)
+    texts = [' '.join(''.join(rnd.choice(string.ascii_lowercase) for _ in range(rnd.randint(2, 9)))
+                      for _ in range(15)) for _ in range(count)]
+    for term_count in (25, 100, 500):
+        keywords = list(dict.fromkeys(
+            ''.join(rnd.choice(string.ascii_lowercase) for _ in range(rnd.randint(4, 12)))
+            for _ in range(term_count)))
+        sample = [f'{text} {rnd.choice(keywords)}' if i % 3 == 0 else text for i, text in enumerate(texts)]
+        legacy, t_legacy = timed(f'{term_count} terms: linear scan', linear_scan, keywords, sample)
+        matcher, _ = timed(f'{term_count} terms: build matcher', KeywordMatcher, keywords)
+        new, t_new = timed(f'{term_count} terms: matcher', lambda: [matcher.find(text) for text in sample])
+        print(f'Identical: {legacy == new}, speedup: {t_legacy / max(t_new, 1e-9):.1f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,44 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: repeated indexed single row lookups via DBDriver (fetch_id, fetch_value, count).
+Usage: python -m tests.benchmarks.bench_005_Prepared_statements [calls]
+"""
+import random
+import sys
+
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.AttType import AttType
+from src.DL.Model import FD
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, timed
+
+ACCOUNT_COUNT = 10000
+
+
+def main(count=100000):
+    db = start_session()
+    names = [f'Naam {i}' for i in range(ACCOUNT_COUNT)]
+    db.insert_many(Table.CounterAccount, [[f'NL00BANK{i:010d}', n, 'Mededeling'] for i, n in enumerate(names)],
+                   add_audit_values=True)
+    rnd = random.Random(1)
+    values = [rnd.choice(names) for _ in range(count)]
+    ids = [rnd.randint(1, ACCOUNT_COUNT) for _ in range(count)]
+
+    ids_found, t_id = timed(f'{count} x fetch_id', lambda: [
+        db.fetch_id(Table.CounterAccount, where=[Att(FD.Name, v)]) for v in values])
+    timed(f'{count} x fetch_value', lambda: [
+        db.fetch_value(Table.CounterAccount, name=FD.Name, where=[Att(FD.ID, i, type=AttType.Int)]) for i in ids])
+    timed(f'{count} x count', lambda: [
+        db.count(Table.CounterAccount, where=[Att(FD.Name, v)]) for v in values])
+    print(f'All found: {all(ids_found)}, fetch_id: {t_id / count * 1e6:.1f} µs per call')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,76 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: month and year overview (YearMonthIO.refresh_data, import step g).
+Usage: python -m tests.benchmarks.bench_006_Year_month_totals [rows]
+"""
+import sys
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.DL.Config import CF_IBAN
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.AttType import AttType
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.Model import Model, FD
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed
+
+model = Model()
+IBAN = 'NL00BANK0123456789'
+
+
+def legacy_month_totals(db, bban) -> dict:
+    """ Previous implementation: 1 query per month, amounts summed per row. """
+    te_dict = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)
+    totals = {}
+    for yy in range(db.fetch_min(Table.TransactionEnriched, FD.Year), db.fetch_max(Table.TransactionEnriched, FD.Year) + 1):
+        where_year = [Att(FD.Account_bban, bban), Att(FD.Year, yy, type=AttType.Int)]
+        if not db.fetch(Table.TransactionEnriched, where=where_year):
+            continue
+        for mm in range(1, 13):
+            costs, revenues = 0.0, 0.0
+            for row in db.fetch(Table.TransactionEnriched, where=where_year + [Att(FD.Month, mm, type=AttType.Int)]):
+                amount = row[te_dict[FD.Amount]]
+                if row[te_dict[FD.Add_Sub]].lower() == 'bij':
+                    revenues += amount
+                else:
+                    costs -= amount
+            totals[(yy, mm)] = (round(costs, 2), round(revenues, 2), round(costs + revenues, 2))
+    return totals
+
+
+def month_table_totals(db) -> dict:
+    d = model.get_colno_per_att_name(Table.Month, zero_based=False)
+    return {(r[d[FD.Year]], r[d[FD.Month]]): (r[d[FD.Costs]], r[d[FD.Revenues]], r[d[FD.Balance]])
+            for r in db.fetch(Table.Month, mode=FetchMode.WholeTable)}
+
+
+def main(count=100000):
+    db = start_session()
+    from src.BL.Managers.ImportManager import ImportManager
+    from src.DL.IO.YearMonthIO import YearMonthIO
+
+    db.insert_many(Table.Transaction, synthetic_transaction_rows(count), add_audit_values=True)
+    im = ImportManager(unit_test=True)
+    im._account_io.add_account_to_cache(IBAN)
+    im._account_io.persist_accounts()
+    im.create_enriched_mutations(db)
+    ConfigManager().set_config_item(CF_IBAN, IBAN, validate=False)
+    print(f'Transactions: {db.count(Table.TransactionEnriched)}')
+
+    legacy, t_legacy = timed('Query per month, sum per row', legacy_month_totals, db, get_BBAN_from_IBAN(IBAN))
+    result, t_new = timed('refresh_data (1 aggregate query)', YearMonthIO().refresh_data)
+    new = month_table_totals(db)
+    print(f'Result OK: {result.OK}, months: {len(new)}, identical: {legacy == new}, '
+          f'speedup: {t_legacy / max(t_new, 1e-9):.0f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,68 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: reading a bank transaction csv file for validation and import (time and peak memory).
+Usage: python -m tests.benchmarks.bench_007_Stream_csv [rows]
+"""
+import csv
+import os
+import sys
+import tempfile
+import tracemalloc
+from itertools import islice
+
+from src.BL.Managers.ImportManager import INSERT_BATCH_SIZE
+from src.GL.BusinessLayer.CsvManager import CsvManager
+from tests.benchmarks.Functions import synthetic_transaction_rows, timed, TX_dict
+
+
+def legacy_read(path) -> int:
+    """ Previous implementation: the validation and the import both read the whole file. """
+    validation_rows = CsvManager().get_rows(include_header_row=True, data_path=path, delimiter=';')
+    if any(len(r) != len(validation_rows[0]) for r in validation_rows):
+        return 0
+    import_rows = CsvManager().get_rows(data_path=path, delimiter=';')
+    return len(import_rows)
+
+
+def streamed_read(path) -> int:
+    """ Validation reads the header and 1st row, the import streams the file in batches. """
+    list(islice(CsvManager().stream_rows(include_header_row=True, data_path=path, delimiter=';'), 2))
+    count, batch = 0, []
+    for row in CsvManager().stream_rows(data_path=path, delimiter=';'):
+        batch.append(row)
+        if len(batch) == INSERT_BATCH_SIZE:
+            count += len(batch)
+            batch = []
+    return count + len(batch)
+
+
+def measured(label, method, path):
+    tracemalloc.start()
+    result, _ = timed(label, method, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f'{"":<50} peak {peak / 1024 / 1024:7.1f} MB')
+    return result
+
+
+def main(count=200000):
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'NL00BANK0123456789_2015.csv')
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f, delimiter=';')
+            writer.writerow(list(TX_dict))
+            [writer.writerow(row) for row in synthetic_transaction_rows(count)]
+        legacy = measured('Read whole file twice', legacy_read, path)
+        new = measured('Stream once', streamed_read, path)
+        print(f'Rows: {legacy} / {new}, identical: {legacy == new}')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
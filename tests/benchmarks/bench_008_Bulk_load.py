@@ -0,0 +1,45 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: full import (ImportManager.start) with and without DBDriver.bulk_load.
+Usage: python -m tests.benchmarks.bench_008_Bulk_load [rows]
+"""
+import contextlib
+import sys
+import tempfile
+
+from src.DL.DBDriver.DBDriver import DBDriver
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed, write_bank_csv_files, \
+    configure_import
+
+
+def full_import(input_dir, label):
+    """ Import into a freshly built database """
+    db = start_session()
+    configure_import(input_dir)
+    from src.BL.Managers.ImportManager import ImportManager
+    result, elapsed = timed(label, ImportManager().start, import_user_csv_files=False)
+    return result.OK and db.count(Table.TransactionEnriched), elapsed
+
+
+def main(count=50000):
+    with tempfile.TemporaryDirectory() as input_dir:
+        write_bank_csv_files(input_dir, synthetic_transaction_rows(count))
+
+        bulk_load = DBDriver.bulk_load
+        DBDriver.bulk_load = lambda self, table_names=None: contextlib.nullcontext()
+        legacy, t_legacy = full_import(input_dir, 'Full import, commit per statement')
+        DBDriver.bulk_load = bulk_load
+        new, t_new = full_import(input_dir, 'Full import, bulk load')
+        print(f'Enriched: {legacy} / {new}, speedup: {t_legacy / max(t_new, 1e-9):.1f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,67 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: searching text in Name, Comments and Remarks (TransactionsIO.search).
+Usage: python -m tests.benchmarks.bench_009_Text_search [rows]
+"""
+import io as _io
+import sys
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from src.DL.Config import CF_SEARCH_TEXT
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.AttType import AttType
+from src.DL.Model import FD
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed
+
+IBAN = 'NL00BANK0123456789'
+SEARCH_TEXTS = ['Heijn', 'transactie 4711', 'gemeente', 'vakantie']
+REPEAT = 10
+
+
+def search_ids(io, text) -> list:
+    ConfigManager().config_dict[CF_SEARCH_TEXT] = text
+    with redirect_stdout(_io.StringIO()):  # Result message
+        [io.search(dialog_mode=False) for _ in range(REPEAT)]
+    return sorted(row[0] for row in io.rows)
+
+
+def main(count=100000):
+    db = start_session()
+    from src.BL.Managers.ImportManager import ImportManager
+    from src.DL.IO.TransactionsIO import TransactionsIO
+
+    db.insert_many(Table.Transaction, synthetic_transaction_rows(count), add_audit_values=True)
+    im = ImportManager(unit_test=True)
+    im._account_io.add_account_to_cache(IBAN)
+    im._account_io.persist_accounts()
+    im.create_enriched_mutations(db)
+    # Remark edits must be found too
+    for Id in range(1, count, 1000):
+        db.update(Table.TransactionEnriched, values=[Att(FD.Remarks, 'Vakantie Frankrijk')],
+                  where=[Att(FD.ID, Id, type=AttType.Int)])
+    print(f'Transactions: {db.count(Table.TransactionEnriched)}, '
+          f'text index: {db.text_index_exists(Table.TransactionSearch)}')
+
+    io = TransactionsIO()
+    identical = True
+    for text in SEARCH_TEXTS:
+        with patch.object(TransactionsIO, '_is_text_index_search', return_value=False):
+            legacy, t_legacy = timed(f'{REPEAT} x "{text}", 3 x LIKE', search_ids, io, text)
+        new, t_new = timed(f'{REPEAT} x "{text}", text index', search_ids, io, text)
+        print(f'{"":<50} found {len(new)}, speedup {t_legacy / max(t_new, 1e-9):.1f}x')
+        identical = identical and legacy == new
+    print(f'Identical: {identical}')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
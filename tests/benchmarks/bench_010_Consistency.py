@@ -0,0 +1,73 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: consistency check of the enriched transactions (ConsistencyManager.run, import step f).
+Usage: python -m tests.benchmarks.bench_010_Consistency [rows]
+"""
+import sys
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.DL.Config import CF_IBAN
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.AttType import AttType
+from src.DL.Model import Model, FD
+from src.DL.Table import Table
+from src.DL.UserCsvFiles.Cache.BookingCodeCache import Singleton as BookingCodeCache
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed
+
+model = Model()
+IBAN = 'NL00BANK0123456789'
+COUNTER_ACCOUNT_COUNT = 5000  # Half of the synthetic counter-accounts is known
+
+
+def legacy_missing_bookings(db) -> dict:
+    """ Previous implementation: 1 query per month, 1 counter-account query per transaction. """
+    te_dict = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)
+    bcm = BookingCodeCache()
+    bban = get_BBAN_from_IBAN(IBAN)
+    missing = {}
+    for yy in range(db.fetch_min(Table.TransactionEnriched, FD.Year),
+                    db.fetch_max(Table.TransactionEnriched, FD.Year) + 1):
+        for mm in range(1, 13):
+            for row in db.fetch(Table.TransactionEnriched, where=[
+                    Att(FD.Account_bban, bban), Att(FD.Year, yy, type=AttType.Int), Att(FD.Month, mm, type=AttType.Int)]):
+                booking_code = bcm.get_value_from_id(row[te_dict[FD.Booking_id]], FD.Booking_code)
+                number = db.fetch_value(Table.CounterAccount, name=FD.Counter_account_number,
+                                        where=[Att(FD.ID, row[te_dict[FD.Counter_account_id]])])
+                if not booking_code and number:
+                    missing[number] = missing.get(number, 0) + 1
+    return missing
+
+
+def main(count=100000):
+    db = start_session()
+    from src.BL.Managers.ConsistencyManager import ConsistencyManager
+    from src.BL.Managers.ImportManager import ImportManager
+
+    db.insert_many(Table.Transaction, synthetic_transaction_rows(count), add_audit_values=True)
+    db.insert_many(Table.CounterAccount, [[f'NL00BANK{i:010d}', f'Naam {i}', 'Mededeling']
+                                          for i in range(COUNTER_ACCOUNT_COUNT)], add_audit_values=True)
+    im = ImportManager(unit_test=True)
+    im._account_io.add_account_to_cache(IBAN)
+    im._account_io.persist_accounts()
+    im.create_enriched_mutations(db)
+    ConfigManager().set_config_item(CF_IBAN, IBAN, validate=False)
+    print(f'Transactions: {db.count(Table.TransactionEnriched)}')
+
+    legacy, t_legacy = timed('Query per month and per transaction', legacy_missing_bookings, db)
+    cm = ConsistencyManager()
+    result, t_new = timed('ConsistencyManager.run (1 aggregate query)', cm.run)
+    new = cm._entities_without_ca.get(Table.CounterAccount, {})
+    print(f'Counter-accounts without booking: {len(legacy)} / {len(new)}, identical: {legacy == new}, '
+          f'speedup: {t_legacy / max(t_new, 1e-9):.0f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,49 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: reading many bank transaction files (ImportManager.import_bank_transactions) with 1 and more workers.
+Usage: python -m tests.benchmarks.bench_011_Parallel_parse [rows] [files] [workers]
+"""
+import sys
+import tempfile
+
+from src.DL.Config import CF_IMPORT_WORKERS
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed, write_bank_csv_files, \
+    configure_import
+
+AUDIT_COLUMN_COUNT = 6
+
+
+def import_files(input_dir, workers) -> (dict, float):
+    """ Import into a freshly built database. Return the table contents without audit data. """
+    db = start_session()
+    configure_import(input_dir)
+    ConfigManager().set_config_item(CF_IMPORT_WORKERS, workers, validate=False)
+    from src.BL.Managers.ImportManager import ImportManager
+    im = ImportManager()
+    _, elapsed = timed(f'Read and insert, {workers} worker(s)', im.import_bank_transactions, db)
+    contents = {table_name: [row[:-AUDIT_COLUMN_COUNT] for row in db.fetch(table_name, mode=FetchMode.WholeTable)]
+                for table_name in (Table.Transaction, Table.Account, Table.CounterAccount)}
+    return contents, elapsed
+
+
+def main(count=300000, file_count=32, workers=4):
+    with tempfile.TemporaryDirectory() as input_dir:
+        write_bank_csv_files(input_dir, synthetic_transaction_rows(count), file_count=file_count)
+        serial, t_serial = import_files(input_dir, 1)
+        parallel, t_parallel = import_files(input_dir, workers)
+        print(f'Transactions: {len(serial[Table.Transaction])}, identical: {serial == parallel}, '
+              f'speedup: {t_serial / max(t_parallel, 1e-9):.1f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:4]])
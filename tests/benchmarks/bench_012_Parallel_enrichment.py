@@ -0,0 +1,50 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: enrichment of the transactions (ImportManager.create_enriched_mutations) with 1 and more workers.
+Usage: python -m tests.benchmarks.bench_012_Parallel_enrichment [rows] [max workers]
+"""
+import sys
+
+from src.DL.Config import CF_IMPORT_WORKERS
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed
+
+IBAN = 'NL00BANK0123456789'
+
+
+def enrich(im, enricher, TX_rows, workers) -> (list, float):
+    """ Enrichment stage only, the insert is done by 1 process. """
+    ConfigManager().set_config_item(CF_IMPORT_WORKERS, workers, validate=False)
+    return timed(f'Enrich, {workers} worker(s)', im._enrich, enricher, TX_rows)
+
+
+def main(count=500000, max_workers=4):
+    db = start_session()
+    from src.BL.Managers.ImportManager import ImportManager
+
+    db.insert_many(Table.Transaction, synthetic_transaction_rows(count), add_audit_values=True)
+    im = ImportManager(unit_test=True)
+    im._account_io.add_account_to_cache(IBAN)
+    im._account_io.persist_accounts()
+    TX_rows = db.fetch(Table.Transaction, mode=FetchMode.WholeTable)
+    enricher = im._get_enricher(db, TX_rows)
+
+    serial, t_serial = enrich(im, enricher, TX_rows, 1)
+    workers = 2
+    while workers <= max_workers:
+        parallel, t_parallel = enrich(im, enricher, TX_rows, workers)
+        print(f'{"":<50} identical: {serial == parallel}, speedup: {t_serial / max(t_parallel, 1e-9):.1f}x')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:3]])
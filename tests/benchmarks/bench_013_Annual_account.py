@@ -0,0 +1,95 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: realisation data of the annual account (TransactionsIO.get_realisation_data, AnnualAccount.export).
+Usage: python -m tests.benchmarks.bench_013_Annual_account [rows]
+"""
+import sys
+import tempfile
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.DL.Config import CF_SUMMARY_YEAR
+from src.DL.DBDriver.Att import Att
+from src.DL.Enums.Enums import BookingType, Summary
+from src.DL.Model import Model, FD
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from src.VL.Data.Constants.Const import OTHER_COSTS, OTHER_REVENUES
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed, write_bank_csv_files, \
+    configure_import, configure_templates
+
+model = Model()
+IBAN = 'NL00BANK0123456789'
+YEAR = 2016
+
+
+def legacy_realisation_data(db, is_overbooking) -> (dict, float):
+    """ Previous implementation: per transaction a booking query. """
+    te_def = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)
+    b_def = model.get_colno_per_att_name(Table.BookingCode, zero_based=False)
+    d, total_amount = {}, 0.0
+    for m_row in db.select(Table.TransactionEnriched, where=[
+            Att(FD.Account_bban, get_BBAN_from_IBAN(IBAN)), Att(FD.Year, YEAR)]):
+        booking_id = m_row[te_def[FD.Booking_id]]
+        if not booking_id:
+            booking_maingroup = OTHER_COSTS if m_row[te_def[FD.Amount_signed]] < 0 else OTHER_REVENUES
+            booking_id = db.fetch_id(Table.BookingCode, where=[Att(FD.Booking_maingroup, booking_maingroup)])
+        b_row = db.fetch_one(Table.BookingCode, where=[Att(FD.ID, booking_id)])
+        if (b_row[b_def[FD.Booking_type]] == BookingType.Overbookings) != is_overbooking:
+            continue
+        amount = m_row[te_def[FD.Amount_signed]]
+        total_amount += amount
+        key = '|'.join(b_row[b_def[name]] for name in (FD.Booking_type, FD.Booking_maingroup, FD.Booking_subgroup))
+        d[key] = d.get(key, 0.0) + amount
+    return d, total_amount
+
+
+def legacy(db) -> dict:
+    """ 4 x per transaction, like the previous export did. """
+    return {is_overbooking: [legacy_realisation_data(db, is_overbooking) for _ in range(2)][-1]
+            for is_overbooking in (False, True)}
+
+
+def realisation(db) -> dict:
+    from src.DL.IO.TransactionsIO import TransactionsIO
+    io = TransactionsIO()
+    data = io.get_realisation_data(IBAN, YEAR)
+    return {is_overbooking: ({'|'.join(row[:3]): row[3] for row in rows}, io.realisation_totals[is_overbooking])
+            for is_overbooking, rows in data.items()}
+
+
+def rounded(data) -> dict:
+    return {k: ({key: round(amount, 2) for key, amount in d.items()}, round(total, 2))
+            for k, (d, total) in data.items()}
+
+
+def main(count=100000):
+    db = start_session()
+    with tempfile.TemporaryDirectory() as input_dir:
+        write_bank_csv_files(input_dir, synthetic_transaction_rows(count))
+        configure_import(input_dir)
+        from src.BL.Managers.ImportManager import ImportManager
+        ImportManager().start()
+    # Mix of bookings, overbookings and no booking
+    booking_count = db.count(Table.BookingCode)
+    db._execute(f'UPDATE {Table.TransactionEnriched} SET {FD.Booking_id} = {FD.ID} % {booking_count + 1}')
+    print(f'Transactions: {db.count(Table.TransactionEnriched)}, bookings: {booking_count}')
+
+    old, t_legacy = timed('4 x query per transaction', legacy, db)
+    new, t_new = timed('1 grouped query', realisation, db)
+    print(f'{"":<50} identical: {rounded(old) == rounded(new)}, speedup: {t_legacy / max(t_new, 1e-9):.0f}x')
+
+    from src.BL.Summary.SummaryDriver import SummaryDriver
+    ConfigManager().set_config_item(CF_SUMMARY_YEAR, YEAR, validate=False)
+    configure_templates()
+    timed('Export annual account', SummaryDriver().create_summary, Summary.AnnualAccount, iban=IBAN, CLI_mode=True)
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,70 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: balances of the 18 periods (months, quarters, semesters) of PeriodicAccount.export.
+Usage: python -m tests.benchmarks.bench_014_Periodic_account [rows]
+"""
+import sys
+
+from src.DL.DBDriver.Att import Att
+from src.DL.Lexicon import TEMPLATE_PERIODIC_ACCOUNT
+from src.DL.Model import Model, FD
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed, configure_templates
+
+model = Model()
+IBAN = 'NL00BANK0123456789'
+YEAR = 2016
+OPENING_BALANCE = 1234.56
+PERIODS = [(m + 1, None) for m in range(12)] + [(q * 3 + 1, q * 3 + 3) for q in range(4)] + \
+          [(s * 6 + 1, s * 6 + 6) for s in range(2)]
+
+
+def legacy_closing_balances() -> list:
+    """ Previous implementation: 1 query per period. """
+    from src.DL.IO.TransactionsIO import TransactionsIO
+    io = TransactionsIO()
+    c_amount = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)[FD.Amount_signed]
+    balances, balance = [], OPENING_BALANCE
+    for month, month_to in PERIODS:
+        if month == 1 and balances:
+            balance = OPENING_BALANCE  # Next period type
+        rows = io.get_transactions(IBAN, YEAR, month, month_to, order_by=[[Att(FD.Date), 'ASC']])
+        balance = balance + sum(row[c_amount] for row in rows if row[c_amount] > 0.0) + \
+            sum(row[c_amount] for row in rows if row[c_amount] < 0.0)
+        balances.append(balance)
+    return balances
+
+
+def closing_balance() -> float:
+    """ Export without writing reports (no months requested). """
+    from src.BL.Summary.Templates.PeriodicAccount import PeriodicAccount
+    pa = PeriodicAccount(IBAN, OPENING_BALANCE, TEMPLATE_PERIODIC_ACCOUNT, CLI_mode=True)
+    pa.export(YEAR, 0)
+    return pa.closing_balance
+
+
+def main(count=500000):
+    db = start_session()
+    configure_templates()
+    from src.BL.Managers.ImportManager import ImportManager
+    db.insert_many(Table.Transaction, synthetic_transaction_rows(count), add_audit_values=True)
+    im = ImportManager(unit_test=True)
+    im._account_io.add_account_to_cache(IBAN)
+    im._account_io.persist_accounts()
+    im.create_enriched_mutations(db)
+    print(f'Transactions: {db.count(Table.TransactionEnriched)}')
+
+    legacy, t_legacy = timed('18 queries', legacy_closing_balances)
+    new, t_new = timed('Year once, periods sliced', closing_balance)
+    print(f'{"":<50} identical: {legacy[-1] == new}, speedup: {t_legacy / max(t_new, 1e-9):.1f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,71 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: switching accounts on the dashboard (YearMonthIO.refresh_data) with and without YearMonthCache.
+Usage: python -m tests.benchmarks.bench_015_Year_month_refresh [rows per account]
+"""
+import sys
+
+from src.DL.Config import CF_IBAN
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.Model import FD
+from src.DL.Table import Table
+from src.DL.YearMonthCache import Singleton as YearMonthCache
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed, TX_dict
+
+IBANS = ['NL00BANK0123456789', 'NL00BANK0987654321']
+SWITCHES = 20
+AUDIT_COLUMN_COUNT = 6
+
+
+def switch_accounts(db, invalidate) -> list:
+    """ Select the accounts in turn. Return the Month and Year tables per account. """
+    from src.DL.IO.YearMonthIO import YearMonthIO
+    tables = []
+    for i in range(SWITCHES):
+        if invalidate:
+            YearMonthCache().invalidate()
+        ConfigManager().set_config_item(CF_IBAN, IBANS[i % len(IBANS)], validate=False)
+        YearMonthIO().refresh_data()
+        tables.append([[row[:-AUDIT_COLUMN_COUNT] for row in db.fetch(table_name, mode=FetchMode.WholeTable)]
+                       for table_name in (Table.Month, Table.Year)])
+    return tables
+
+
+def main(count=250000):
+    db = start_session()
+    from src.BL.Managers.ImportManager import ImportManager
+
+    # 2 accounts with 10+ years
+    for iban in IBANS:
+        rows = synthetic_transaction_rows(count)
+        for row in rows:
+            row[TX_dict[FD.Account_number]] = iban
+        db.insert_many(Table.Transaction, rows, add_audit_values=True)
+    im = ImportManager(unit_test=True)
+    [im._account_io.add_account_to_cache(iban) for iban in IBANS]
+    im._account_io.persist_accounts()
+    im.create_enriched_mutations(db)
+    print(f'Transactions: {db.count(Table.TransactionEnriched)}, '
+          f'years: {db.fetch_min(Table.TransactionEnriched, FD.Year)}-{db.fetch_max(Table.TransactionEnriched, FD.Year)}')
+
+    legacy, t_legacy = timed(f'{SWITCHES} x switch account, recalculate', switch_accounts, db, True)
+    new, t_new = timed(f'{SWITCHES} x switch account, cached', switch_accounts, db, False)
+    print(f'{"":<50} identical: {legacy == new}, speedup: {t_legacy / max(t_new, 1e-9):.0f}x')
+
+    # Booking update: only that year is recalculated.
+    from src.DL.IO.TransactionIO import TransactionIO
+    TransactionIO().update_booking(values=[Att(FD.Booking_id, 1)], where=[Att(FD.ID, 1)])
+    timed(f'{SWITCHES} x switch account, after a booking update', switch_accounts, db, False)
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,54 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: transaction count per month for the initial month selection (MainModel._initialize_ym_...).
+Usage: python -m tests.benchmarks.bench_016_Month_counts [rows]
+"""
+import sys
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.DL.DBDriver.Att import Att
+from src.DL.Model import FD
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed
+
+IBAN = 'NL00BANK0123456789'
+YEAR = 2016
+
+
+def legacy_month_counts(DD) -> list:
+    """ Previous implementation: the rows of every month. """
+    bban = get_BBAN_from_IBAN(IBAN)
+    return [len(DD.fetch_set(Table.TransactionEnriched,
+                             where=[Att(FD.Account_bban, bban), Att(FD.Year, YEAR), Att(FD.Month, month)])) - 1
+            for month in range(1, 13)]
+
+
+def main(count=500000):
+    db = start_session()
+    from src.BL.Managers.ImportManager import ImportManager
+    from src.VL.Data.DataDriver import Singleton as DataDriver
+    from src.VL.Models.MainModel import MainModel
+
+    db.insert_many(Table.Transaction, synthetic_transaction_rows(count), add_audit_values=True)
+    im = ImportManager(unit_test=True)
+    im._account_io.add_account_to_cache(IBAN)
+    im._account_io.persist_accounts()
+    im.create_enriched_mutations(db)
+    DD = DataDriver()
+    DD.start()
+    print(f'Transactions: {db.count(Table.TransactionEnriched)}')
+
+    legacy, t_legacy = timed('12 x fetch the month rows', legacy_month_counts, DD)
+    new, t_new = timed('1 grouped count', MainModel._get_month_transactions_counts, get_BBAN_from_IBAN(IBAN), YEAR)
+    print(f'{"":<50} identical: {legacy == new}, speedup: {t_legacy / max(t_new, 1e-9):.0f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,93 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: combo box values (ImportManager._save_combo_data, DataDriver booking descriptions).
+Usage: python -m tests.benchmarks.bench_017_Combo_data [rows]
+"""
+import sys
+import tempfile
+
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.Enums import FetchMode
+from src.DL.Model import Model, FD
+from src.DL.Table import Table
+from src.VL.Data.Constants.Const import LEEG, NIET_LEEG
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed, write_bank_csv_files, \
+    configure_import
+
+model = Model()
+TE_dict = model.get_colno_per_att_name(Table.TransactionEnriched, zero_based=False)
+FF = Table.FlatFiles
+
+
+def flat_files(db) -> set:
+    return {(str(r[1]), str(r[2])) for r in db.fetch(FF, mode=FetchMode.WholeTable)}
+
+
+def legacy_save_combo_data(db) -> set:
+    """ Previous implementation: unique values per enriched row, 1 query per counter account, 1 insert per pair. """
+    db.clear(FF)
+    unique = {name: set() for name in (FD.Account_bban, FD.Year, FD.Counter_account_id, FD.Transaction_code,
+                                       FD.Transaction_type)}
+    for row in db.fetch(Table.TransactionEnriched, mode=FetchMode.WholeTable):
+        [values.add(row[TE_dict[name]]) for name, values in unique.items()]
+    kv_pairs = [[FD.Account_number, v] for v in unique[FD.Account_bban] if v]
+    kv_pairs.extend([FD.Year, v] for v in unique[FD.Year] if v)
+    kv_pairs.extend([FD.Counter_account_number, db.fetch_value(
+        Table.CounterAccount, name=FD.Counter_account_number, where=[Att(FD.ID, v)])]
+                    for v in unique[FD.Counter_account_id] if v > 0)
+    kv_pairs.extend([[FD.Counter_account_number, LEEG], [FD.Counter_account_number, NIET_LEEG]])
+    kv_pairs.extend([FD.Transaction_code, v] for v in unique[FD.Transaction_code] if v)
+    kv_pairs.extend([FD.Transaction_type, v] for v in unique[FD.Transaction_type] if v)
+    kv_pairs.extend([FD.Booking_type, v] for v in set(db.select(
+        Table.BookingCode, name=FD.Booking_type)) if v)
+    [db.insert(FF, kv) for kv in kv_pairs]
+    return flat_files(db)
+
+
+def save_combo_data(db, im) -> set:
+    im._save_combo_data()
+    return flat_files(db)
+
+
+def legacy_booking_descriptions(db) -> list:
+    """ Previous implementation: 1 count per booking. """
+    return [row[0] for row in db.select(Table.BookingCode)
+            if db.count(Table.TransactionEnriched, where=[Att(FD.Booking_id, row[0])]) > 0]
+
+
+def booking_descriptions(db) -> list:
+    booking_ids = db.count_per(Table.TransactionEnriched, FD.Booking_id)
+    return [row[0] for row in db.select(Table.BookingCode) if row[0] in booking_ids]
+
+
+def main(count=500000):
+    db = start_session()
+    with tempfile.TemporaryDirectory() as input_dir:
+        write_bank_csv_files(input_dir, synthetic_transaction_rows(count))
+        configure_import(input_dir)
+        from src.BL.Managers.ImportManager import ImportManager
+        im = ImportManager()
+        im.start()
+    # Mix of bookings and no booking
+    booking_count = db.count(Table.BookingCode)
+    db._execute(f'UPDATE {Table.TransactionEnriched} SET {FD.Booking_id} = {FD.ID} % {booking_count // 2 + 1}')
+    print(f'Transactions: {db.count(Table.TransactionEnriched)}, bookings: {booking_count}')
+
+    legacy, t_legacy = timed('Unique values per row, insert per pair', legacy_save_combo_data, db)
+    new, t_new = timed('DISTINCT queries, 1 insert', save_combo_data, db, im)
+    print(f'{"":<50} identical: {legacy == new}, speedup: {t_legacy / max(t_new, 1e-9):.1f}x')
+
+    legacy, t_legacy = timed('Booking descriptions, count per booking', legacy_booking_descriptions, db)
+    new, t_new = timed('Booking descriptions, 1 grouped count', booking_descriptions, db)
+    print(f'{"":<50} identical: {legacy == new}, speedup: {t_legacy / max(t_new, 1e-9):.1f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
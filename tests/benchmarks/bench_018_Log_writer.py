@@ -0,0 +1,56 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: writing log lines to the log file (LogManager via LogWriter).
+Usage: python -m tests.benchmarks.bench_018_Log_writer [lines]
+"""
+import os
+import sys
+import tempfile
+
+from src.GL.BusinessLayer.LogManager import Singleton as Log
+from src.GL.Enums import LogType, LogLevel, MessageSeverity as Sev
+from tests.benchmarks.Functions import timed
+
+
+def legacy_append_file(self, line):
+    """ Previous implementation: open, append and close the file per line. """
+    with open(self.log_path, 'a') as txtFile:
+        txtFile.write(self._colorless(line) + '\n')
+
+
+def log_lines(count, legacy=False):
+    """ Like a verbose import with many warnings. """
+    log = Log()
+    append_file = Log.LogManager._append_file
+    if legacy:
+        Log.LogManager._append_file = legacy_append_file
+    try:
+        for i in range(count):
+            log.add_coloured_line(
+                f'Regel {i}: tegenrekening NL00BANK{i:010} heeft geen BBAN.', 'ORANGE', sev=Sev.Warning)
+        log.close()
+    finally:
+        Log.LogManager._append_file = append_file
+    with open(log.log_path) as f:
+        return f.read()
+
+
+def main(count=100000):
+    log = Log()
+    with tempfile.TemporaryDirectory() as log_dir:
+        log.start_log(f'{log_dir}{os.sep}', log_type=LogType.File, level=LogLevel.Verbose)
+        legacy, t_legacy = timed(f'{count} lines, open file per line', log_lines, count, True)
+        log.start_log(f'{log_dir}{os.sep}', log_type=LogType.File, level=LogLevel.Verbose)
+        new, t_new = timed(f'{count} lines, buffered writer', log_lines, count)
+    print(f'{"":<50} identical: {legacy == new}, speedup: {t_legacy / max(t_new, 1e-9):.1f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
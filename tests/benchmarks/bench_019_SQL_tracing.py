@@ -0,0 +1,38 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: overhead of the SQL tracing (DBDriver.enable_tracing) and its report of an N+1 query pattern.
+Usage: python -m tests.benchmarks.bench_019_SQL_tracing [rows]
+"""
+import sys
+
+from src.DL.DBDriver.Att import Att
+from src.DL.Model import FD
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, synthetic_transaction_rows, timed
+
+
+def one_query_per_row(db, count) -> list:
+    """ N+1: fetch the rows one by one. """
+    return [db.fetch_one(Table.Transaction, where=[Att(FD.ID, Id)]) for Id in range(1, count + 1)]
+
+
+def main(count=20000):
+    db = start_session()
+    db.insert_many(Table.Transaction, synthetic_transaction_rows(count), add_audit_values=True)
+
+    plain, t_plain = timed(f'{count} queries, tracing off', one_query_per_row, db, count)
+    db.enable_tracing()
+    traced, t_traced = timed(f'{count} queries, tracing on', one_query_per_row, db, count)
+    print(f'{"":<50} identical: {plain == traced}, overhead: {(t_traced / max(t_plain, 1e-9) - 1) * 100:.0f}%')
+    [print(line) for line in db.tracer.report(top_n=3)]
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,156 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: end-to-end on generated ING, Rabobank, Bunq and Triodos files (see Generator).
+Times every import step, the consistency check, the year/month overview, the index rebuild
+and every summary. The timings are written to json, so runs can be compared.
+Usage: python -m tests.benchmarks.bench_020_End_to_end [accounts] [years] [rows per month] [json path]
+"""
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from src.DL.Config import CF_SUMMARY_YEAR, CF_SUMMARY_MONTH_FROM, CF_SUMMARY_MONTH_TO
+from src.DL.Enums.Enums import Summary
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from src.GL.BusinessLayer.SessionManager import Singleton as Session
+from tests.benchmarks.Functions import start_session, configure_import, configure_templates
+from tests.benchmarks.Generator import Generator
+
+VALIDATION = '0. Valideren'
+CONSISTENCY = '7. Consistentie check'
+YEAR_MONTH = '8. Jaar- en maandoverzicht'
+INDEXES = '9. Indexen herbouwen'
+SUMMARIES = [Summary.AnnualAccount, Summary.PeriodicAccount, Summary.RealisationPerBookingCode,
+             Summary.AnnualAccountPlus]
+
+
+class StepTimer(object):
+    """ Elapsed seconds per step. A step ends when the next one starts. """
+
+    def __init__(self):
+        self.timings = {}
+        self._label = None
+        self._start = 0.0
+
+    def lap(self, label=None):
+        now = time.perf_counter()
+        if self._label:
+            self.timings[self._label] = self.timings.get(self._label, 0.0) + now - self._start
+        self._label, self._start = label, now
+
+
+def timed_import(timer) -> float:
+    """ ImportManager.start() with a lap per step. Return the total seconds. """
+    from src.BL.Managers.ImportManager import ImportManager
+    from src.BL.Managers.ConsistencyManager import ConsistencyManager
+    from src.DL.IO.YearMonthIO import YearMonthIO
+
+    def wrap(cls, name, label=None, after=None):
+        """ label: step that starts with the call. Default "step_no. message" of _progress. """
+        method = getattr(cls, name)
+
+        def wrapper(self, *args, **kwargs):
+            if label is not False:
+                timer.lap(label or f'{args[0]}. {args[1].strip()}')
+            result = method(self, *args, **kwargs)
+            if after:
+                timer.lap(after)
+            return result
+        setattr(cls, name, wrapper)
+        return method
+
+    originals = [(ImportManager, '_progress', wrap(ImportManager, '_progress')),
+                 (ConsistencyManager, 'run', wrap(ConsistencyManager, 'run', CONSISTENCY)),
+                 (YearMonthIO, 'refresh_data', wrap(YearMonthIO, 'refresh_data', YEAR_MONTH)),
+                 (ImportManager, '_import', wrap(ImportManager, '_import', False, INDEXES))]
+    try:
+        start = time.perf_counter()
+        timer.lap(VALIDATION)
+        result = ImportManager().start()
+        timer.lap()
+        if not result.OK:
+            raise SystemExit(result.get_messages_as_message())
+        return time.perf_counter() - start
+    finally:
+        [setattr(cls, name, method) for cls, name, method in originals]
+
+
+def timed_summaries(ibans, year) -> dict:
+    """ Seconds per summary type, for all accounts. The search result lists the transactions without booking. """
+    from src.BL.Summary.SummaryDriver import SummaryDriver
+    from src.DL.IO.TransactionsIO import TransactionsIO
+    CM = ConfigManager()
+    CM.set_config_item(CF_SUMMARY_YEAR, year, validate=False)
+    CM.set_config_item(CF_SUMMARY_MONTH_FROM, 1, validate=False)
+    CM.set_config_item(CF_SUMMARY_MONTH_TO, 12, validate=False)
+    configure_templates()
+    timings = {}
+    for summary_type in SUMMARIES:
+        start = time.perf_counter()
+        for iban in ibans:
+            result = SummaryDriver().create_summary(summary_type, iban=iban, CLI_mode=True)
+            if not result.OK:
+                raise SystemExit(f'{summary_type} {iban}: {result.get_messages_as_message()}')
+        timings[summary_type] = time.perf_counter() - start
+
+    # Like pm.py -v
+    start = time.perf_counter()
+    CM.set_search_for_empty_booking_codes()
+    TX = TransactionsIO()
+    TX.search()
+    result = SummaryDriver().create_summary(Summary.SearchResult, te_rows=TX.rows, CLI_mode=True)
+    if not result.OK:
+        raise SystemExit(f'{Summary.SearchResult}: {result.get_messages_as_message()}')
+    timings[Summary.SearchResult] = time.perf_counter() - start
+    return timings
+
+
+def main(account_count=4, year_count=1, rows_per_month=100, json_path=None):
+    db = start_session()
+    generator = Generator(account_count, year_count, rows_per_month)
+    timer = StepTimer()
+    with tempfile.TemporaryDirectory() as output_dir:
+        input_dir, user_data_dir = os.path.join(output_dir, 'Input'), os.path.join(output_dir, 'userdata')
+        paths = generator.write(input_dir, user_data_dir)
+        configure_import(input_dir, user_data_dir)
+        import_seconds = timed_import(timer)
+    summaries = timed_summaries(generator.ibans, generator.years[-1])
+
+    results = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'parameters': {'accounts': account_count, 'years': year_count, 'rows_per_month': rows_per_month,
+                       'files': len(paths)},
+        'transactions': db.count(Table.TransactionEnriched),
+        'import_s': round(import_seconds, 3),
+        'import_steps_s': {label: round(seconds, 3) for label, seconds in sorted(timer.timings.items())},
+        'summaries_s': {summary_type: round(seconds, 3) for summary_type, seconds in summaries.items()},
+    }
+    json_path = json_path or f'{Session().log_dir}Bench_end_to_end.json'
+    with open(json_path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f'{results["transactions"]} transactions in {len(paths)} files '
+          f'({account_count} accounts x {year_count} years x {rows_per_month} rows per month)')
+    for label, seconds in results['import_steps_s'].items():
+        print(f'{label:<50} {seconds:10.3f} s')
+    print(f'{"Import total":<50} {results["import_s"]:10.3f} s')
+    for summary_type, seconds in results['summaries_s'].items():
+        print(f'{summary_type:<50} {seconds:10.3f} s')
+    print(f'Results: {json_path}')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:4]], *sys.argv[4:5])
@@ -0,0 +1,65 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: CLI start-up, import of src.pmc (pm.py) measured with "python -X importtime".
+The modules that the CLI used to load at start-up (GUI modules, process pool) are imported on top of it
+for comparison.
+Usage: python -m tests.benchmarks.bench_021_Import_time [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+CLI = 'import src.pmc'
+# Previously loaded via BookingIO, ConsistencyManager, Figure and ImportManager.
+PREVIOUS = f'{CLI}; import src.VL.Functions, src.VL.Models.BookingCodeModel, concurrent.futures.process'
+TOP_N = 10
+
+
+def import_times(statement) -> dict:
+    """ { module: cumulative microseconds } of 1 fresh interpreter """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                             cwd=ROOT_DIR, capture_output=True, text=True)
+    if process.returncode != 0:
+        raise SystemExit(process.stderr)
+    times = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith('import time:') and '|' in line and 'self [us]' not in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            times[name[1:].rstrip()] = int(cumulative)  # Nested imports are indented
+    return times
+
+
+def measure(label, statement, runs) -> (float, dict):
+    """ Median of the total import time in ms, and the times of the last run. """
+    totals, times = [], {}
+    for _ in range(runs):
+        times = import_times(statement)
+        # Top level modules only, otherwise nested imports are counted twice.
+        totals.append(sum(us for name, us in times.items() if not name.startswith(' ')) / 1000)
+    median = statistics.median(totals)
+    vl_count = sum(1 for name in times if name.strip().startswith('src.VL'))
+    print(f'{label:<50} {median:10.1f} ms  ({len(times)} modules, {vl_count} src.VL)')
+    return median, times
+
+
+def main(runs=5):
+    cli, times = measure('pm.py (headless)', CLI, runs)
+    previous, _ = measure('pm.py + GUI modules and process pool (previous)', PREVIOUS, runs)
+    print(f'{"":<50} saved: {previous - cli:.1f} ms per run')
+    print(f'Top {TOP_N} cumulative (last run):')
+    for name, us in sorted(times.items(), key=lambda x: x[1], reverse=True)[:TOP_N]:
+        print(f'{us / 1000:10.1f} ms  {name.strip()}')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
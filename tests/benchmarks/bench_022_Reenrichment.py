@@ -0,0 +1,72 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: a search term is added. Only the affected transactions are enriched again (EnrichmentManager),
+versus importing all transactions again. The bookings must be identical.
+Usage: python -m tests.benchmarks.bench_022_Reenrichment [accounts] [years] [rows per month]
+"""
+import csv
+import os
+import sys
+import tempfile
+
+from src.DL.Model import FD
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, configure_import, timed
+from tests.benchmarks.Generator import Generator
+
+# Card payments without search term, booked as "Overige uitgaven" until now.
+SEARCH_TERM = 'albert heijn'
+BOOKING_CODE = 'U1.4'
+
+
+def import_all():
+    from src.BL.Managers.ImportManager import ImportManager
+    result = ImportManager().start()
+    if not result.OK:
+        raise SystemExit(result.get_messages_as_message())
+
+
+def get_bookings(db) -> dict:
+    """ { Id: (booking code, booking id) } """
+    return {row[0]: (row[1], row[2]) for row in db.select(
+        Table.TransactionEnriched, names=[FD.ID, FD.Booking_code, FD.Booking_id])}
+
+
+def main(account_count=4, year_count=1, rows_per_month=100):
+    from src.BL.Managers.EnrichmentManager import EnrichmentManager
+    from src.DL.IO.SearchTermIO import SearchTermIO
+    from src.DL.Objects.SearchTerm import SearchTerm
+    db = start_session()
+    generator = Generator(account_count, year_count, rows_per_month)
+    with tempfile.TemporaryDirectory() as output_dir:
+        input_dir, user_data_dir = os.path.join(output_dir, 'Input'), os.path.join(output_dir, 'userdata')
+        generator.write(input_dir, user_data_dir)
+        configure_import(input_dir, user_data_dir)
+        timed('Import', import_all)
+        before = get_bookings(db)
+
+        # Add the search term, in the database and in the user csv file (for the re-import).
+        SearchTermIO().insert(SearchTerm(search_term=SEARCH_TERM, booking_code=BOOKING_CODE))
+        with open(os.path.join(user_data_dir, 'Zoektermen.csv'), 'a', newline='') as f:
+            csv.writer(f, delimiter=';').writerow([SEARCH_TERM, BOOKING_CODE])
+
+        count, t_targeted = timed(
+            'Re-enrich the affected transactions', EnrichmentManager().reenrich, search_terms=[SEARCH_TERM])
+        targeted = get_bookings(db)
+        _, t_full = timed('Import all transactions again', import_all)
+        full = get_bookings(db)
+
+    changed = sum(1 for Id, booking in targeted.items() if before.get(Id) != booking)
+    print(f'{len(full)} transactions, {count} re-enriched ({changed} changed)')
+    print(f'Identical: {targeted == full}, speedup: {t_full / max(t_targeted, 1e-9):.0f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:4]])
@@ -0,0 +1,86 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: transactions pane of an account with its whole history.
+All rows fetched and formatted (previous) versus the first page (keyset pagination) and the next pages on demand.
+Usage: python -m tests.benchmarks.bench_023_Transaction_pages [years] [rows per month]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.DL.DBDriver.Att import Att
+from src.DL.Model import FD
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, configure_import
+from tests.benchmarks.Generator import Generator, ING
+
+TABLE = Table.TransactionEnriched
+
+
+def measured(method, *args):
+    """ Return (result, seconds, peak MB) """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = method(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main(year_count=5, rows_per_month=500):
+    from src.BL.Managers.ImportManager import ImportManager
+    from src.DL.Pager import Pager
+    from src.VL.Models.BaseModel import DD
+    from src.VL.Models.Panes.TransactionsEnriched import TransactionsEnriched
+    from src.VL.Models.MainModel import TE_KEYS
+
+    db = start_session()
+    generator = Generator(1, year_count, rows_per_month, banks=(ING,))
+    with tempfile.TemporaryDirectory() as output_dir:
+        input_dir, user_data_dir = os.path.join(output_dir, 'Input'), os.path.join(output_dir, 'userdata')
+        generator.write(input_dir, user_data_dir)
+        configure_import(input_dir, user_data_dir)
+        result = ImportManager().start()
+        if not result.OK:
+            raise SystemExit(result.get_messages_as_message())
+
+    where = [Att(FD.Account_bban, get_BBAN_from_IBAN(generator.ibans[0]))]
+    header = DD.get_header(TABLE)
+
+    def all_rows():
+        view = TransactionsEnriched()
+        # Like DataDriver.fetch_set, with a unique order
+        order_by = [[Att(FD.Date), 'DESC'], [Att(FD.ID), 'DESC']]
+        view.set_data([header, *db.fetch(TABLE, where=where, order_by=order_by)])
+        return view
+
+    def first_page():
+        view = TransactionsEnriched()
+        view.set_pager(Pager(TABLE, keys=TE_KEYS, where=where), header)
+        return view
+
+    full, t_full, mb_full = measured(all_rows)
+    paged, t_paged, mb_paged = measured(first_page)
+    print(f'{full.total} transactions')
+    print(f'{"All rows (previous)":<40} {t_full:8.3f} s {mb_full:8.1f} MB')
+    print(f'{"First page":<40} {t_paged:8.3f} s {mb_paged:8.1f} MB  ({len(paged.rows)} rows, total {paged.total})')
+
+    start = time.perf_counter()
+    paged.load_all()
+    print(f'{"Next pages on demand, all of them":<40} {time.perf_counter() - start:8.3f} s')
+    print(f'Identical: {paged.rows == full.rows}')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:3]])
@@ -0,0 +1,85 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Stress test: several reader threads query the transactions (count and first page, like the transactions pane)
+while an import is running. Each reader has its own read-only connection (ReadConnections).
+Before, the session connection could only be used by the thread that created it.
+Usage: python -m tests.benchmarks.bench_024_Concurrent_readers [readers] [accounts] [years] [rows per month]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, configure_import, timed
+from tests.benchmarks.Generator import Generator
+
+TABLE = Table.TransactionEnriched
+
+
+def import_all():
+    from src.BL.Managers.ImportManager import ImportManager
+    result = ImportManager().start()
+    if not result.OK:
+        raise SystemExit(result.get_messages_as_message())
+
+
+def read(db, latencies):
+    from src.DL.Model import FD
+    from src.DL.Pager import Pager
+    start = time.perf_counter()
+    pager = Pager(TABLE, keys=[FD.Date, FD.ID])
+    pager.next_page()
+    latencies.append(time.perf_counter() - start)
+    return pager.total
+
+
+def main(reader_count=4, account_count=2, year_count=2, rows_per_month=300):
+    generator = Generator(account_count, year_count, rows_per_month)
+    with tempfile.TemporaryDirectory() as output_dir:
+        input_dir, user_data_dir = os.path.join(output_dir, 'Input'), os.path.join(output_dir, 'userdata')
+        generator.write(input_dir, user_data_dir)
+
+        start_session()
+        configure_import(input_dir, user_data_dir)
+        _, t_alone = timed('Import', import_all)
+
+        # Again, with readers
+        db = start_session()
+        configure_import(input_dir, user_data_dir)
+        stop, latencies, totals, errors = threading.Event(), [], set(), []
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    totals.add(read(db, latencies))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                db.close_reader()
+
+        threads = [threading.Thread(target=reader) for _ in range(reader_count)]
+        [t.start() for t in threads]
+        _, t_readers = timed(f'Import with {reader_count} concurrent readers', import_all)
+        stop.set()
+        [t.join() for t in threads]
+        db.close_readers()
+
+    print(f'Import slower by {t_readers / t_alone - 1:.0%}')
+    print(f'Reads: {len(latencies)}, latency median {statistics.median(latencies) * 1000:.1f} ms, '
+          f'max {max(latencies) * 1000:.1f} ms')
+    print(f'Totals seen: {sorted(totals)}, final {db.count(TABLE)}')
+    print(f'Errors: {errors or "none"}')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:5]])
@@ -0,0 +1,67 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+"""
+Benchmark: "Jaarrekening plus periodieke overzichten" one after another (1 job, previous)
+versus at the same time (pm.py -j). The exported files, messages and export count must be identical.
+Usage: python -m tests.benchmarks.bench_025_Summary_jobs [jobs] [years] [rows per month]
+"""
+import os
+import sys
+import tempfile
+
+from src.DL.Config import CF_SUMMARY_YEAR, CF_SUMMARY_MONTH_FROM, CF_SUMMARY_MONTH_TO, CF_SUMMARY_JOBS
+from src.DL.Enums.Enums import Summary
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from src.GL.BusinessLayer.SessionManager import Singleton as Session
+from tests.benchmarks.Functions import start_session, configure_import, configure_templates, timed
+from tests.benchmarks.Generator import Generator, ING
+
+
+def create_summaries(iban, jobs) -> (list, dict):
+    """ Return (messages, {file name: content}) """
+    from src.BL.Summary.SummaryDriver import SummaryDriver
+    ConfigManager().set_config_item(CF_SUMMARY_JOBS, jobs, validate=False)
+    export_dir = Session().export_dir
+    [os.remove(os.path.join(export_dir, name)) for name in os.listdir(export_dir)]
+    result, _ = timed(f'{Summary.AnnualAccountPlus}, {jobs} job(s)', SummaryDriver().create_summary,
+                      Summary.AnnualAccountPlus, iban=iban, CLI_mode=True)
+    if not result.OK:
+        raise SystemExit(result.get_messages_as_message())
+    files = {}
+    for name in sorted(os.listdir(export_dir)):
+        with open(os.path.join(export_dir, name)) as f:
+            files[name] = f.read()
+    return [m.message for m in result.yield_messages()], files
+
+
+def main(jobs=3, year_count=1, rows_per_month=2000):
+    start_session()
+    generator = Generator(1, year_count, rows_per_month, banks=(ING,))
+    with tempfile.TemporaryDirectory() as output_dir:
+        input_dir, user_data_dir = os.path.join(output_dir, 'Input'), os.path.join(output_dir, 'userdata')
+        generator.write(input_dir, user_data_dir)
+        configure_import(input_dir, user_data_dir)
+        from src.BL.Managers.ImportManager import ImportManager
+        result = ImportManager().start()
+        if not result.OK:
+            raise SystemExit(result.get_messages_as_message())
+
+    CM = ConfigManager()
+    CM.set_config_item(CF_SUMMARY_YEAR, generator.years[-1], validate=False)
+    CM.set_config_item(CF_SUMMARY_MONTH_FROM, 1, validate=False)
+    CM.set_config_item(CF_SUMMARY_MONTH_TO, 12, validate=False)
+    configure_templates()
+
+    serial = create_summaries(generator.ibans[0], 1)
+    concurrent = create_summaries(generator.ibans[0], jobs)
+    print(f'{len(serial[1])} files, {len(serial[0])} messages. Identical: {serial == concurrent}')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:4]])
@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.BL.Summary.Templates.ResultPerBookingCode import ResultsPerBookingCode
+from src.DL.Config import CF_SUMMARY_YEAR, CF_SUMMARY_MONTH_FROM, CF_SUMMARY_MONTH_TO, CF_SUMMARY_JOBS
+from src.DL.Enums.Enums import Summary
+from src.DL.Lexicon import SUMMARIES
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from src.GL.BusinessLayer.SessionManager import Singleton as Session
+from src.GL.GeneralException import GeneralException
+from tests.benchmarks.Functions import start_session, configure_import, configure_templates
+from tests.benchmarks.Generator import Generator, ING
+
+
+class SummaryJobsTestCase(unittest.TestCase):
+    """ Annual account plus: the summaries one after another (1 job) or at the same time (3 jobs). """
+
+    def setUp(self):
+        start_session()
+        self._generator = Generator(1, 1, 20, banks=(ING,))
+        with tempfile.TemporaryDirectory() as output_dir:
+            input_dir, user_data_dir = os.path.join(output_dir, 'Input'), os.path.join(output_dir, 'userdata')
+            self._generator.write(input_dir, user_data_dir)
+            configure_import(input_dir, user_data_dir)
+            from src.BL.Managers.ImportManager import ImportManager
+            result = ImportManager().start()
+            self.assertTrue(result.OK, result.get_messages_as_message())
+        CM = ConfigManager()
+        CM.set_config_item(CF_SUMMARY_YEAR, self._generator.years[-1], validate=False)
+        CM.set_config_item(CF_SUMMARY_MONTH_FROM, 1, validate=False)
+        CM.set_config_item(CF_SUMMARY_MONTH_TO, 12, validate=False)
+        configure_templates()
+
+    def _create_summaries(self, jobs) -> tuple:
+        """ Return (result, [messages], {file name: content}) """
+        from src.BL.Summary.SummaryDriver import SummaryDriver
+        ConfigManager().set_config_item(CF_SUMMARY_JOBS, jobs, validate=False)
+        export_dir = Session().export_dir
+        [os.remove(os.path.join(export_dir, name)) for name in os.listdir(export_dir)]
+        result = SummaryDriver().create_summary(Summary.AnnualAccountPlus, iban=self._generator.ibans[0], CLI_mode=True)
+        files = {}
+        for name in sorted(os.listdir(export_dir)):
+            with open(os.path.join(export_dir, name)) as f:
+                files[name] = f.read()
+        return result, [m.message for m in result.yield_messages()], files
+
+    def test_TC01_Jobs_give_identical_output(self):
+        serial = self._create_summaries(1)
+        concurrent = self._create_summaries(3)
+        self.assertTrue(serial[0].OK, serial[0].get_messages_as_message())
+        self.assertTrue(concurrent[0].OK, concurrent[0].get_messages_as_message())
+        self.assertGreater(len(serial[2]), 2)
+        self.assertEqual(serial[1], concurrent[1])
+        self.assertEqual(serial[2], concurrent[2])
+        self.assertIn(f'{len(serial[2])} {SUMMARIES} zijn', serial[1][-1])
+
+    def test_TC02_No_completion_message_if_a_part_fails(self):
+        with mock.patch.object(ResultsPerBookingCode, 'export', side_effect=GeneralException('Fout in een overzicht')):
+            for jobs in (1, 3):
+                result, messages, _ = self._create_summaries(jobs)
+                self.assertTrue(result.ER)
+                self.assertIn('Fout in een overzicht', messages)
+                self.assertFalse([m for m in messages if f'{SUMMARIES} zijn geëxporteerd' in m])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.DL.Config import CF_SEARCH_YEAR, CF_SEARCH_MONTH, CF_SEARCH_BOOKING_CODE, CF_SEARCH_COUNTER_ACCOUNT, \
+    CF_SEARCH_AMOUNT, CF_SEARCH_AMOUNT_TO, CF_SEARCH_TRANSACTION_CODE, CF_SEARCH_TEXT, CF_SEARCH_REMARKS, \
+    CF_REMARKS, CF_ID_ME
+from src.DL.DBDriver.Att import Att
+from src.DL.IO.TransactionIO import TransactionIO
+from src.DL.IO.TransactionsIO import TransactionsIO
+from src.DL.Model import FD
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from src.GL.Const import EMPTY
+from src.VL.Data.Constants.Const import LEEG
+from tests.benchmarks.Functions import start_session, configure_import
+from tests.benchmarks.Generator import Generator, ING
+
+TABLE = Table.TransactionEnriched
+SQL_LIKE = f'SELECT {FD.ID} FROM {TABLE} WHERE {FD.Name} LIKE ? OR {FD.Comments} LIKE ? OR {FD.Remarks} LIKE ?'
+# Name, comments (with spaces and digits), case insensitive
+TERMS = ['Heijn', 'albert heijn', 'kerkbalans', 'kenmerk 1', 'Term: Bouwmarkt', 'ROOS']
+LIKE_TERMS = ['AH', 'Albert*', 'kenmerk 1%', 'Gam_a', '_']
+
+CM = ConfigManager(unit_test=True)
+
+
+def import_files(**kwargs):
+    from src.BL.Managers.ImportManager import ImportManager
+    result = ImportManager().start(**kwargs)
+    if not result.OK:
+        raise AssertionError(result.get_messages_as_message())
+
+
+class SearchTextIndexTestCase(unittest.TestCase):
+    """ Searching in Name, Comments and Remarks via the full-text index gives the same rows as via LIKE. """
+
+    def setUp(self):
+        self._db = start_session()
+        self._dir = tempfile.TemporaryDirectory()
+        self._input_dir = os.path.join(self._dir.name, 'Input')
+        self._paths = Generator(2, 1, 10, banks=(ING,)).write(
+            os.path.join(self._dir.name, 'All'), os.path.join(self._dir.name, 'userdata'))
+        configure_import(self._input_dir, os.path.join(self._dir.name, 'userdata'))
+        os.makedirs(self._input_dir)
+        shutil.copy(self._paths[0], self._input_dir)
+        import_files()
+        for key in (CF_SEARCH_YEAR, CF_SEARCH_MONTH, CF_SEARCH_BOOKING_CODE, CF_SEARCH_COUNTER_ACCOUNT,
+                    CF_SEARCH_AMOUNT, CF_SEARCH_AMOUNT_TO, CF_SEARCH_TRANSACTION_CODE, CF_SEARCH_REMARKS):
+            CM.config_dict[key] = EMPTY
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _search(self, text, text_index=True) -> list:
+        """ Ids found via the search (TransactionsIO) """
+        CM.config_dict[CF_SEARCH_TEXT] = text
+        io = TransactionsIO()
+        self.assertEqual(io._is_text_index_search(text), text_index)
+        io.search(dialog_mode=False)
+        return sorted(row[0] for row in io.rows)
+
+    def _like(self, text) -> list:
+        """ Ids found via LIKE """
+        value = TransactionsIO._wildcard(text)
+        return sorted(row[0] for row in self._db.fetch_query(SQL_LIKE, [value, value, value]))
+
+    def _assert_same_rows(self, terms=None):
+        for term in terms or TERMS:
+            ids = self._search(term)
+            self.assertTrue(ids, term)
+            self.assertEqual(ids, self._like(term), term)
+
+    def test_TC01_Text_index(self):
+        self.assertTrue(self._db.text_index_exists(Table.TransactionSearch))
+        self._assert_same_rows()
+
+        # Insert (import of a new file)
+        count = self._db.count(TABLE)
+        shutil.copy(self._paths[1], self._input_dir)
+        import_files(import_user_csv_files=False, incremental=True)
+        self.assertGreater(self._db.count(TABLE), count)
+        self._assert_same_rows()
+
+        # Update of the remarks
+        Id = self._search('Bouwmarkt')[0]
+        CM.set_config_item(CF_REMARKS, 'Verjaardag van Oma')
+        CM.set_config_item(CF_ID_ME, Id)
+        self.assertTrue(TransactionIO().save_pending_remarks())
+        self.assertEqual(self._search('verjaardag'), [Id])
+        self._assert_same_rows(TERMS + ['van oma'])
+        # Emptied
+        CM.set_config_item(CF_REMARKS, LEEG)
+        self.assertTrue(TransactionIO().save_pending_remarks())
+        self.assertEqual(self._search('verjaardag'), [])
+
+        # Delete
+        Id = self._search('Heijn')[0]
+        self.assertEqual(self._db.delete(TABLE, where=[Att(FD.ID, Id)]), 1)
+        self.assertNotIn(Id, self._search('Heijn'))
+        self._assert_same_rows()
+
+    def test_TC02_Like(self):
+        # Less than 3 characters, or wildcards: via LIKE.
+        for term in LIKE_TERMS:
+            self.assertEqual(self._search(term, text_index=False), self._like(term), term)
+        self.assertTrue(self._search('Albert*', text_index=False))
+
+        # Without full-text support (sqlite < 3.34): via LIKE.
+        expected = {term: self._search(term) for term in TERMS}
+        self._db.drop_text_index(Table.TransactionSearch)
+        for term in TERMS:
+            self.assertEqual(self._search(term, text_index=False), expected[term], term)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+
+from src.DL.Config import CF_IMPORT_INCREMENTAL
+from src.DL.Model import FD, Model
+from src.DL.Table import Table
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from src.GL.Result import Result
+from tests.benchmarks.Functions import start_session, configure_import
+from tests.benchmarks.Generator import Generator, ING
+
+model = Model()
+MO_COLNOS = list(model.get_colno_per_att_name(Table.Month, zero_based=False).values())
+SQL_TE_TOTALS = (
+    f'SELECT {FD.Account_bban}, {FD.Year}, {FD.Month}, {FD.Booking_code}, TOTAL({FD.Amount_signed}), COUNT(*) '
+    f'FROM {Table.TransactionEnriched} '
+    f'GROUP BY {FD.Account_bban}, {FD.Year}, {FD.Month}, {FD.Booking_code} '
+    f'ORDER BY {FD.Account_bban}, {FD.Year}, {FD.Month}, {FD.Booking_code}')
+SQL_ALBERT_HEIJN = \
+    f"SELECT DISTINCT {FD.Booking_code} FROM {Table.TransactionEnriched} WHERE {FD.Name} = 'Albert Heijn'"
+
+
+def start_import(**kwargs):
+    from src.BL.Managers.ImportManager import ImportManager
+    result = ImportManager().start(**kwargs)
+    if not result.OK:
+        raise AssertionError(result.get_messages_as_message())
+    return result
+
+
+def copy_head(path, target_dir, row_count):
+    """ The header and the first rows of a bank file (ING) """
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f, delimiter=';'))
+    with open(os.path.join(target_dir, os.path.basename(path)), 'w', newline='') as f:
+        csv.writer(f, delimiter=';', quoting=csv.QUOTE_ALL).writerows(rows[:row_count + 1])
+
+
+class IncrementalImportTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._db = start_session()
+        self._dir = tempfile.TemporaryDirectory()
+        self._generator = Generator(2, 2, 10, banks=(ING,))
+        self._all_dir = os.path.join(self._dir.name, 'All')
+        self._input_dir = os.path.join(self._dir.name, 'Input')
+        self._user_data_dir = os.path.join(self._dir.name, 'userdata')
+        # Files: account 1 year 1, account 1 year 2, account 2 year 1, account 2 year 2
+        self._paths = self._generator.write(self._all_dir, self._user_data_dir)
+        configure_import(self._input_dir, self._user_data_dir)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _snapshot(self) -> tuple:
+        """ (Month rows of the current account, TransactionEnriched totals per account/year/month/booking) """
+        return ([[row[c] for c in MO_COLNOS] for row in self._db.fetch(Table.Month)],
+                self._db.fetch_query(SQL_TE_TOTALS))
+
+    def test_TC01_Incremental_equals_full(self):
+        # First import: the first half of account 1 year 2, and without account 2 year 2.
+        os.makedirs(self._input_dir)
+        [shutil.copy(self._paths[i], self._input_dir) for i in (0, 2)]
+        copy_head(self._paths[1], self._input_dir, 60)
+        start_import()
+        self.assertEqual(self._db.count(Table.Transaction), 2 * 120 + 60)
+
+        # Rows appended to a file, and a new file.
+        [shutil.copy(self._paths[i], self._input_dir) for i in (1, 3)]
+        start_import(import_user_csv_files=False, incremental=True)
+        row_count = self._generator.row_count
+        self.assertEqual(self._db.count(Table.Transaction), row_count)
+        self.assertEqual(self._db.count(Table.TransactionEnriched), row_count)
+        self.assertEqual(self._db.count(Table.ImportFile), 4)
+        # No doubles
+        rows = self._db.select(Table.TransactionEnriched, names=[FD.Account_bban, FD.Date, FD.Comments])
+        self.assertEqual(max(Counter(tuple(row) for row in rows).values()), 1)
+        incremental = self._snapshot()
+
+        # Unchanged files are skipped.
+        result = start_import(import_user_csv_files=False, incremental=True)
+        self.assertIn('0 nieuwe', result.get_messages_as_message(max_lines=100))
+        self.assertEqual(self._db.count(Table.Transaction), row_count)
+        self.assertEqual(self._snapshot(), incremental)
+
+        # The same totals as a full import.
+        start_import()
+        self.assertEqual(self._db.count(Table.Transaction), row_count)
+        self.assertEqual(self._snapshot(), incremental)
+
+    def test_TC02_User_data_is_always_a_full_import(self):
+        os.makedirs(self._input_dir)
+        shutil.copy(self._paths[0], self._input_dir)
+        start_import()
+        self.assertNotIn(['U1.4'], self._db.fetch_query(SQL_ALBERT_HEIJN))
+
+        # A new search term, imported with the user data.
+        with open(os.path.join(self._user_data_dir, 'Zoektermen.csv'), 'a', newline='') as f:
+            csv.writer(f, delimiter=';').writerow(['albert heijn', 'U1.4'])
+        start_import(import_user_csv_files=True, incremental=True)
+        self.assertEqual(self._db.fetch_query(SQL_ALBERT_HEIJN), [['U1.4']])
+
+    def test_TC03_Configuration_import_is_always_a_full_import(self):
+        from src.DL.UserCsvFiles.UserCsvFileManager import UserCsvFileManager
+        from src.VL.Controllers.MainController import MainController
+        os.makedirs(self._input_dir)
+        shutil.copy(self._paths[0], self._input_dir)
+        start_import()
+        ConfigManager().set_config_item(CF_IMPORT_INCREMENTAL, True, validate=False)
+
+        # Restore of the booking related data (a backup with a new search term)
+        backup_path = os.path.join(self._dir.name, 'Zoektermen.csv')
+        shutil.copy(os.path.join(self._user_data_dir, 'Zoektermen.csv'), backup_path)
+        with open(backup_path, 'a', newline='') as f:
+            csv.writer(f, delimiter=';').writerow(['albert heijn', 'U1.4'])
+        UserCsvFileManager().import_user_defined_csv_files({Table.SearchTerm: backup_path})
+        self.assertNotIn(['U1.4'], self._db.fetch_query(SQL_ALBERT_HEIJN))
+
+        # The configuration window asks for an import: the restored bookings are linked.
+        config_window = mock.Mock(result=Result())
+        config_window.model.do_import, config_window.model.do_factory_reset = True, False
+        with mock.patch.object(MainController, '_start_config'), \
+                mock.patch('src.VL.Controllers.MainController.ConfigWindow', return_value=config_window):
+            controller = MainController(mock.Mock(), None, unit_test=True)
+            controller._start_db()
+            controller.config()
+        self.assertTrue(controller.restart_app)
+        self.assertEqual(self._db.fetch_query(SQL_ALBERT_HEIJN), [['U1.4']])
+
+
+if __name__ == '__main__':
+    unittest.main()
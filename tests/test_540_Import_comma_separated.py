@@ -0,0 +1,61 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import tempfile
+import unittest
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.DL.Config import CF_INPUT_DIR
+from src.DL.DBDriver.Att import Att
+from src.DL.Model import FD
+from src.DL.Table import Table
+from tests.benchmarks.Functions import start_session, configure_import
+from tests.benchmarks.Generator import Generator, RABOBANK, TRIODOS
+
+ROWS_PER_FILE = 12 * 10
+
+
+class CommaSeparatedImportTestCase(unittest.TestCase):
+    """ Rabobank and Triodos files are "," separated. """
+
+    def setUp(self):
+        self._db = start_session()
+        self._dir = tempfile.TemporaryDirectory()
+        self._generator = Generator(2, 1, 10, banks=(RABOBANK, TRIODOS))
+        input_dir = os.path.join(self._dir.name, 'Input')
+        self._generator.write(input_dir, os.path.join(self._dir.name, 'userdata'))
+        configure_import(input_dir, os.path.join(self._dir.name, 'userdata'))
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_TC01_Validate(self):
+        from src.BL.Validator import Validator
+        validator = Validator()
+        result = validator.validate_config_dir(CF_INPUT_DIR)
+        self.assertTrue(result.OK, result.get_messages_as_message())
+        files = validator.transaction_files.values()
+        self.assertEqual(len(files), 2)
+        for file in files:
+            self.assertEqual(file.delimiter, ',')
+            self.assertGreater(file.column_count, 1)
+
+    def test_TC02_Import(self):
+        from src.BL.Managers.ImportManager import ImportManager
+        result = ImportManager().start()
+        self.assertTrue(result.OK, result.get_messages_as_message())
+        # Rabobank. The 1st row of a Triodos file (no header) is used as the header.
+        rabobank = [Att(FD.Account_bban, get_BBAN_from_IBAN(self._generator.ibans[0]))]
+        self.assertEqual(self._db.count(Table.TransactionEnriched, where=rabobank), ROWS_PER_FILE)
+        self.assertEqual(self._db.count(Table.TransactionEnriched), 2 * ROWS_PER_FILE - 1)
+        self.assertEqual(self._db.count(Table.Transaction), 2 * ROWS_PER_FILE - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
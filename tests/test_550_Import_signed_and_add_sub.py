@@ -0,0 +1,60 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import csv
+import os
+import tempfile
+import unittest
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.DL.Model import FD
+from src.DL.Table import Table
+from src.GL.Functions import toFloat
+from tests.benchmarks.Functions import start_session, configure_import
+from tests.benchmarks.Generator import Generator, RABOBANK, ING
+
+SQL_TE_SIGNS = (
+    f'SELECT {FD.Account_bban}, ROUND(TOTAL({FD.Amount_signed}), 2), SUM({FD.Amount_signed} < 0) '
+    f'FROM {Table.TransactionEnriched} GROUP BY {FD.Account_bban} ORDER BY {FD.Account_bban}')
+
+
+def get_signed_amounts(path, bank) -> list:
+    """ Rabobank: signed amount. ING: Af/Bij column and unsigned amount. """
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f, delimiter=',' if bank == RABOBANK else ';'))[1:]
+    if bank == RABOBANK:
+        return [toFloat(row[6]) for row in rows]
+    return [toFloat(row[6]) * (1 if row[5] == 'Bij' else -1) for row in rows]
+
+
+class SignedAndAddSubImportTestCase(unittest.TestCase):
+    """ A signed file (Rabobank) and an Af/Bij file (ING) in the same input folder. """
+
+    def test_TC01_Sign_per_row(self):
+        db = start_session()
+        with tempfile.TemporaryDirectory() as output_dir:
+            generator = Generator(2, 1, 10, banks=(RABOBANK, ING))
+            input_dir, user_data_dir = os.path.join(output_dir, 'Input'), os.path.join(output_dir, 'userdata')
+            paths = generator.write(input_dir, user_data_dir)
+            configure_import(input_dir, user_data_dir)
+            expected = []
+            for path, (iban, bank) in zip(paths, ((generator.ibans[0], RABOBANK), (generator.ibans[1], ING))):
+                amounts = get_signed_amounts(path, bank)
+                expected.append([get_BBAN_from_IBAN(iban), round(sum(amounts), 2), sum(a < 0 for a in amounts)])
+
+            from src.BL.Managers.ImportManager import ImportManager
+            result = ImportManager().start()
+            self.assertTrue(result.OK, result.get_messages_as_message())
+
+        self.assertEqual(db.fetch_query(SQL_TE_SIGNS), sorted(expected))
+        # Both kinds of rows have payments and revenues.
+        [self.assertTrue(0 < negatives < generator.row_count // 2) for _, _, negatives in expected]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+from src.BL.Functions import get_BBAN_from_IBAN
+from src.DL.Config import CF_IBAN, CF_COL_OVERBOOKING
+from src.DL.DBDriver.Att import Att
+from src.DL.IO.YearMonthIO import YearMonthIO, SQL_MONTH_TOTALS
+from src.DL.Lexicon import OVERBOOKINGS
+from src.DL.Model import FD, Model
+from src.DL.Table import Table
+from src.DL.YearMonthCache import Singleton as YearMonthCache
+from src.GL.BusinessLayer.ConfigManager import ConfigManager
+from tests.benchmarks.Functions import start_session, configure_import
+from tests.benchmarks.Generator import Generator, ING
+
+model = Model()
+MO_COLNOS = model.get_colno_per_att_name(Table.Month, zero_based=False)
+OVERBOOKING_CODE = 'K5.0'
+COFFEE_CODE = 'U1.4'
+SQL_CARD_PAYMENT = (
+    f'SELECT {FD.ID}, {FD.Month}, {FD.Amount_signed}, {FD.Comments} FROM {Table.TransactionEnriched} '
+    f"WHERE {FD.Account_bban} = ? AND {FD.Year} = ? AND {FD.Name} = 'Albert Heijn' ORDER BY {FD.ID} LIMIT 1")
+SQL_BOOKED_YEARS = (
+    f'SELECT MIN({FD.Year}), MAX({FD.Year}) FROM {Table.TransactionEnriched} '
+    f'WHERE {FD.Account_bban} = ? AND {FD.Booking_code} = ?')
+
+CM = ConfigManager(unit_test=True)
+YMC = YearMonthCache()
+
+
+def import_files(**kwargs):
+    from src.BL.Managers.ImportManager import ImportManager
+    result = ImportManager().start(**kwargs)
+    if not result.OK:
+        raise AssertionError(result.get_messages_as_message())
+
+
+@contextmanager
+def month_totals_queries(db):
+    """ Collect the (bban, from year, to year) of the recalculations in the block. """
+    queries = []
+    fetch_query = db.fetch_query
+
+    def spy(sql_stmt, params=()):
+        if sql_stmt == SQL_MONTH_TOTALS:
+            queries.append(tuple(params))
+        return fetch_query(sql_stmt, params)
+
+    with mock.patch.object(db, 'fetch_query', side_effect=spy):
+        yield queries
+
+
+class YearMonthCacheTestCase(unittest.TestCase):
+    """ Only the invalidated years of an account are recalculated, with the same result as a full calculation. """
+
+    def setUp(self):
+        self._db = start_session()
+        self._dir = tempfile.TemporaryDirectory()
+        self._generator = Generator(2, 2, 5, banks=(ING,))
+        self._input_dir = os.path.join(self._dir.name, 'Input')
+        user_data_dir = os.path.join(self._dir.name, 'userdata')
+        # Files: account 1 year 1, account 1 year 2, account 2 year 1, account 2 year 2
+        self._paths = self._generator.write(os.path.join(self._dir.name, 'All'), user_data_dir)
+        configure_import(self._input_dir, user_data_dir)
+        os.makedirs(self._input_dir)
+        self._ibans = self._generator.ibans
+        self._bbans = [get_BBAN_from_IBAN(iban) for iban in self._ibans]
+        self._years = self._generator.years
+        CM.set_config_item(CF_COL_OVERBOOKING, False, validate=False)
+        CM.set_config_item(CF_IBAN, self._ibans[0], validate=False)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _import(self, indexes, **kwargs):
+        [shutil.copy(self._paths[i], self._input_dir) for i in indexes]
+        import_files(**kwargs)
+
+    def _refresh(self, account=0) -> list:
+        """ Refresh the Month and Year tables of the account. Return the recalculations. """
+        CM.set_config_item(CF_IBAN, self._ibans[account], validate=False)
+        with month_totals_queries(self._db) as queries:
+            result = YearMonthIO().refresh_data()
+        self.assertFalse(result.ER, result.get_messages_as_message())
+        return queries
+
+    def _months(self) -> dict:
+        """ { (year, month): { name: value } } of the Month table """
+        return {(row[MO_COLNOS[FD.Year]], row[MO_COLNOS[FD.Month]]):
+                {name: row[colno] for name, colno in MO_COLNOS.items()} for row in self._db.fetch(Table.Month)}
+
+    def _assert_equals_full_calculation(self, account=0):
+        months = self._months()
+        YMC.invalidate()
+        self.assertEqual(self._refresh(account), [(self._bbans[account], *self._years)])
+        self.assertEqual(self._months(), months)
+
+    def _card_payment(self, year) -> tuple:
+        """ The first card payment of account 1 in the year: (Id, month, amount_signed, comments) """
+        return tuple(self._db.fetch_query(SQL_CARD_PAYMENT, [self._bbans[0], year])[0])
+
+    def test_TC01_Import(self):
+        # The import calculates the current account.
+        with month_totals_queries(self._db) as queries:
+            self._import([0, 1, 2])
+        self.assertEqual(queries, [(self._bbans[0], *self._years)])
+        self.assertEqual(self._refresh(1), [(self._bbans[1], self._years[0], self._years[0])])
+        self.assertEqual(self._refresh(0), [])
+
+        # A new file of account 2 year 2: account 1 stays valid, only account 2 year 2 is recalculated.
+        with month_totals_queries(self._db) as queries:
+            self._import([3], import_user_csv_files=False, incremental=True)
+        self.assertEqual(queries, [])
+        self.assertEqual(self._refresh(0), [])
+        self.assertEqual(self._refresh(1), [(self._bbans[1], self._years[1], self._years[1])])
+        self._assert_equals_full_calculation(1)
+
+        # A full import invalidates all.
+        self._import([], import_user_csv_files=False)
+        self.assertEqual(self._refresh(0), [(self._bbans[0], *self._years)])
+
+    def test_TC02_Update_booking(self):
+        from src.DL.IO.TransactionIO import TransactionIO
+        self._import([0, 1, 2, 3])
+        # Context: the visible optional columns
+        self.assertEqual(self._refresh(), [])
+        CM.set_config_item(CF_COL_OVERBOOKING, True, validate=False)
+        self.assertEqual(self._refresh(), [(self._bbans[0], *self._years)])
+        self.assertEqual(self._refresh(), [])
+
+        Id, month, amount, _ = self._card_payment(self._years[1])
+        before = self._months()
+        booking_id = self._db.fetch_id(Table.BookingCode, where=[Att(FD.Booking_code, OVERBOOKING_CODE)])
+        self.assertEqual(TransactionIO().update_booking(
+            values=[Att(FD.Booking_id, booking_id), Att(FD.Booking_code, OVERBOOKING_CODE)],
+            where=[Att(FD.ID, Id)]), 1)
+        self.assertEqual(self._refresh(), [(self._bbans[0], self._years[1], self._years[1])])
+
+        # Only the month of the transaction is changed.
+        after = self._months()
+        key = (self._years[1], month)
+        self.assertEqual(after[key][FD.Overbooking], round(before[key][FD.Overbooking] + amount, 2))
+        self.assertEqual(after[key][FD.Costs], before[key][FD.Costs])
+        self.assertEqual({k: v for k, v in after.items() if k != key}, {k: v for k, v in before.items() if k != key})
+        self._assert_equals_full_calculation()
+
+    def test_TC03_Reenrich(self):
+        from src.BL.Managers.EnrichmentManager import EnrichmentManager
+        from src.DL.IO.SearchTermIO import SearchTermIO
+        from src.DL.Objects.SearchTerm import SearchTerm
+        self._import([0, 1, 2, 3])
+        CM.set_config_item(CF_COL_OVERBOOKING, True, validate=False)
+        self._refresh(1)
+        self._refresh()
+
+        # A search term for 1 card payment of account 1 year 1
+        Id, month, amount, comments = self._card_payment(self._years[0])
+        search_term = comments[comments.index('Transactie:'):].split(' Term:')[0].lower()
+        SearchTermIO().insert(SearchTerm(search_term=search_term, booking_code=OVERBOOKING_CODE))
+        before = self._months()
+        self.assertEqual(EnrichmentManager().reenrich(search_terms=[search_term]), 1)
+        self.assertEqual(self._refresh(), [(self._bbans[0], self._years[0], self._years[0])])
+        self.assertEqual(self._refresh(1), [])
+        self._refresh()
+
+        key = (self._years[0], month)
+        self.assertEqual(self._months()[key][FD.Overbooking], round(before[key][FD.Overbooking] + amount, 2))
+        self._assert_equals_full_calculation()
+
+    def _booked_years(self, account, booking_code) -> list:
+        """ The recalculation of the account after a change of the booking code: [(bban, from year, to year)] """
+        bban = self._bbans[account]
+        return [(bban, *self._db.fetch_query(SQL_BOOKED_YEARS, [bban, booking_code])[0])]
+
+    def _edit_booking_code(self, command, code, **kwargs):
+        """ Edit the booking code like the GUI does, without linked transactions to confirm. """
+        from src.DL.IO.BookingIO import BookingIO
+        from src.DL.Objects.Booking import Booking
+        io = BookingIO()
+        old = io.row_to_obj(self._db.fetch(Table.BookingCode, where=[Att(FD.Booking_code, code)])[0])
+        new = Booking(**{'booking_type': old.booking_type, 'booking_maingroup': old.booking_maingroup,
+                         'booking_subgroup': old.booking_subgroup, 'booking_code': old.booking_code,
+                         'seqno': old.seqno, **kwargs})
+        result = io.edit(mock.Mock(command=command, transaction_count=0, object=new, object_old=old))
+        self.assertTrue(result.OK, result.get_messages_as_message())
+
+    def _bookings(self) -> list:
+        """ The bookings of all transactions, independent of the Ids: [(bban, comments, name, booking code)] """
+        return sorted(tuple(row) for row in self._db.select(
+            Table.TransactionEnriched, names=[FD.Account_bban, FD.Comments, FD.Name, FD.Booking_code]))
+
+    def test_TC04_Update_booking_type(self):
+        from src.VL.Data.Constants.Enums import BoxCommand
+        self._import([0, 1, 2, 3])
+        CM.set_config_item(CF_COL_OVERBOOKING, True, validate=False)
+        self._refresh(1)
+        self._refresh()
+        # The booking code only: the totals are per booking type.
+        self._edit_booking_code(BoxCommand.Update, OVERBOOKING_CODE, booking_code='K5.0.1')
+        self.assertEqual(self._refresh(), [])
+
+        before = self._months()
+        booked = [self._booked_years(account, COFFEE_CODE) for account in (0, 1)]
+        self._edit_booking_code(BoxCommand.Update, COFFEE_CODE, booking_type=OVERBOOKINGS)
+        self.assertEqual(self._refresh(1), booked[1])
+        self.assertEqual(self._refresh(), booked[0])
+        self.assertNotEqual(self._months(), before)
+        self._assert_equals_full_calculation()
+
+    def test_TC05_Delete_booking_code(self):
+        from src.VL.Data.Constants.Enums import BoxCommand
+        self._import([0, 1, 2, 3])
+        self._refresh(1)
+        self._refresh()
+        booked = [self._booked_years(account, COFFEE_CODE) for account in (0, 1)]
+        self._edit_booking_code(BoxCommand.Delete, COFFEE_CODE)
+        self.assertEqual(self._refresh(1), booked[1])
+        self.assertEqual(self._refresh(), booked[0])
+        self._assert_equals_full_calculation()
+
+    def test_TC06_Reenrich_after_delete(self):
+        """ The transactions of a deleted booking code are booked again, like a full import does. """
+        from src.BL.Managers.EnrichmentManager import EnrichmentManager
+        from src.DL.IO.SearchTermIO import SearchTermIO
+        from src.DL.Objects.SearchTerm import SearchTerm
+        from src.VL.Data.Constants.Enums import BoxCommand
+        self._import([0, 1, 2, 3])
+        self._edit_booking_code(BoxCommand.Delete, COFFEE_CODE)
+
+        # The search term of the deleted booking code gets another one.
+        search_term = 'koffie'
+        self.assertTrue(SearchTermIO().update(
+            SearchTerm(search_term=search_term, booking_code='U1.3'), where=[Att(FD.SearchTerm, search_term)]))
+        self.assertGreater(EnrichmentManager().reenrich(search_terms=[search_term]), 0)
+        reenriched = self._bookings()
+        self.assertIn(('Koffiebranderij Boon', 'U1.3'), {(name, code) for _, _, name, code in reenriched})
+
+        self._import([], import_user_csv_files=False)
+        self.assertEqual(self._bookings(), reenriched)
+
+    def test_TC07_Rebuild(self):
+        from src.DL.DBInitialize import DBInitialize
+        self._import([0, 1])
+        self._refresh()
+        self.assertIsNotNone(YMC.get_months(self._bbans[0], self._years[0]))
+        self.assertTrue(DBInitialize().start(build=True).OK)
+        self.assertIsNone(YMC.bban)
+        self.assertIsNone(YMC.get_months(self._bbans[0], self._years[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
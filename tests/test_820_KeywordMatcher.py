@@ -0,0 +1,43 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import random
+import unittest
+
+from src.DL.UserCsvFiles.Cache.KeywordMatcher import KeywordMatcher, LINEAR_SCAN_MAX
+
+
+def linear_scan(keywords, text):
+    return next((keyword for keyword in keywords if keyword in text), None)
+
+
+class KeywordMatcherTestCase(unittest.TestCase):
+
+    def test_TC01_First_keyword_wins(self):
+        keywords = [f'filler{i}' for i in range(LINEAR_SCAN_MAX)] + ['heijn', 'albert heijn', 'albert']
+        matcher = KeywordMatcher(keywords)
+        # List order wins, not the position in the text
+        self.assertEqual(matcher.find('betaling albert heijn 1234'), 'heijn')
+        self.assertEqual(matcher.find('albert'), 'albert')
+        self.assertIsNone(matcher.find('jumbo'))
+        self.assertIsNone(matcher.find(''))
+        self.assertIsNone(KeywordMatcher([]).find('jumbo'))
+
+    def test_TC02_Same_as_linear_scan(self):
+        rnd = random.Random(1)
+        for count in (5, LINEAR_SCAN_MAX * 2):
+            keywords = list(dict.fromkeys(
+                ''.join(rnd.choice('abc ') for _ in range(rnd.randint(1, 5))) for _ in range(count)))
+            matcher = KeywordMatcher(keywords)
+            for _ in range(500):
+                text = ''.join(rnd.choice('abcd ') for _ in range(rnd.randint(0, 30)))
+                self.assertEqual(matcher.find(text), linear_scan(keywords, text), msg=text)
+
+
+if __name__ == '__main__':
+    unittest.main()
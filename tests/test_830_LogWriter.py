@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# 2026-10-18 PHe Logging from several threads
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.GL.BusinessLayer import LogManager
+from src.GL.BusinessLayer.LogWriter import LogWriter, FLUSH_LINES, QUEUE_SIZE
+from src.GL.Enums import LogType
+
+THREADS = 8
+
+
+def read(path) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+class LogWriterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, 'Log.txt')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_TC01_Flush(self):
+        writer = LogWriter(self._path)
+        writer.write('Regel 1\n')
+        writer.flush()
+        self.assertEqual(read(self._path), 'Regel 1\n')
+        writer.close()
+
+    def test_TC02_Close(self):
+        lines = [f'Regel {i}\n' for i in range(QUEUE_SIZE + FLUSH_LINES + 1)]
+        writer = LogWriter(self._path)
+        [writer.write(line) for line in lines]
+        writer.close()
+        self.assertEqual(read(self._path), ''.join(lines))
+
+    def test_TC03_Append(self):
+        with open(self._path, 'w') as f:
+            f.write('Bestaand\n')
+        writer = LogWriter(self._path)
+        writer.write('Nieuw\n')
+        writer.close()
+        # After close the lines are written directly
+        writer.write('Na sluiten\n')
+        self.assertEqual(read(self._path), 'Bestaand\nNieuw\nNa sluiten\n')
+
+    def test_TC04_Threads(self):
+        # More lines than the queue can hold: the threads wait for the writer.
+        lines = {t: [f'Thread {t} regel {i}' for i in range(QUEUE_SIZE // 2)] for t in range(THREADS)}
+        log_manager = LogManager.Singleton.LogManager()
+        log_manager.start_log(self._dir.name + os.sep, log_type=LogType.File)
+        with mock.patch.object(LogManager, 'LogWriter', wraps=LogWriter) as writer_class:
+            threads = [threading.Thread(target=lambda t=t: [log_manager.add_line(line) for line in lines[t]])
+                       for t in range(THREADS)]
+            [t.start() for t in threads]
+            [t.join() for t in threads]
+            log_manager.close()
+        self.assertEqual(writer_class.call_count, 1)
+        written = read(log_manager.log_path).splitlines()
+        self.assertEqual(sorted(written), sorted(line for t_lines in lines.values() for line in t_lines))
+        # Per thread in order
+        for t, t_lines in lines.items():
+            self.assertEqual([line for line in written if line.startswith(f'Thread {t} ')], t_lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
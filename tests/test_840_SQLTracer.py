@@ -0,0 +1,51 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import sqlite3
+import unittest
+
+from src.DL.DBDriver.SQLTracer import SQLTracer, TracingCursor, N_PLUS_1_COUNT
+
+
+class SQLTracerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tracer = SQLTracer()
+        self._cur = TracingCursor(sqlite3.connect(':memory:').cursor(), self._tracer)
+        self._cur.execute('CREATE TABLE T (Id INTEGER, Name TEXT)')
+        self._cur.executemany('INSERT INTO T VALUES (?, ?)', [(i, f'Naam {i}') for i in range(N_PLUS_1_COUNT)])
+
+    def test_TC01_Shape(self):
+        # Literals and parameter lists are replaced
+        self._cur.execute("SELECT * FROM T WHERE Id = 1 AND Name = 'Naam 1'")
+        self._cur.execute("SELECT *  FROM T WHERE Id = 2 AND Name = 'Naam 2'")
+        self._cur.execute('SELECT * FROM T WHERE Id IN (?, ?, ?)', (1, 2, 3))
+        self._cur.flush()
+        items = {item['statement']: item for item in self._tracer.get_items()}
+        self.assertEqual(items['SELECT * FROM T WHERE Id = ? AND Name = ?']['count'], 2)
+        self.assertEqual(items['SELECT * FROM T WHERE Id IN (?...)']['count'], 1)
+        self.assertEqual(items['INSERT INTO T VALUES (?...)']['rows'], N_PLUS_1_COUNT)
+
+    def test_TC02_Rows_and_caller(self):
+        self.assertEqual(len(self._cur.execute('SELECT * FROM T').fetchall()), N_PLUS_1_COUNT)
+        self._cur.flush()
+        item = next(item for item in self._tracer.get_items() if item['statement'] == 'SELECT * FROM T')
+        self.assertEqual(item['rows'], N_PLUS_1_COUNT)
+        self.assertTrue(item['caller'].endswith('test_TC02_Rows_and_caller'))
+
+    def test_TC03_N_plus_1(self):
+        [self._cur.execute('SELECT * FROM T WHERE Id = ?', (i,)).fetchone() for i in range(N_PLUS_1_COUNT)]
+        self._cur.execute('SELECT COUNT(*) FROM T').fetchone()
+        self._cur.flush()
+        items = {item['statement']: item for item in self._tracer.get_items()}
+        self.assertTrue(items['SELECT * FROM T WHERE Id = ?']['n_plus_1'])
+        self.assertFalse(items['SELECT COUNT(*) FROM T']['n_plus_1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
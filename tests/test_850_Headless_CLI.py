@@ -0,0 +1,41 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+# Constants only, no GUI code.
+VL_CONSTANTS = ('src.VL', 'src.VL.Data', 'src.VL.Data.Constants')
+
+
+def loaded_modules(statement) -> list:
+    """ Modules loaded by a statement in a fresh interpreter. """
+    process = subprocess.run(
+        [sys.executable, '-c', f'import sys\n{statement}\nprint("\\n".join(sys.modules))'],
+        cwd=ROOT_DIR, capture_output=True, text=True)
+    if process.returncode != 0:
+        raise AssertionError(process.stderr)
+    return process.stdout.splitlines()
+
+
+def gui_modules(modules) -> list:
+    return [m for m in modules if m == 'PySimpleGUI' or (
+            m.startswith('src.VL') and m not in VL_CONSTANTS and not m.startswith('src.VL.Data.Constants.'))]
+
+
+class HeadlessCLITestCase(unittest.TestCase):
+
+    def test_TC01_CLI_imports_no_GUI(self):
+        self.assertEqual(gui_modules(loaded_modules('import src.pmc')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
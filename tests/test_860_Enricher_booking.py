@@ -0,0 +1,51 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import unittest
+
+from src.BL.Enricher import Enricher
+from src.DL.UserCsvFiles.Cache.KeywordMatcher import KeywordMatcher
+from src.VL.Data.Constants.Const import OTHER_COSTS, OTHER_REVENUES
+
+TE_KEY = 'NL00BANK0123456789|20240101|NL00BANK0000000001|Boodschappen'
+SEARCH_TERMS = {'albert heijn': 'U1.4', 'boodschappen': 'U1.5'}
+BOOKING_IDS = {'U1.4': 14, 'U1.5': 15, 'U3.1': 31, 'U9.9': 99, 'I9.9': 199, 'U0.1': 1}
+
+
+def get_enricher(threshold_to_other=0, user_booking_codes=None) -> Enricher:
+    return Enricher(
+        amounts_are_signed=False, threshold_to_other=threshold_to_other, bban_per_account_number={},
+        counter_account_ids={}, booking_ids=BOOKING_IDS,
+        protected_booking_codes={OTHER_COSTS: 'U9.9', OTHER_REVENUES: 'I9.9'},
+        user_booking_codes=user_booking_codes or {}, user_remarks={},
+        search_terms=SEARCH_TERMS, search_term_matcher=KeywordMatcher(SEARCH_TERMS),
+        booking_code_matcher=KeywordMatcher(['U3.1']))
+
+
+class EnricherBookingTestCase(unittest.TestCase):
+
+    def test_TC01_Priority(self):
+        enricher = get_enricher(user_booking_codes={TE_KEY: 'U0.1'})
+        # UserMutations > SearchTerm (name before comments) > BookingCode
+        self.assertEqual(enricher.get_booking(TE_KEY, 'Albert Heijn', 'Boodschappen', 10.0, True, 'x'), ('U0.1', 1))
+        self.assertEqual(enricher.get_booking('', 'Albert Heijn', 'Boodschappen', 10.0, True, 'x'), ('U1.4', 14))
+        self.assertEqual(enricher.get_booking('', 'Jumbo', 'Boodschappen U3.1', 10.0, True, 'x'), ('U1.5', 15))
+        self.assertEqual(enricher.get_booking('', 'Jumbo', 'Factuur U3.1', 10.0, True, 'x'), ('U3.1', 31))
+
+    def test_TC02_Protected(self):
+        enricher = get_enricher(threshold_to_other=5)
+        # Below the threshold
+        self.assertEqual(enricher.get_booking('', 'Albert Heijn', '', 4.99, True, 'x'), ('U9.9', 99))
+        self.assertEqual(enricher.get_booking('', 'Albert Heijn', '', 4.99, False, 'x'), ('I9.9', 199))
+        # No booking and no counter account
+        self.assertEqual(enricher.get_booking('', 'Jumbo', '', 10.0, True, ''), ('U9.9', 99))
+        self.assertEqual(enricher.get_booking('', 'Jumbo', '', 10.0, True, 'x'), ('', 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import tempfile
+import unittest
+
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.AttType import AttType
+from src.DL.DBDriver.Audit import AUDIT_NONE
+from src.DL.DBDriver.DBDriver import DBDriver
+from src.DL.DBDriver.SQLOperator import SQLOperator
+
+TABLE = 'Paging'
+ROW_COUNT = 95
+PAGE = 10
+
+
+class KeysetPaginationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._db = DBDriver(os.path.join(self._dir.name, 'Paging.db'))
+        self._db.create_table(TABLE, table_def={1: Att('Datum', type=AttType.Int), 2: Att('Naam')}, audit=AUDIT_NONE)
+        # Several rows per date
+        self._db.insert_many(TABLE, [[20240100 + i // 4, f'Naam {i}'] for i in range(ROW_COUNT)])
+        self._expected = sorted(self._db.fetch(TABLE), key=lambda row: (row[1], row[0]), reverse=True)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _all_pages(self, **kwargs) -> list:
+        rows, page, after = [], [None], None
+        while page:
+            page = self._db.fetch_page(TABLE, ['Datum', 'Id'], after=after, limit=PAGE, **kwargs)
+            self.assertLessEqual(len(page), PAGE)
+            if page:
+                after = [page[-1][1], page[-1][0]]
+            rows.extend(page)
+        return rows
+
+    def test_TC01_Pages_in_key_order(self):
+        self.assertEqual(self._all_pages(), self._expected)
+
+    def test_TC02_Pages_with_where(self):
+        where = [Att('Datum', 20240110, type=AttType.Int, relation=SQLOperator().LT)]
+        self.assertEqual(self._all_pages(where=where), [row for row in self._expected if row[1] < 20240110])
+
+    def test_TC03_Batches(self):
+        batches = list(self._db.fetch_batches(TABLE, batch_size=PAGE))
+        self.assertEqual([len(batch) for batch in batches], [PAGE] * (ROW_COUNT // PAGE) + [ROW_COUNT % PAGE])
+        # Other statements in between
+        rows = []
+        for batch in self._db.fetch_batches(TABLE, batch_size=PAGE):
+            self.assertEqual(self._db.count(TABLE), ROW_COUNT)
+            rows.extend(batch)
+        self.assertEqual(rows, self._db.fetch(TABLE))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.AttType import AttType
+from src.DL.DBDriver.Audit import AUDIT_NONE
+from src.DL.DBDriver.DBDriver import DBDriver
+from src.DL.DBDriver.DBException import DBException
+
+TABLE = 'Concurrent'
+READERS = 4
+INITIAL_COUNT = 1000
+CHUNK_COUNT = 20
+CHUNK_SIZE = 500
+
+
+def rows(start, count) -> list:
+    return [[start + i, f'Naam {start + i}'] for i in range(count)]
+
+
+class ConcurrentReadersTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._db = DBDriver(os.path.join(self._dir.name, 'Concurrent.db'))
+        self._db.create_table(TABLE, table_def={1: Att('Nummer', type=AttType.Int), 2: Att('Naam')}, audit=AUDIT_NONE)
+        self._db.insert_many(TABLE, rows(0, INITIAL_COUNT))
+
+    def tearDown(self):
+        self._db.close_readers()
+        self._dir.cleanup()
+
+    def _run_readers(self, read) -> tuple:
+        """ Start the readers, that call read() until stopped. Return (stop, threads, {thread: [results]}, errors) """
+        stop, results, errors = threading.Event(), {}, []
+
+        def reader():
+            name = threading.current_thread().name
+            try:
+                while not stop.is_set():
+                    results.setdefault(name, []).append(read())
+            except Exception as e:
+                errors.append(e)
+            finally:
+                self._db.close_reader()
+
+        threads = [threading.Thread(target=reader, name=f'Reader {i}') for i in range(READERS)]
+        [t.start() for t in threads]
+        return stop, threads, results, errors
+
+    def test_TC01_Read_during_import(self):
+        final_count = INITIAL_COUNT + CHUNK_COUNT * CHUNK_SIZE
+
+        def read():
+            # 1 statement is 1 snapshot: a reader never sees a part of the import.
+            count, last = self._db.fetch_query(f'SELECT COUNT(*), MAX(Nummer) FROM {TABLE}')[0]
+            page = self._db.fetch_page(TABLE, ['Nummer'], limit=10)
+            self.assertEqual(last, count - 1)
+            self.assertIn(page[0][1], (INITIAL_COUNT - 1, final_count - 1))
+            return count
+
+        stop, threads, results, errors = self._run_readers(read)
+        # Import, in 1 transaction like the ImportManager.
+        with self._db.bulk_load([TABLE]):
+            for i in range(CHUNK_COUNT):
+                self._db.insert_many(TABLE, rows(INITIAL_COUNT + i * CHUNK_SIZE, CHUNK_SIZE))
+        # The readers see the import once it is committed.
+        counts = set()
+        while final_count not in counts and not errors:
+            time.sleep(0.01)
+            counts = {count for thread_counts in list(results.values()) for count in thread_counts}
+        stop.set()
+        [t.join() for t in threads]
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), READERS)
+        self.assertEqual(counts - {INITIAL_COUNT, final_count}, set())
+        self.assertEqual(self._db.count(TABLE), final_count)
+
+    def test_TC02_Readers_do_not_write(self):
+        errors = []
+
+        def write():
+            try:
+                self._db.insert(TABLE, [1, 'Naam'])
+            except DBException as e:
+                errors.append(e)
+            finally:
+                self._db.close_reader()
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        thread.join()
+        self.assertEqual(len(errors), 1)
+        self.assertIn('readonly', str(errors[0]))
+        self.assertEqual(self._db.count(TABLE), INITIAL_COUNT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/python
+# ---------------------------------------------------------------------------------------------------------------------
+# Author      : Peter Heijligers
+#
+# Date       Ini Description
+# ---------- --- ------------------------------------------------------------------------------------------------------
+# 2026-10-18 PHe First creation
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import tempfile
+import unittest
+
+from src.DL.DBDriver.Att import Att
+from src.DL.DBDriver.AttType import AttType
+from src.DL.DBDriver.Audit import AUDIT_NONE
+from src.DL.DBDriver.Const import FALSE, TRUE
+from src.DL.DBDriver.DBDriver import DBDriver
+from src.DL.DBDriver.SQLOperator import SQLOperator
+
+TABLE = 'Statements'
+TABLE_DELETED = 'StatementsDeleted'
+TABLE_DEF = {1: Att('Nummer', type=AttType.Int), 2: Att('Naam'), 3: Att('Actief', type=AttType.Bool)}
+QUOTED = "O'Brien 100% \"zeker\""
+STORED = 'O_Brien 100% "zeker"'  # Quotes are sanitized in text columns
+
+
+class SQLStatementsTestCase(unittest.TestCase):
+    """ The statements have a "?" per value. The values are bound, also quotes and "%". """
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._db = DBDriver(os.path.join(self._dir.name, 'Statements.db'))
+        self._db.create_table(TABLE, table_def=TABLE_DEF, audit=AUDIT_NONE)
+        self._db.insert_many(TABLE, [[1, 'Jan', True], [2, QUOTED, False], [3, '50%', True]])
+        self._db._cache_table(TABLE)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _where(self, *atts, **kwargs) -> tuple:
+        return self._db._get_where_clause(where=list(atts), **kwargs)
+
+    def test_TC01_Where_plain(self):
+        self.assertEqual(self._where(Att('Naam', QUOTED)), (' WHERE Naam=?', [QUOTED]))
+        self.assertEqual(self._where(Att('Nummer', 2, type=AttType.Int), Att('Actief', False, type=AttType.Bool)),
+                         (' WHERE Nummer=? AND Actief=?', [2, FALSE]))
+        # No value
+        self.assertEqual(self._where(Att('Nummer', None, type=AttType.Int)), (' WHERE Nummer=?', [0]))
+        self.assertEqual(self._db.fetch_value(TABLE, name='Nummer', where=[Att('Naam', STORED)]), 2)
+
+    def test_TC02_Where_relation(self):
+        self.assertEqual(self._where(Att('Nummer', 1, type=AttType.Int, relation=SQLOperator().GT)),
+                         (' WHERE Nummer>?', [1]))
+        # "%" is a wildcard of LIKE, and is not escaped.
+        self.assertEqual(self._where(Att('Naam', '%100%', relation=SQLOperator().LIKE)),
+                         (' WHERE Naam LIKE ?', ['%100%']))
+        rows = self._db.select(TABLE, name='Nummer', where=[Att('Naam', '%0%', relation=SQLOperator().LIKE)])
+        self.assertEqual(sorted(rows), [2, 3])
+
+    def test_TC03_Where_list_is_in(self):
+        self.assertEqual(self._where(Att('Naam', ['Jan', QUOTED])), (' WHERE Naam IN (?, ?)', ['Jan', QUOTED]))
+        self.assertEqual(self._where(Att('Naam', ('Jan',)), Att('Actief', True, type=AttType.Bool)),
+                         (' WHERE Naam IN (?) AND Actief=?', ['Jan', TRUE]))
+        rows = self._db.select(TABLE, name='Nummer', where=[Att('Naam', ['Jan', STORED, '50%'])])
+        self.assertEqual(sorted(rows), [1, 2, 3])
+
+    def test_TC04_Where_match(self):
+        clause, params = self._db._get_where_clause(match=['Statements_fts', '"brien"'], where=[Att('Naam', QUOTED)])
+        self.assertEqual(clause, ' WHERE Id IN (SELECT rowid FROM Statements_fts WHERE Statements_fts MATCH ?) '
+                                 'AND Naam=?')
+        self.assertEqual(params, ['"brien"', QUOTED])
+
+    def test_TC05_Where_empty(self):
+        self.assertEqual(self._db._get_where_clause(), ('', []))
+        self.assertEqual(self._where(), ('', []))
+
+    def test_TC06_Where_deleted(self):
+        table_def = {**TABLE_DEF, 4: Att('Deleted', type=AttType.Bool)}
+        self._db.create_table(TABLE_DELETED, table_def=table_def, audit=AUDIT_NONE)
+        self._db._cache_table(TABLE_DELETED)
+        self.assertEqual(self._where(Att('Naam', QUOTED)), (' WHERE Deleted=? AND Naam=?', [FALSE, QUOTED]))
+        self.assertEqual(self._where(Att('Naam', QUOTED), include_deleted=True), (' WHERE Naam=?', [QUOTED]))
+
+    def test_TC07_Insert(self):
+        sql, params = self._db._get_insert_stmt(TABLE, [4, QUOTED, True])
+        self.assertEqual(sql, f'INSERT INTO {TABLE} (Nummer, Naam, Actief) VALUES(?, ?, ?)')
+        self.assertEqual(params, [4, STORED, TRUE])
+        # many: the values are bound by executemany.
+        sql, params = self._db._get_insert_stmt(TABLE, ['?', '?', '?'], many=True)
+        self.assertEqual(sql, f'INSERT INTO {TABLE} (Nummer, Naam, Actief) VALUES(?, ?, ?)')
+        self.assertEqual(params, [])
+
+    def test_TC08_Update(self):
+        sql, params = self._db._get_update_stmt(
+            TABLE, [Att('Naam', '100%'), Att('Nummer', 5, type=AttType.Int)], where=[Att('Naam', QUOTED)])
+        self.assertEqual(sql, f'UPDATE {TABLE} SET Naam=?, Nummer=? WHERE Naam=?')
+        self.assertEqual(params, ['100%', '5', QUOTED])
+        # No where: all rows
+        sql, params = self._db._get_update_stmt(TABLE, [Att('Naam', QUOTED)])
+        self.assertEqual((sql, params), (f'UPDATE {TABLE} SET Naam=?', [STORED]))
+
+        self._db.update(TABLE, [Att('Naam', '100%')], where=[Att('Naam', STORED)])
+        self.assertEqual(self._db.fetch_value(TABLE, name='Nummer', where=[Att('Naam', '100%')]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()